@@ -0,0 +1,291 @@
+"""
+Micro-benchmark for the price/volume factors behind get_alpha_factors.
+
+Compares the previous implementation of _calculate_price_volume_factors
+(Aroon Up/Down recomputed for every bar of the history with a Python loop
+over 21-row slices, returns recomputed per factor) with the trailing-window
+NumPy kernels now in alpha_factors_tools. Runs on 10 years of synthetic
+daily bars, so no network access is needed, and checks that both produce
+the same factors.
+
+Also times the cross-sectional panel on a synthetic universe of
+UNIVERSE_SIZE tickers against running the per-ticker factors once per name,
+and the one-pass factor history against evaluating a year of backtest dates
+one at a time.
+"""
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.agents.utils.alpha_factor_panel import (
+    compute_factor_history,
+    compute_factor_panel,
+    cross_sectional_ranks,
+    cross_sectional_zscores,
+    factor_row,
+    panel_from_frames,
+)
+from tradingagents.agents.utils.alpha_factors_tools import _calculate_price_volume_factors
+
+CURR_DATE = "2024-11-01"
+REPEATS = 20
+UNIVERSE_SIZE = 500
+
+
+def make_bars(years=10, seed=42):
+    dates = pd.bdate_range(end=CURR_DATE, periods=252 * years, name="Date")
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates))))
+    return pd.DataFrame(
+        {
+            "Open": close * 0.995,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 5_000_000, len(dates)).astype(float),
+        },
+        index=dates,
+    )
+
+
+def legacy_price_volume_factors(df: pd.DataFrame, curr_date: str) -> dict:
+    """The per-bar loop implementation this benchmark compares against."""
+    factors = {}
+    
+    if len(df) < 20:
+        return factors
+    
+    # Use Close price (or Adj Close if available)
+    price_col = 'Adj Close' if 'Adj Close' in df.columns else 'Close'
+    volume_col = 'Volume' if 'Volume' in df.columns else None
+    
+    prices = df[price_col].dropna()
+    if len(prices) < 20:
+        return factors
+    
+    current_price = prices.iloc[-1]
+    current_date = prices.index[-1]
+    
+    # 1. Past 1-Month Return
+    if len(prices) >= 20:
+        month_ago_price = prices.iloc[-20] if len(prices) >= 20 else prices.iloc[0]
+        factors['past_1m_return'] = (current_price / month_ago_price - 1) * 100
+    
+    # 2. Past 1-Week Return
+    if len(prices) >= 5:
+        week_ago_price = prices.iloc[-5]
+        factors['past_1w_return'] = (current_price / week_ago_price - 1) * 100
+    
+    # 3. Past 3-Month Return
+    if len(prices) >= 60:
+        quarter_ago_price = prices.iloc[-60]
+        factors['past_3m_return'] = (current_price / quarter_ago_price - 1) * 100
+    
+    # 4. Past 6-Month Return
+    if len(prices) >= 120:
+        half_year_price = prices.iloc[-120]
+        factors['past_6m_return'] = (current_price / half_year_price - 1) * 100
+    
+    # 5. Past 12-Month Return
+    if len(prices) >= 252:
+        year_ago_price = prices.iloc[-252]
+        factors['past_12m_return'] = (current_price / year_ago_price - 1) * 100
+    
+    # 6. Cumulative Return from Month -12 to Month -1 (excluding most recent month)
+    if len(prices) >= 252:
+        month_12_ago = prices.iloc[-252]
+        month_1_ago = prices.iloc[-20] if len(prices) >= 20 else prices.iloc[-1]
+        factors['momentum_12m_to_1m'] = (month_1_ago / month_12_ago - 1) * 100
+    
+    # 7. Past 1-Month High Price / Current Price
+    if len(prices) >= 20:
+        month_high = prices.iloc[-20:].max()
+        factors['high_to_current_ratio'] = month_high / current_price
+    
+    # 8. Average Turnover Rate over Past 20 Days
+    if volume_col and volume_col in df.columns:
+        volumes = df[volume_col].dropna()
+        if len(volumes) >= 20:
+            recent_volumes = volumes.iloc[-20:]
+            # Estimate shares outstanding (simplified - using average volume as proxy)
+            avg_volume = recent_volumes.mean()
+            # Turnover rate approximation
+            factors['avg_turnover_20d'] = avg_volume / 1000000  # Normalized
+    
+    # 9. Price-Volume Correlation
+    if volume_col and volume_col in df.columns:
+        if len(df) >= 20:
+            recent_df = df.iloc[-20:]
+            price_changes = recent_df[price_col].pct_change().dropna()
+            volume_changes = recent_df[volume_col].pct_change().dropna()
+            if len(price_changes) > 1 and len(volume_changes) > 1:
+                common_idx = price_changes.index.intersection(volume_changes.index)
+                if len(common_idx) > 1:
+                    factors['price_volume_correlation'] = price_changes.loc[common_idx].corr(
+                        volume_changes.loc[common_idx]
+                    )
+    
+    # 10. Aroon Up Indicator
+    if len(prices) >= 20:
+        period = 20
+        aroon_up = []
+        for i in range(period, len(prices)):
+            period_prices = prices.iloc[i-period:i+1]
+            highest_idx = period_prices.idxmax()
+            days_since_high = (prices.index[i] - highest_idx).days
+            aroon_value = ((period - days_since_high) / period) * 100
+            aroon_up.append(aroon_value)
+        if aroon_up:
+            factors['aroon_up'] = aroon_up[-1]
+    
+    # 11. Aroon Down Indicator
+    if len(prices) >= 20:
+        period = 20
+        aroon_down = []
+        for i in range(period, len(prices)):
+            period_prices = prices.iloc[i-period:i+1]
+            lowest_idx = period_prices.idxmin()
+            days_since_low = (prices.index[i] - lowest_idx).days
+            aroon_value = ((period - days_since_low) / period) * 100
+            aroon_down.append(aroon_value)
+        if aroon_down:
+            factors['aroon_down'] = aroon_down[-1]
+            factors['aroon_diff'] = factors.get('aroon_up', 0) - factors.get('aroon_down', 0)
+    
+    # 12. 20-Day Price Volatility
+    if len(prices) >= 20:
+        recent_returns = prices.iloc[-20:].pct_change().dropna()
+        factors['volatility_20d'] = recent_returns.std() * np.sqrt(252) * 100  # Annualized
+    
+    # 13. 20-Day Average True Range (ATR)
+    if 'High' in df.columns and 'Low' in df.columns:
+        if len(df) >= 20:
+            recent_df = df.iloc[-20:]
+            high_low = recent_df['High'] - recent_df['Low']
+            high_close = abs(recent_df['High'] - recent_df[price_col].shift(1))
+            low_close = abs(recent_df['Low'] - recent_df[price_col].shift(1))
+            true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+            factors['atr_20d'] = true_range.mean()
+            if current_price > 0:
+                factors['atr_normalized'] = factors['atr_20d'] / current_price * 100
+    
+    # 14. Deviation from 20-Day Moving Average
+    if len(prices) >= 20:
+        ma_20 = prices.iloc[-20:].mean()
+        factors['deviation_from_ma20'] = ((current_price - ma_20) / ma_20) * 100
+    
+    # 15. Deviation from 50-Day Moving Average
+    if len(prices) >= 50:
+        ma_50 = prices.iloc[-50:].mean()
+        factors['deviation_from_ma50'] = ((current_price - ma_50) / ma_50) * 100
+    
+    # 16. Deviation from 200-Day Moving Average
+    if len(prices) >= 200:
+        ma_200 = prices.iloc[-200:].mean()
+        factors['deviation_from_ma200'] = ((current_price - ma_200) / ma_200) * 100
+    
+    # 17. Multi-MA Alignment
+    if len(prices) >= 200:
+        ma_5 = prices.iloc[-5:].mean() if len(prices) >= 5 else current_price
+        ma_20 = prices.iloc[-20:].mean() if len(prices) >= 20 else current_price
+        ma_50 = prices.iloc[-50:].mean() if len(prices) >= 50 else current_price
+        ma_200 = prices.iloc[-200:].mean()
+        factors['ma_alignment_score'] = 1 if (ma_5 > ma_20 > ma_50 > ma_200) else -1 if (ma_5 < ma_20 < ma_50 < ma_200) else 0
+    
+    # 18. Ratio of Up Days to Down Days
+    if len(prices) >= 20:
+        recent_returns = prices.iloc[-20:].pct_change().dropna()
+        up_days = (recent_returns > 0).sum()
+        down_days = (recent_returns < 0).sum()
+        factors['up_down_ratio'] = up_days / down_days if down_days > 0 else up_days
+    
+    # 19. Ratio of Cumulative Gains to Cumulative Losses
+    if len(prices) >= 20:
+        recent_returns = prices.iloc[-20:].pct_change().dropna()
+        gains = recent_returns[recent_returns > 0].sum()
+        losses = abs(recent_returns[recent_returns < 0].sum())
+        factors['gains_losses_ratio'] = gains / losses if losses > 0 else gains
+    
+    return factors
+
+
+def best_of(func, *args):
+    timings = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start_time)
+    return min(timings), result
+
+
+def same_factors(legacy, new):
+    if list(legacy) != list(new):
+        return False
+    return all(
+        math.isclose(float(legacy[key]), float(new[key]), rel_tol=1e-9, abs_tol=1e-12)
+        for key in legacy
+    )
+
+
+def screen(frames, benchmark):
+    factors = compute_factor_panel(panel_from_frames(frames), benchmark)
+    return factors, cross_sectional_ranks(factors), cross_sectional_zscores(factors)
+
+
+def price_volume_factors(df, curr_date):
+    return _calculate_price_volume_factors(factor_row(df), curr_date)
+
+
+def per_date(df, dates, benchmark):
+    return {date: factor_row(df.loc[:date].iloc[-253:], benchmark) for date in dates}
+
+
+def per_ticker(frames, benchmark):
+    return {ticker: factor_row(df, benchmark) for ticker, df in frames.items()}
+
+
+if __name__ == "__main__":
+    df = make_bars()
+
+    print(f"Price/volume factors over {len(df)} daily bars:")
+    legacy_time, legacy_result = best_of(legacy_price_volume_factors, df, CURR_DATE)
+    new_time, new_result = best_of(price_volume_factors, df, CURR_DATE)
+    assert same_factors(legacy_result, new_result), "vectorized factors differ from legacy factors"
+    print(
+        f"  legacy {legacy_time * 1000:8.2f} ms | vectorized {new_time * 1000:6.2f} ms | "
+        f"speedup {legacy_time / new_time:6.1f}x"
+    )
+
+    # About 14 months of bars, as get_alpha_factors loads by default
+    universe = {f"T{i:03d}": make_bars(seed=i).iloc[-300:] for i in range(UNIVERSE_SIZE)}
+    # Synthetic stand-in for the benchmark series, so beta is part of the work
+    benchmark = make_bars(seed=UNIVERSE_SIZE)["Close"]
+    print(f"All price/volume, microstructure and technical factors for {UNIVERSE_SIZE} tickers:")
+    loop_start = time.perf_counter()
+    per_ticker(universe, benchmark)
+    loop_time = time.perf_counter() - loop_start
+    panel_start = time.perf_counter()
+    screen(universe, benchmark)
+    panel_time = time.perf_counter() - panel_start
+    print(
+        f"  per-ticker {loop_time:8.2f} s  | panel      {panel_time:6.2f} s  | "
+        f"speedup {loop_time / panel_time:6.1f}x"
+    )
+
+    backtest_dates = df.index[-252:]
+    print(f"Factor rows for {len(backtest_dates)} backtest dates:")
+    loop_start = time.perf_counter()
+    expected = per_date(df, backtest_dates, benchmark)
+    loop_time = time.perf_counter() - loop_start
+    history_start = time.perf_counter()
+    history = compute_factor_history(df, backtest_dates[0].strftime("%Y-%m-%d"), benchmark)
+    history_time = time.perf_counter() - history_start
+    assert all(
+        np.allclose(history.loc[date], row, rtol=1e-9, equal_nan=True) for date, row in expected.items()
+    ), "factor history differs from per-date factors"
+    print(
+        f"  per-date   {loop_time * 1000:8.2f} ms | history    {history_time * 1000:6.2f} ms | "
+        f"speedup {loop_time / history_time:6.1f}x"
+    )
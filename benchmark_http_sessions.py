@@ -0,0 +1,75 @@
+"""
+Benchmark for the pooled HTTP sessions in tradingagents.dataflows.http_pool.
+
+Starts a local keep-alive HTTP server as a stand-in for a vendor endpoint and
+compares per-call latency of bare requests.get (a new connection per call,
+as the dataflows used to do) with the shared pooled session. The stand-in is
+plain HTTP, so the gap shown here is TCP setup only; against real HTTPS
+endpoints the saved TLS handshake widens it considerably.
+"""
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from tradingagents.dataflows.http_pool import close_all, get_session
+
+CALLS = 300
+PAYLOAD = b"timestamp,open,high,low,close,volume\n2024-11-01,1,2,0.5,1.5,1000\n"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def time_calls(get, url):
+    latencies = []
+    for _ in range(CALLS):
+        start_time = time.perf_counter()
+        response = get(url, params={"function": "TIME_SERIES_DAILY", "symbol": "AAPL"})
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start_time)
+    return latencies
+
+
+def describe(label, latencies):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"  {label:<16} mean {statistics.mean(latencies) * 1000:6.3f} ms | "
+        f"median {statistics.median(latencies) * 1000:6.3f} ms | p95 {p95 * 1000:6.3f} ms"
+    )
+    return statistics.mean(latencies)
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/query"
+
+    try:
+        session = get_session("benchmark")
+        # Warm up both paths once
+        requests.get(url)
+        session.get(url)
+
+        print(f"Per-call latency over {CALLS} requests to a local stand-in server:")
+        bare = describe("bare requests.get", time_calls(requests.get, url))
+        pooled = describe("pooled session", time_calls(session.get, url))
+        print(f"  speedup: {bare / pooled:.1f}x")
+    finally:
+        close_all()
+        server.shutdown()
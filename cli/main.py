@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 import datetime
 import typer
 from pathlib import Path
@@ -26,6 +26,8 @@ from rich.rule import Rule
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.dataflows.ohlcv_store import PREFETCH_BATCH_SIZE, prefetch as prefetch_ohlcv
+from tradingagents.agents.utils.alpha_factor_panel import PANEL_FACTORS, screen_universe
 from cli.models import AnalystType
 from cli.utils import *
 
@@ -1105,5 +1107,103 @@ def analyze():
     run_analysis()
 
 
+def _read_tickers(tickers: Optional[List[str]], tickers_file: Optional[Path]) -> List[str]:
+    """Tickers from the arguments plus a file of one per line (# starts a comment)."""
+    symbols = list(tickers or [])
+    if tickers_file is not None:
+        for line in tickers_file.read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                symbols.append(line)
+    if not symbols:
+        console.print("[red]No tickers given. Pass symbols or --file.[/red]")
+        raise typer.Exit(code=1)
+    return symbols
+
+
+@app.command()
+def prefetch(
+    tickers: Optional[List[str]] = typer.Argument(None, help="Ticker symbols to prefetch"),
+    tickers_file: Optional[Path] = typer.Option(
+        None, "--file", "-f", help="File with one ticker per line (# starts a comment)"
+    ),
+    start_date: Optional[str] = typer.Option(None, "--start", help="Start date, YYYY-MM-DD"),
+    end_date: Optional[str] = typer.Option(None, "--end", help="End date, YYYY-MM-DD"),
+    batch_size: int = typer.Option(PREFETCH_BATCH_SIZE, "--batch-size", help="Tickers per download request"),
+):
+    """Download daily price history for a ticker universe into the local OHLCV store."""
+    symbols = _read_tickers(tickers, tickers_file)
+
+    with console.status(f"Prefetching {len(symbols)} tickers..."):
+        summary = prefetch_ohlcv(symbols, start_date, end_date, batch_size=batch_size)
+
+    table = Table(box=box.SIMPLE_HEAD)
+    table.add_column("Status", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Tickers")
+    for status, style in (("fetched", "green"), ("skipped", "dim"), ("failed", "red")):
+        names = summary[status]
+        shown = ", ".join(names[:20]) + (" ..." if len(names) > 20 else "")
+        table.add_row(f"[{style}]{status}[/{style}]", str(len(names)), shown)
+    console.print(table)
+    if summary["failed"]:
+        raise typer.Exit(code=1)
+
+
+SCREEN_DEFAULT_FACTORS = [
+    "past_1m_return", "past_12m_return", "momentum_12m_to_1m", "volatility_20d",
+    "beta", "idiosyncratic_volatility", "rsi",
+]
+
+
+@app.command()
+def screen(
+    tickers: Optional[List[str]] = typer.Argument(None, help="Ticker symbols to screen"),
+    tickers_file: Optional[Path] = typer.Option(
+        None, "--file", "-f", help="File with one ticker per line (# starts a comment)"
+    ),
+    date: Optional[str] = typer.Option(None, "--date", help="Screening date, YYYY-MM-DD (default: today)"),
+    look_back_days: int = typer.Option(252, "--look-back", help="Trading days of history to load"),
+    factors: Optional[List[str]] = typer.Option(
+        None, "--factor", help="Factor to show (repeatable; default: a momentum/risk selection)"
+    ),
+    sort_by: str = typer.Option("past_12m_return", "--sort", help="Factor to rank the tickers by"),
+    zscores: bool = typer.Option(False, "--zscores", help="Show cross-sectional z-scores instead of values"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write factors, ranks and z-scores to CSV"),
+):
+    """Compute alpha factors for a ticker universe and rank them cross-sectionally."""
+    symbols = _read_tickers(tickers, tickers_file)
+    shown = factors or SCREEN_DEFAULT_FACTORS
+    unknown = [name for name in [*shown, sort_by] if name not in PANEL_FACTORS]
+    if unknown:
+        console.print(f"[red]Unknown factor(s): {', '.join(unknown)}. Choose from: {', '.join(PANEL_FACTORS)}[/red]")
+        raise typer.Exit(code=1)
+    date = date or datetime.date.today().strftime("%Y-%m-%d")
+
+    with console.status(f"Screening {len(symbols)} tickers on {date}..."):
+        result = screen_universe(symbols, date, look_back_days)
+
+    values = result["zscores"] if zscores else result["factors"]
+    ranked = result["ranks"].sort_values(sort_by, ascending=False, na_position="last")
+    table = Table(box=box.SIMPLE_HEAD, title=f"Alpha factor screen on {date}")
+    table.add_column("Ticker", style="cyan")
+    table.add_column(f"{sort_by} rank", justify="right")
+    for name in shown:
+        table.add_column(name, justify="right")
+    for ticker in ranked.index:
+        rank = ranked.at[ticker, sort_by]
+        cells = ["-" if value != value else f"{value:.3g}" for value in values.loc[ticker, shown]]
+        table.add_row(ticker, "-" if rank != rank else f"{rank * 100:.0f}%", *cells)
+    console.print(table)
+
+    if output is not None:
+        combined = result["factors"].join(result["ranks"], rsuffix="_rank").join(result["zscores"], rsuffix="_zscore")
+        combined.to_csv(output)
+        console.print(f"Wrote {output}")
+    if result["failed"]:
+        console.print(f"[red]No price data for: {', '.join(result['failed'])}[/red]")
+        raise typer.Exit(code=1)
+
+
 if __name__ == "__main__":
     app()
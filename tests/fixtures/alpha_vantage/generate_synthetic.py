@@ -0,0 +1,134 @@
+"""
+Write the SYNTH reference fixtures in Alpha Vantage's CSV layout.
+
+The bars are a seeded random walk. The expected indicator values come from
+plain loop implementations of the TA-Lib definitions Alpha Vantage
+documents, written independently of computed_indicators:
+
+- EMA is seeded with the simple average of its first n inputs.
+- RSI and ATR use Wilder smoothing; the true range starts on the 2nd bar.
+- The MACD fast EMA is seeded on the bar where the slow EMA starts.
+- BBANDS uses the 20-bar SMA plus or minus 2 population standard deviations.
+
+Values are rounded to 4 decimals and written newest first, as Alpha Vantage
+returns them. Responses captured by verify_computed_indicators.py for real
+symbols go next to SYNTH in the same layout.
+
+    python tests/fixtures/alpha_vantage/generate_synthetic.py
+"""
+import csv
+import math
+import os
+import random
+from datetime import date, timedelta
+
+SYMBOL = "SYNTH"
+BARS = 400
+SEED = 7
+
+
+def make_bars():
+    rng = random.Random(SEED)
+    day, close, bars = date(2022, 1, 3), 100.0, []
+    while len(bars) < BARS:
+        if day.weekday() < 5:
+            open_ = close * (1 + rng.gauss(0, 0.005))
+            close = close * math.exp(rng.gauss(0, 0.015))
+            high = max(open_, close) * (1 + abs(rng.gauss(0, 0.006)))
+            low = min(open_, close) * (1 - abs(rng.gauss(0, 0.006)))
+            volume = rng.randint(1_000_000, 9_000_000)
+            bars.append((day, round(open_, 4), round(high, 4), round(low, 4), round(close, 4), volume))
+        day += timedelta(days=1)
+    return bars
+
+
+def sma(values, n):
+    return [None if i < n - 1 else sum(values[i - n + 1:i + 1]) / n for i in range(len(values))]
+
+
+def ema(values, n, seed_end=None):
+    """EMA over values (None before the input starts), seeded with an SMA ending at seed_end."""
+    first = next(i for i, v in enumerate(values) if v is not None)
+    seed_end = first + n - 1 if seed_end is None else seed_end
+    out = [None] * len(values)
+    out[seed_end] = sum(values[seed_end - n + 1:seed_end + 1]) / n
+    k = 2 / (n + 1)
+    for i in range(seed_end + 1, len(values)):
+        out[i] = values[i] * k + out[i - 1] * (1 - k)
+    return out
+
+
+def wilder(values, n, start):
+    """Wilder average of values[start:], seeded with the mean of its first n."""
+    out = [None] * len(values)
+    seed = start + n - 1
+    out[seed] = sum(values[start:seed + 1]) / n
+    for i in range(seed + 1, len(values)):
+        out[i] = (out[i - 1] * (n - 1) + values[i]) / n
+    return out
+
+
+def write(path, header, dates, columns):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i in reversed(range(len(dates))):
+            if any(col[i] is None for col in columns):
+                continue
+            writer.writerow([dates[i].isoformat()] + [f"{col[i]:.4f}" for col in columns])
+
+
+def main():
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), SYMBOL)
+    os.makedirs(directory, exist_ok=True)
+    bars = make_bars()
+    dates = [bar[0] for bar in bars]
+    high = [bar[2] for bar in bars]
+    low = [bar[3] for bar in bars]
+    close = [bar[4] for bar in bars]
+
+    with open(os.path.join(directory, "TIME_SERIES_DAILY.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "open", "high", "low", "close", "volume"])
+        for bar in reversed(bars):
+            writer.writerow([bar[0].isoformat(), *bar[1:]])
+
+    write(os.path.join(directory, "SMA_50.csv"), ["time", "SMA"], dates, [sma(close, 50)])
+    write(os.path.join(directory, "SMA_200.csv"), ["time", "SMA"], dates, [sma(close, 200)])
+    write(os.path.join(directory, "EMA_10.csv"), ["time", "EMA"], dates, [ema(close, 10)])
+
+    fast = ema(close, 12, seed_end=25)
+    slow = ema(close, 26)
+    macd = [None if f is None or s is None else f - s for f, s in zip(fast, slow)]
+    signal = ema(macd, 9)
+    hist = [None if s is None else m - s for m, s in zip(macd, signal)]
+    write(os.path.join(directory, "MACD.csv"), ["time", "MACD", "MACD_Hist", "MACD_Signal"], dates, [macd, hist, signal])
+
+    changes = [0.0] + [close[i] - close[i - 1] for i in range(1, len(close))]
+    gain = wilder([max(c, 0.0) for c in changes], 14, 1)
+    loss = wilder([max(-c, 0.0) for c in changes], 14, 1)
+    rsi = [None if g is None else (100 * g / (g + l) if g + l > 0 else 0.0) for g, l in zip(gain, loss)]
+    write(os.path.join(directory, "RSI_14.csv"), ["time", "RSI"], dates, [rsi])
+
+    true_range = [0.0] + [
+        max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])) for i in range(1, len(close))
+    ]
+    write(os.path.join(directory, "ATR_14.csv"), ["time", "ATR"], dates, [wilder(true_range, 14, 1)])
+
+    middle = sma(close, 20)
+    deviation = [
+        None if m is None else math.sqrt(sum((c - m) ** 2 for c in close[i - 19:i + 1]) / 20)
+        for i, m in enumerate(middle)
+    ]
+    upper = [None if m is None else m + 2 * d for m, d in zip(middle, deviation)]
+    lower = [None if m is None else m - 2 * d for m, d in zip(middle, deviation)]
+    write(
+        os.path.join(directory, "BBANDS_20.csv"),
+        ["time", "Real Lower Band", "Real Middle Band", "Real Upper Band"],
+        dates,
+        [lower, middle, upper],
+    )
+
+
+if __name__ == "__main__":
+    main()
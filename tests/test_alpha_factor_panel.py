@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.agents.utils import alpha_factor_panel as panel
+from tradingagents.agents.utils.alpha_factors_tools import screen_alpha_factors
+
+
+def make_bars(dates, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, len(dates))))
+    spread = np.abs(rng.normal(0, 0.01, len(dates)))
+    return pd.DataFrame(
+        {
+            "High": close * (1 + spread),
+            "Low": close * (1 - spread),
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 9_000_000, len(dates)).astype("float64"),
+        },
+        index=pd.DatetimeIndex(dates, name="Date"),
+    )
+
+
+def calendars():
+    """US weekdays, a listing with a different holiday calendar, and a recent IPO."""
+    weekdays = pd.bdate_range("2022-01-03", "2023-12-29")
+    holidays = weekdays[::17]
+    return {
+        "US": make_bars(weekdays, 1),
+        "EU": make_bars(weekdays.difference(holidays), 2),
+        "IPO": make_bars(weekdays[-90:], 3),
+    }
+
+
+def test_ranks_and_zscores_are_per_factor():
+    factors = pd.DataFrame(
+        {"a": [1.0, 2.0, 3.0, np.nan], "b": [5.0, 5.0, 5.0, 5.0]}, index=["W", "X", "Y", "Z"]
+    )
+
+    ranks = panel.cross_sectional_ranks(factors)
+    zscores = panel.cross_sectional_zscores(factors)
+
+    assert ranks["a"].tolist()[:3] == pytest.approx([1 / 3, 2 / 3, 1.0])
+    assert np.isnan(ranks.at["Z", "a"])
+    assert ranks["b"].tolist() == pytest.approx([0.625] * 4)
+    assert zscores["a"].tolist()[:3] == pytest.approx([-np.sqrt(1.5), 0.0, np.sqrt(1.5)])
+    # No dispersion: undefined rather than infinite
+    assert zscores["b"].isna().all()
+
+
+def test_panel_matches_each_ticker_on_its_own_calendar():
+    frames = calendars()
+    benchmark = (frames["US"]["Close"] * 0.5 + 50).rename("SPY")
+
+    factors = panel.compute_factor_panel(panel.panel_from_frames(frames), benchmark)
+
+    for ticker, frame in frames.items():
+        np.testing.assert_allclose(
+            factors.loc[ticker, panel.PANEL_FACTORS].to_numpy(dtype="float64"),
+            panel.factor_row(frame, benchmark)[panel.PANEL_FACTORS].to_numpy(dtype="float64"),
+            rtol=1e-9,
+            equal_nan=True,
+        )
+    # 90 bars: short-horizon factors only
+    assert not np.isnan(factors.at["IPO", "past_1m_return"])
+    assert np.isnan(factors.at["IPO", "past_12m_return"]) and np.isnan(factors.at["IPO", "beta"])
+
+
+@pytest.fixture
+def universe(monkeypatch):
+    frames = calendars()
+
+    def get_stock_frame(symbol, start_date, end_date):
+        if symbol not in frames:
+            raise ValueError(f"unknown symbol {symbol}")
+        return frames[symbol].loc[start_date:end_date]
+
+    monkeypatch.setattr(panel, "get_stock_frame", get_stock_frame)
+    monkeypatch.setattr(panel, "load_benchmark", lambda start_date, end_date: None)
+    return frames
+
+
+def test_screen_universe_reports_failed_tickers(universe):
+    result = panel.screen_universe(["us", "EU", "IPO", "NOPE"], "2023-12-29", prefetch=False)
+
+    assert list(result["factors"].index) == ["US", "EU", "IPO"]
+    assert result["failed"] == ["NOPE"]
+    assert result["ranks"].shape == result["zscores"].shape == result["factors"].shape
+
+
+def test_screen_tool_tabulates_values_and_ranks(universe, monkeypatch):
+    real_screen = panel.screen_universe
+    monkeypatch.setattr(
+        "tradingagents.agents.utils.alpha_factors_tools.screen_universe",
+        lambda tickers, curr_date, look_back_days: real_screen(tickers, curr_date, look_back_days, prefetch=False),
+    )
+
+    report = screen_alpha_factors.invoke({"tickers": "US, EU", "curr_date": "2023-12-29"})
+
+    assert "| Factor | US | EU |" in report
+    assert "| Past 12M Return |" in report and "%)" in report
+    assert screen_alpha_factors.invoke({"tickers": "US", "curr_date": "2023-12-29"}).startswith("Error")
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from tradingagents.dataflows import alpha_vantage_common as common
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def api(monkeypatch):
+    stored = []
+    replies = []
+    monkeypatch.setenv("ALPHA_VANTAGE_API_KEY", "test")
+    monkeypatch.setattr(common.alpha_vantage_cache, "lookup", lambda function_name, params: None)
+    monkeypatch.setattr(common.alpha_vantage_cache, "store", lambda function_name, params, text: stored.append(text))
+    monkeypatch.setattr(common, "get_rate_limiter", lambda vendor: type("Limiter", (), {"acquire": lambda self: 0.0})())
+    monkeypatch.setattr(
+        common, "get_session", lambda name: type("Session", (), {"get": lambda self, url, params: replies.pop(0)})()
+    )
+    return replies, stored
+
+
+@pytest.mark.parametrize("key", ["Note", "Information"])
+def test_throttling_messages_raise_and_are_not_cached(api, key):
+    replies, stored = api
+    message = "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute."
+    replies.append(FakeResponse(json.dumps({key: message})))
+
+    with pytest.raises(common.AlphaVantageRateLimitError):
+        common._make_api_request("TIME_SERIES_DAILY", {"symbol": "IBM"})
+    assert stored == []
+
+
+def test_data_is_cached(api):
+    replies, stored = api
+    replies.append(FakeResponse("timestamp,open\n2024-01-02,1.0\n"))
+
+    assert common._make_api_request("TIME_SERIES_DAILY", {"symbol": "IBM"}).startswith("timestamp")
+    assert len(stored) == 1
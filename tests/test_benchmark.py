@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import benchmark
+
+
+@pytest.fixture
+def spy(monkeypatch):
+    dates = pd.bdate_range("2022-01-03", "2023-12-29", name="Date")
+    bars = pd.DataFrame({"Close": range(1, len(dates) + 1)}, index=dates, dtype="float64")
+    loads = []
+
+    def get_stock_frame(symbol, start_date, end_date):
+        loads.append((symbol, start_date, end_date))
+        return bars.loc[start_date:end_date]
+
+    monkeypatch.setattr(benchmark, "get_stock_frame", get_stock_frame)
+    benchmark.clear_benchmark_cache()
+    yield loads
+    benchmark.clear_benchmark_cache()
+
+
+def test_prices_load_once_per_process(spy):
+    benchmark.get_benchmark_prices("2023-01-03", "2023-06-30")
+    benchmark.get_benchmark_prices("2023-02-01", "2023-03-31")
+    benchmark.get_benchmark_returns("2023-03-01", "2023-06-30")
+
+    assert spy == [("SPY", "2023-01-03", "2023-06-30")]
+
+
+def test_wider_range_reloads_the_union_once(spy):
+    benchmark.get_benchmark_prices("2023-03-01", "2023-06-30")
+    prices = benchmark.get_benchmark_prices("2023-01-03", "2023-04-28")
+    benchmark.get_benchmark_prices("2023-01-03", "2023-06-30")
+
+    assert spy == [("SPY", "2023-03-01", "2023-06-30"), ("SPY", "2023-01-03", "2023-06-30")]
+    assert prices.index[0] == pd.Timestamp("2023-01-03") and prices.index[-1] == pd.Timestamp("2023-04-28")
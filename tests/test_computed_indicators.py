@@ -0,0 +1,39 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.computed_indicators import compute_indicator_frame
+from verify_computed_indicators import DEFAULT_FIXTURES, verify_symbol
+
+# Symbol directories holding a saved daily series (SYNTH: generated by
+# generate_synthetic.py from independent loop implementations, so it checks
+# computed_indicators against a second implementation, not against the vendor)
+FIXTURE_SYMBOLS = sorted(
+    name
+    for name in os.listdir(DEFAULT_FIXTURES)
+    if any(
+        os.path.isfile(os.path.join(DEFAULT_FIXTURES, name, series))
+        for series in ("TIME_SERIES_DAILY.csv", "TIME_SERIES_DAILY_ADJUSTED.csv")
+    )
+)
+
+
+@pytest.mark.parametrize("symbol", FIXTURE_SYMBOLS)
+def test_indicators_match_saved_reference_values(symbol):
+    # offline: a missing fixture fails the test instead of reaching the network
+    assert verify_symbol(symbol, DEFAULT_FIXTURES, offline=True) == 0
+
+
+def test_vwma_without_volume_is_nan():
+    dates = pd.bdate_range("2024-01-01", periods=30)
+    bars = pd.DataFrame(
+        {"Open": 10.0, "High": 11.0, "Low": 9.0, "Close": 10.0, "Volume": 1000.0}, index=dates
+    )
+    bars.iloc[:20, bars.columns.get_loc("Volume")] = 0.0
+
+    vwma = compute_indicator_frame(bars, ["vwma"])["vwma"]
+
+    assert vwma.iloc[:20].isna().all()
+    assert np.allclose(vwma.iloc[20:], 10.0)
@@ -0,0 +1,216 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.agents.utils import alpha_factor_panel as panel
+from tradingagents.dataflows import factor_store
+from tradingagents.dataflows.config import get_config, set_config
+
+
+def make_bars(start="2021-01-04", end="2023-12-29", seed=3):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, end, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, len(dates))))
+    spread = np.abs(rng.normal(0, 0.01, len(dates)))
+    return pd.DataFrame(
+        {
+            "Open": close * (1 + rng.normal(0, 0.005, len(dates))),
+            "High": close * (1 + spread),
+            "Low": close * (1 - spread),
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 9_000_000, len(dates)).astype("float64"),
+        },
+        index=dates,
+    )
+
+
+@pytest.fixture
+def vendor(monkeypatch, tmp_path):
+    """Serves make_bars() through get_stock_frame and records each request's range."""
+    previous = get_config()["data_cache_dir"]
+    set_config({"data_cache_dir": str(tmp_path)})
+    factor_store.clear_memory()
+
+    source = {"bars": make_bars(), "calls": []}
+
+    def get_stock_frame(symbol, start_date, end_date):
+        source["calls"].append((start_date, end_date))
+        return source["bars"].loc[start_date:end_date].copy()
+
+    monkeypatch.setattr(panel, "get_stock_frame", get_stock_frame)
+    monkeypatch.setattr(panel, "load_benchmark", lambda start_date, end_date: None)
+    yield source
+    factor_store.clear_memory()
+    set_config({"data_cache_dir": previous})
+
+
+def assert_frames_close(left, right):
+    assert list(left.index) == list(right.index)
+    np.testing.assert_allclose(left.to_numpy(dtype="float64"), right.to_numpy(dtype="float64"), rtol=1e-9, equal_nan=True)
+
+
+def test_history_rows_match_factor_row_on_the_trailing_window():
+    bars = make_bars()
+    benchmark = bars["Close"].rename("SPY") * 0.5 + 50
+    history = panel.compute_factor_history(bars, "2022-06-01", benchmark)
+    width = panel._MAX_LOOKBACK + 1
+
+    for date in ["2022-06-01", "2022-11-15", "2023-12-29"]:
+        i = bars.index.get_loc(pd.Timestamp(date))
+        expected = panel.factor_row(bars.iloc[i - width + 1:i + 1], benchmark)
+        np.testing.assert_allclose(
+            history.loc[date, panel.PANEL_FACTORS].to_numpy(dtype="float64"),
+            expected[panel.PANEL_FACTORS].to_numpy(dtype="float64"),
+            rtol=1e-9,
+            equal_nan=True,
+        )
+
+
+def test_later_range_extends_the_cache(vendor):
+    panel.get_factor_history("TEST", "2023-01-03", "2023-03-31")
+    vendor["calls"].clear()
+
+    history = panel.get_factor_history("TEST", "2023-01-03", "2023-06-30")
+
+    # Only the new dates (with their warm-up) were loaded
+    assert vendor["calls"] == [(panel.lookback_start("2023-03-31"), "2023-06-30")]
+    expected = panel.compute_factor_history(make_bars().loc[:"2023-06-30"], "2023-01-03")
+    assert_frames_close(history, expected)
+
+    vendor["calls"].clear()
+    panel.get_factor_history("TEST", "2023-02-01", "2023-05-31")
+    assert vendor["calls"] == []
+
+
+def test_earlier_range_rebuilds_without_shrinking(vendor):
+    panel.get_factor_history("TEST", "2023-03-01", "2023-06-30")
+    vendor["calls"].clear()
+
+    panel.get_factor_history("TEST", "2023-01-03", "2023-02-28")
+
+    assert vendor["calls"] == [(panel.lookback_start("2023-01-03"), "2023-06-30")]
+    _, meta = factor_store.read_factors("TEST")
+    assert (meta["start"], meta["through"]) == ("2023-01-03", "2023-06-30")
+
+
+def test_readjusted_bars_rebuild_the_history(vendor):
+    panel.get_factor_history("TEST", "2023-01-03", "2023-03-31")
+    vendor["calls"].clear()
+
+    # A 2:1 split back-adjusts every stored price
+    vendor["bars"] = vendor["bars"].assign(
+        **{column: vendor["bars"][column] / 2 for column in ("Open", "High", "Low", "Close")}
+    )
+    panel.get_factor_history("TEST", "2023-01-03", "2023-06-30")
+
+    assert vendor["calls"] == [
+        (panel.lookback_start("2023-03-31"), "2023-06-30"),
+        (panel.lookback_start("2023-01-03"), "2023-06-30"),
+    ]
+    _, meta = factor_store.read_factors("TEST")
+    assert meta["anchor_price"] == pytest.approx(vendor["bars"].at[pd.Timestamp("2023-06-30"), "Close"])
+
+
+def test_version_bump_rebuilds_the_history(vendor, monkeypatch):
+    panel.get_factor_history("TEST", "2023-01-03", "2023-03-31")
+    vendor["calls"].clear()
+
+    panel.get_factor_history("TEST", "2023-01-03", "2023-03-31")
+    assert vendor["calls"] == []
+
+    monkeypatch.setattr(panel, "FACTOR_HISTORY_VERSION", panel.FACTOR_HISTORY_VERSION + 1)
+    panel.get_factor_history("TEST", "2023-01-03", "2023-03-31")
+    assert vendor["calls"] == [(panel.lookback_start("2023-01-03"), "2023-03-31")]
+    _, meta = factor_store.read_factors("TEST")
+    assert meta["version"] == panel.FACTOR_HISTORY_VERSION
+
+
+def test_benchmark_regression_matches_ols():
+    rng = np.random.default_rng(11)
+    dates = pd.bdate_range("2022-01-03", periods=400, name="Date")
+    market_returns = rng.normal(0, 0.01, len(dates))
+    stock_returns = 0.0002 + 1.3 * market_returns + rng.normal(0, 0.008, len(dates))
+    market = pd.Series(100 * np.cumprod(1 + market_returns), index=dates, name="SPY")
+    close = 50 * np.cumprod(1 + stock_returns)
+    bars = pd.DataFrame({"High": close, "Low": close, "Close": close, "Volume": 1e6}, index=dates)
+
+    row = panel.compute_factor_history(bars, dates[-1].strftime("%Y-%m-%d"), market).iloc[-1]
+
+    # The window's 253 bars give 252 returns
+    y, x = stock_returns[-252:], market_returns[-252:]
+    slope, intercept = np.polyfit(x, y, 1)
+    residuals = y - (slope * x + intercept)
+    assert row["beta"] == pytest.approx(slope, rel=1e-9)
+    assert row["benchmark_correlation"] == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-9)
+    assert row["idiosyncratic_volatility"] == pytest.approx(
+        np.sqrt((residuals ** 2).sum() / (len(y) - 2) * 252) * 100, rel=1e-9
+    )
+
+
+def test_warm_cache_lookups_do_not_load_the_benchmark(vendor, monkeypatch):
+    loads = []
+    monkeypatch.setattr(panel, "load_benchmark", lambda start_date, end_date: loads.append(start_date))
+    panel.get_factor_history("TEST", "2023-01-03", "2023-06-30")
+    loads.clear()
+    vendor["calls"].clear()
+
+    panel.get_factors_as_of("TEST", "2023-05-15")
+
+    assert loads == [] and vendor["calls"] == []
+
+
+def test_benchmark_failure_keeps_a_cache_built_with_it(vendor, monkeypatch):
+    spy = (vendor["bars"]["Close"] * 0.8).rename("SPY")
+    monkeypatch.setattr(panel, "load_benchmark", lambda start_date, end_date: spy.loc[start_date:end_date])
+    panel.get_factor_history("TEST", "2023-01-03", "2023-03-31")
+    cached, meta = factor_store.read_factors("TEST")
+
+    monkeypatch.setattr(panel, "load_benchmark", lambda start_date, end_date: None)
+    history = panel.get_factor_history("TEST", "2023-01-03", "2023-04-28")
+
+    after, after_meta = factor_store.read_factors("TEST")
+    assert after is cached and after_meta == meta
+    assert meta["benchmark"] == "SPY"
+    assert history.loc[:"2023-03-31", "beta"].notna().all()
+    assert history.loc["2023-04-03":, "beta"].isna().all()
+
+
+def test_live_lookups_recompute_once_per_day(vendor, monkeypatch):
+    monkeypatch.setattr(panel, "_today", lambda: pd.Timestamp("2023-06-30"))
+    panel.get_factors_as_of("TEST", "2023-06-29")
+    panel.get_factors_as_of("TEST", "2023-06-30")
+    vendor["calls"].clear()
+
+    row = panel.get_factors_as_of("TEST", "2023-06-30")
+    assert vendor["calls"] == []
+    assert row.name == pd.Timestamp("2023-06-30")
+
+    monkeypatch.setattr(panel, "_today", lambda: pd.Timestamp("2023-07-03"))
+    panel.get_factors_as_of("TEST", "2023-07-03")
+    assert vendor["calls"] == [(panel.lookback_start("2023-06-29"), "2023-07-03")]
+
+
+def test_writes_leave_no_temp_files(vendor):
+    panel.get_factor_history("TEST", "2023-01-03", "2023-03-31")
+    panel.get_factor_history("TEST", "2023-01-03", "2023-06-30")
+
+    assert sorted(os.listdir(factor_store.get_factor_dir())) == sorted(
+        [f"TEST.{factor_store.STORE_FORMAT}", "TEST.meta.json"]
+    )
+
+
+def test_factor_row_uses_the_history_window_on_longer_frames():
+    bars = make_bars()
+    benchmark = (bars["Close"] * 0.5 + 50).rename("SPY")
+
+    row = panel.factor_row(bars, benchmark)
+    history = panel.compute_factor_history(bars, "2023-12-29", benchmark).iloc[-1]
+
+    np.testing.assert_allclose(
+        row[panel.PANEL_FACTORS].to_numpy(dtype="float64"),
+        history[panel.PANEL_FACTORS].to_numpy(dtype="float64"),
+        rtol=1e-9,
+        equal_nan=True,
+    )
@@ -0,0 +1,202 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import ohlcv_store
+from tradingagents.dataflows.config import get_config, set_config
+
+
+def make_bars(start="2022-01-03", end="2023-07-03", seed=5):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, end, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, len(dates))))
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 9_000_000, len(dates)).astype("float64"),
+        },
+        index=dates,
+    )
+
+
+@pytest.fixture
+def provider(monkeypatch, tmp_path):
+    """Serves bars up to the stubbed "today" through _download_ohlcv and records each request."""
+    previous = get_config()["data_cache_dir"]
+    set_config({"data_cache_dir": str(tmp_path)})
+
+    source = {"bars": make_bars(), "today": pd.Timestamp("2023-06-29"), "calls": []}
+
+    def download(symbol, start, end):
+        source["calls"].append((symbol, start, end))
+        bars = source["bars"]
+        return bars[(bars.index >= start) & (bars.index < end) & (bars.index <= source["today"])].copy()
+
+    monkeypatch.setattr(ohlcv_store, "_download_ohlcv", download)
+    monkeypatch.setattr(ohlcv_store, "_today", lambda: source["today"])
+    yield source
+    set_config({"data_cache_dir": previous})
+
+
+def test_tail_is_checked_at_most_once_a_day(provider):
+    ohlcv_store.load_ohlcv("TEST", "2023-01-03")
+    assert len(provider["calls"]) == 1
+    provider["calls"].clear()
+
+    # Same day: the missing bar is not asked for again
+    data = ohlcv_store.load_ohlcv("TEST", "2023-01-03", "2023-06-30")
+    assert provider["calls"] == []
+    assert data.index[-1] == pd.Timestamp("2023-06-29")
+
+    provider["today"] = pd.Timestamp("2023-07-03")
+    data = ohlcv_store.load_ohlcv("TEST", "2023-01-03")
+
+    # The last stored bar is re-fetched from the one before it
+    assert provider["calls"] == [("TEST", pd.Timestamp("2023-06-28"), pd.Timestamp("2023-07-04"))]
+    assert data.index[-1] == pd.Timestamp("2023-07-03")
+    provider["calls"].clear()
+
+    ohlcv_store.load_ohlcv("TEST", "2023-01-03", "2023-07-05")
+    assert provider["calls"] == []
+
+
+def test_readjusted_history_is_rebuilt(provider):
+    ohlcv_store.load_ohlcv("TEST", "2023-01-03")
+    history_start = provider["calls"][0][1]
+    provider["calls"].clear()
+
+    # A 2:1 split back-adjusts every bar the provider serves
+    provider["bars"] = provider["bars"].assign(
+        **{column: provider["bars"][column] / 2 for column in ("Open", "High", "Low", "Close")}
+    )
+    provider["today"] = pd.Timestamp("2023-07-03")
+    data = ohlcv_store.load_ohlcv("TEST", "2023-01-03")
+
+    assert provider["calls"] == [
+        ("TEST", pd.Timestamp("2023-06-28"), pd.Timestamp("2023-07-04")),
+        ("TEST", history_start, pd.Timestamp("2023-07-04")),
+    ]
+    expected = provider["bars"].loc["2023-01-03":"2023-07-03"]
+    np.testing.assert_allclose(data["Close"].to_numpy(), expected["Close"].to_numpy(), rtol=1e-12)
+    stored = ohlcv_store.read_stored_ohlcv("TEST")
+    assert stored.loc["2022-01-03", "Close"] == pytest.approx(provider["bars"].at[pd.Timestamp("2022-01-03"), "Close"])
+
+
+def test_writes_leave_no_temp_files(provider):
+    ohlcv_store.load_ohlcv("TEST", "2023-01-03")
+    provider["today"] = pd.Timestamp("2023-07-03")
+    ohlcv_store.load_ohlcv("TEST", "2023-01-03")
+
+    assert sorted(os.listdir(ohlcv_store.get_store_dir())) == sorted(
+        [f"TEST.{ohlcv_store.STORE_FORMAT}", "TEST.meta.json"]
+    )
+
+
+@pytest.fixture
+def batch_provider(monkeypatch, tmp_path):
+    """Serves per-symbol bars through a stubbed multi-ticker yf.download and records each request."""
+    previous = get_config()["data_cache_dir"]
+    set_config({"data_cache_dir": str(tmp_path)})
+
+    source = {
+        "bars": {symbol: make_bars(seed=seed) for seed, symbol in enumerate(["AAA", "BBB", "CCC", "DDD"])},
+        "today": pd.Timestamp("2023-06-29"),
+        "calls": [],
+    }
+
+    def download(symbols, start, end, group_by, **kwargs):
+        assert group_by == "ticker"
+        source["calls"].append((tuple(symbols), start))
+        dates = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1), name="Date")
+        dates = dates[dates <= source["today"]]
+        frames = {}
+        for symbol in symbols:
+            if symbol in source["bars"]:
+                frames[symbol] = source["bars"][symbol].reindex(dates)
+            elif symbol == "NOPE":
+                # Unknown symbols come back as all-NaN columns
+                frames[symbol] = pd.DataFrame(np.nan, index=dates, columns=["Open", "High", "Low", "Close", "Volume"])
+        return pd.concat(frames, axis=1)
+
+    monkeypatch.setattr(ohlcv_store.yf, "download", download)
+    monkeypatch.setattr(ohlcv_store, "_today", lambda: source["today"])
+    yield source
+    set_config({"data_cache_dir": previous})
+
+
+def test_prefetch_groups_symbols_by_download_window(batch_provider):
+    ohlcv_store.prefetch(["AAA", "BBB"], "2023-01-03")
+    history_start = pd.Timestamp("2023-06-29") - pd.DateOffset(years=ohlcv_store.HISTORY_YEARS)
+    assert batch_provider["calls"] == [(("AAA", "BBB"), history_start.strftime("%Y-%m-%d"))]
+    batch_provider["calls"].clear()
+
+    batch_provider["today"] = pd.Timestamp("2023-07-03")
+    summary = ohlcv_store.prefetch(["aaa", "BBB", "CCC", "DDD", "AAA"], "2023-01-03", batch_size=1)
+
+    # Stored symbols share a tail window, new ones a full-history window, one symbol per request
+    history_start = pd.Timestamp("2023-07-03") - pd.DateOffset(years=ohlcv_store.HISTORY_YEARS)
+    assert sorted(batch_provider["calls"]) == sorted([
+        (("AAA",), "2023-06-28"),
+        (("BBB",), "2023-06-28"),
+        (("CCC",), history_start.strftime("%Y-%m-%d")),
+        (("DDD",), history_start.strftime("%Y-%m-%d")),
+    ])
+    assert sorted(summary["fetched"]) == ["AAA", "BBB", "CCC", "DDD"]
+    batch_provider["calls"].clear()
+
+    summary = ohlcv_store.prefetch(["AAA", "CCC"], "2023-01-03", "2023-07-05")
+    assert batch_provider["calls"] == []
+    assert summary["skipped"] == ["AAA", "CCC"]
+
+
+def test_prefetch_splits_the_multi_ticker_frame_per_symbol(batch_provider, monkeypatch):
+    summary = ohlcv_store.prefetch(["AAA", "NOPE", "BBB", "GONE"], "2023-01-03")
+
+    assert summary == {"fetched": ["AAA", "BBB"], "skipped": [], "failed": ["NOPE", "GONE"]}
+    for symbol in ("AAA", "BBB"):
+        stored = ohlcv_store.read_stored_ohlcv(symbol)
+        expected = batch_provider["bars"][symbol].loc[:"2023-06-29"]
+        np.testing.assert_allclose(stored["Close"].to_numpy(), expected["Close"].to_numpy(), rtol=1e-12)
+    assert ohlcv_store.read_stored_ohlcv("NOPE") is None
+
+    # The store now serves load_ohlcv without another download
+    monkeypatch.setattr(ohlcv_store, "_download_ohlcv", lambda *args: pytest.fail("unexpected download"))
+    assert ohlcv_store.load_ohlcv("AAA", "2023-01-03", "2023-06-30").index[-1] == pd.Timestamp("2023-06-29")
+
+
+def test_prefetch_rebuilds_readjusted_symbols(batch_provider):
+    ohlcv_store.prefetch(["AAA", "BBB"], "2023-01-03")
+    history_start = batch_provider["calls"][0][1]
+    batch_provider["calls"].clear()
+
+    bars = batch_provider["bars"]["AAA"]
+    batch_provider["bars"]["AAA"] = bars.assign(**{column: bars[column] / 2 for column in ("Open", "High", "Low", "Close")})
+    batch_provider["today"] = pd.Timestamp("2023-07-03")
+    summary = ohlcv_store.prefetch(["AAA", "BBB"], "2023-01-03")
+
+    assert batch_provider["calls"] == [(("AAA", "BBB"), "2023-06-28"), (("AAA",), history_start)]
+    assert summary["fetched"] == ["BBB", "AAA"]
+    stored = ohlcv_store.read_stored_ohlcv("AAA")
+    assert stored["Close"].iloc[0] == pytest.approx(batch_provider["bars"]["AAA"]["Close"].iloc[0])
+    assert stored.index[-1] == pd.Timestamp("2023-07-03")
+
+
+def test_cli_prefetch_reads_tickers_from_a_file(batch_provider, tmp_path):
+    pytest.importorskip("langgraph")
+    from typer.testing import CliRunner
+
+    from cli.main import app
+
+    tickers = tmp_path / "universe.txt"
+    tickers.write_text("# universe\nAAA\nbbb  # lower case is fine\n\nNOPE\n")
+    result = CliRunner().invoke(app, ["prefetch", "CCC", "--file", str(tickers), "--start", "2023-01-03"])
+
+    assert result.exit_code == 1  # NOPE failed
+    assert [call[0] for call in batch_provider["calls"]] == [("CCC", "AAA", "BBB", "NOPE")]
+    for symbol in ("AAA", "BBB", "CCC"):
+        assert ohlcv_store.read_stored_ohlcv(symbol) is not None
@@ -0,0 +1,28 @@
+import pytest
+
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.rate_limiter import DailyQuotaExceededError, RateLimiter, get_rate_limit_config
+
+
+def test_alpha_vantage_defaults_to_the_free_tier():
+    settings = get_rate_limit_config("alpha_vantage")
+    assert settings["requests_per_minute"] <= 5
+    assert settings["requests_per_day"] <= 25
+
+
+def test_config_overrides_the_defaults():
+    previous = get_config().get("rate_limits", {})
+    set_config({"rate_limits": {**previous, "alpha_vantage": {"requests_per_minute": 75, "requests_per_day": None}}})
+    try:
+        settings = get_rate_limit_config("alpha_vantage")
+        assert (settings["requests_per_minute"], settings["requests_per_day"]) == (75, None)
+    finally:
+        set_config({"rate_limits": previous})
+
+
+def test_daily_budget_is_enforced():
+    limiter = RateLimiter("test", requests_per_day=2)
+    limiter.acquire()
+    limiter.acquire()
+    with pytest.raises(DailyQuotaExceededError):
+        limiter.acquire()
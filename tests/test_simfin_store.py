@@ -0,0 +1,73 @@
+import os
+import threading
+
+import pytest
+
+from tradingagents.dataflows import simfin_store
+from tradingagents.dataflows.config import get_config, set_config
+
+HEADER = "Ticker;SimFinId;Currency;Fiscal Year;Report Date;Publish Date;Revenue\n"
+
+
+def write_csv(path, rows, mtime):
+    with open(path, "w") as f:
+        f.write(HEADER)
+        for row in rows:
+            f.write(";".join(str(value) for value in row) + "\n")
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def store(tmp_path):
+    previous = get_config()["data_cache_dir"]
+    set_config({"data_cache_dir": str(tmp_path / "cache")})
+    simfin_store._indexes.clear()
+    yield tmp_path
+    simfin_store._indexes.clear()
+    set_config({"data_cache_dir": previous})
+
+
+def test_updated_source_is_picked_up_without_restart(store):
+    source = str(store / "us-income-quarterly.csv")
+    write_csv(source, [("AAPL", 1, "USD", 2023, "2023-09-30", "2023-11-03", 100)], 1_700_000_000)
+    index = simfin_store.get_statement_index(source, "income_statements", "quarterly")
+    assert index.latest("AAPL", "2024-03-01")["Revenue"] == 100
+    assert simfin_store.get_statement_index(source, "income_statements", "quarterly") is index
+
+    write_csv(
+        source,
+        [
+            ("AAPL", 1, "USD", 2023, "2023-09-30", "2023-11-03", 100),
+            ("AAPL", 1, "USD", 2024, "2023-12-31", "2024-02-02", 120),
+        ],
+        1_700_100_000,
+    )
+    assert simfin_store.get_statement_index(source, "income_statements", "quarterly").latest(
+        "AAPL", "2024-03-01"
+    )["Revenue"] == 120
+
+
+def test_ingesting_one_file_does_not_block_others(store, monkeypatch):
+    slow, fast = str(store / "slow.csv"), str(store / "fast.csv")
+    for path in (slow, fast):
+        write_csv(path, [("MSFT", 2, "USD", 2023, "2023-09-30", "2023-10-24", 50)], 1_700_000_000)
+
+    started, release = threading.Event(), threading.Event()
+    load_index = simfin_store._load_index
+
+    def blocking_load(source_path, statement, freq):
+        if source_path == slow:
+            started.set()
+            release.wait(5)
+        return load_index(source_path, statement, freq)
+
+    monkeypatch.setattr(simfin_store, "_load_index", blocking_load)
+    worker = threading.Thread(target=simfin_store.get_statement_index, args=(slow, "balance_sheet", "annual"))
+    worker.start()
+    try:
+        assert started.wait(5)
+        index = simfin_store.get_statement_index(fast, "cash_flow", "annual")
+        assert index.latest("MSFT", "2024-01-01")["Revenue"] == 50
+    finally:
+        release.set()
+        worker.join(5)
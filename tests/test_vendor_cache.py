@@ -0,0 +1,44 @@
+import pytest
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.vendor_cache import get_vendor_cache
+
+
+@pytest.fixture
+def indicator_vendor(monkeypatch):
+    previous = dict(get_config().get("tool_vendors", {}))
+    set_config({"tool_vendors": {"get_indicators": "alpha_vantage"}})
+    cache = get_vendor_cache()
+    cache.clear()
+    replies = []
+    monkeypatch.setitem(interface.VENDOR_METHODS, "get_indicators", {"alpha_vantage": lambda *args: replies.pop(0)})
+    yield replies
+    cache.clear()
+    set_config({"tool_vendors": previous})
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [
+        "Error retrieving rsi data: timed out",
+        "No data found for symbol 'AAPL' between 2024-01-01 and 2024-01-31",
+        "No news articles found for AAPL between 2024-01-01 and 2024-01-31",
+        "",
+    ],
+)
+def test_failure_strings_are_not_cached(indicator_vendor, failure):
+    indicator_vendor.extend([failure, "rsi values"])
+    assert interface.route_to_vendor("get_indicators", "AAPL", "rsi") == failure
+    assert interface.route_to_vendor("get_indicators", "AAPL", "rsi") == "rsi values"
+
+
+def test_reports_mentioning_missing_data_are_cached():
+    assert not interface._is_error_result("## AAPL news\n\nNo articles found in range; showing recent ones")
+    assert interface._is_error_result("  Error: No data returned for rsi")
+
+
+def test_results_are_cached(indicator_vendor):
+    indicator_vendor.append("rsi values")
+    assert interface.route_to_vendor("get_indicators", "AAPL", "rsi") == "rsi values"
+    assert interface.route_to_vendor("get_indicators", "AAPL", "rsi") == "rsi values"
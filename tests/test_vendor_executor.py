@@ -0,0 +1,40 @@
+import threading
+import time
+
+import pytest
+
+from tradingagents.dataflows import vendor_executor
+from tradingagents.dataflows.config import get_config, set_config
+
+
+@pytest.fixture
+def routing():
+    previous = dict(get_config().get("vendor_routing", {}))
+    set_config({"vendor_routing": {"concurrent": True, "max_workers": 2, "deadline_seconds": 0.2}})
+    release = threading.Event()
+    yield release
+    release.set()
+    set_config({"vendor_routing": previous})
+
+
+def test_hung_calls_do_not_starve_later_fan_outs(routing):
+    hang = lambda: routing.wait(10)
+    for i in range(4):
+        outcomes = vendor_executor.run_vendor_calls([(hang, (), {}), (abs, (-i,), {})], vendor_executor.call_deadline())
+        assert outcomes == [("timeout", None), ("ok", i)]
+
+
+def test_single_call_is_bounded_by_the_deadline(routing):
+    started = time.monotonic()
+    outcomes = vendor_executor.run_vendor_calls([(lambda: routing.wait(10), (), {})], vendor_executor.call_deadline())
+    assert outcomes == [("timeout", None)]
+    assert time.monotonic() - started < 2
+
+
+def test_single_implementations_are_unbounded_unless_their_method_has_a_deadline(routing):
+    assert vendor_executor.call_deadline("get_news", fan_out=False) is None
+    assert vendor_executor.call_deadline("get_news") is not None
+
+    set_config({"vendor_routing": {**get_config()["vendor_routing"], "method_deadline_seconds": {"get_news": 5}}})
+    deadline = vendor_executor.call_deadline("get_news", fan_out=False)
+    assert 4 < deadline - time.monotonic() <= 5
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.alpha_vantage_cache import AlphaVantageCacheMissError
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.vendor_health import (
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    DataNotFoundError,
+    get_vendor_health,
+)
+
+
+@pytest.fixture
+def health():
+    previous = dict(get_config().get("vendor_health", {}))
+    set_config({"vendor_health": {"cooldown_seconds": 0}})
+    registry = get_vendor_health()
+    registry.reset()
+    yield registry
+    registry.reset()
+    set_config({"vendor_health": previous})
+
+
+@pytest.mark.parametrize(
+    "error", [DataNotFoundError("unknown symbol"), FileNotFoundError("no csv"), AlphaVantageCacheMissError("miss")]
+)
+def test_request_specific_errors_do_not_open_the_breaker(health, error):
+    for _ in range(10):
+        interface._record_vendor_health("get_stock_data", "alpha_vantage", [("error", error)])
+    snapshot = health.breaker("alpha_vantage", "get_stock_data").snapshot()
+    assert snapshot["state"] != OPEN
+    assert snapshot["calls_in_window"] == 0
+
+
+@pytest.mark.parametrize(
+    "error", [ValueError("Indicator vwap is not supported"), TypeError("unexpected keyword 'lookback'")]
+)
+def test_bad_arguments_do_not_open_the_breaker(health, error):
+    for _ in range(10):
+        interface._record_vendor_health("get_indicators", "alpha_vantage", [("error", error)])
+    assert health.breaker("alpha_vantage", "get_indicators").snapshot()["state"] != OPEN
+    assert health.allow_request("alpha_vantage", "get_indicators")
+
+
+def test_garbled_responses_still_count(health):
+    for _ in range(3):
+        try:
+            json.loads("<html>502 Bad Gateway</html>")
+        except ValueError as error:
+            interface._record_vendor_health("get_fundamentals", "alpha_vantage", [("error", error)])
+    assert health.breaker("alpha_vantage", "get_fundamentals").snapshot()["state"] in (OPEN, HALF_OPEN)
+
+
+def test_missed_deadlines_do_not_open_the_breaker(health):
+    for _ in range(10):
+        interface._record_vendor_health("get_global_news", "openai", [("timeout", None)])
+    assert health.breaker("openai", "get_global_news").snapshot()["state"] != OPEN
+
+
+def test_vendor_errors_still_open_the_breaker(health):
+    for _ in range(3):
+        interface._record_vendor_health("get_stock_data", "alpha_vantage", [("error", ConnectionError("down"))])
+    assert health.breaker("alpha_vantage", "get_stock_data").snapshot()["state"] in (OPEN, HALF_OPEN)
+
+
+def test_half_open_admits_a_single_trial_call(health):
+    breaker = CircuitBreaker("yfinance", "get_stock_data")
+    for _ in range(3):
+        breaker.record_failure(ConnectionError("down"))
+    breaker._cooldown = 60
+    breaker._opened_at -= 61  # cooldown elapsed
+
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.allow_request()
+    assert breaker.allow_request()
+
+
+def test_neutral_outcome_frees_the_trial_slot(health):
+    breaker = CircuitBreaker("yfinance", "get_stock_data")
+    for _ in range(3):
+        breaker.record_failure(ConnectionError("down"))
+    breaker._cooldown = 60
+    breaker._opened_at -= 61
+
+    assert breaker.allow_request()
+    breaker.record_neutral()
+    assert breaker.allow_request()
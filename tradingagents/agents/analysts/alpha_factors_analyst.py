@@ -1,7 +1,7 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
-from tradingagents.agents.utils.alpha_factors_tools import get_alpha_factors
+from tradingagents.agents.utils.alpha_factors_tools import get_alpha_factors, screen_alpha_factors
 from tradingagents.dataflows.config import get_config
 
 
@@ -13,6 +13,7 @@ def create_alpha_factors_analyst(llm):
 
         tools = [
             get_alpha_factors,
+            screen_alpha_factors,
         ]
 
         system_message = (
@@ -25,6 +26,7 @@ def create_alpha_factors_analyst(llm):
 
 Key responsibilities:
 - Use the get_alpha_factors tool to retrieve comprehensive factor calculations
+- Use the screen_alpha_factors tool to rank the company's factors against a few close peers
 - Analyze factor values in context of historical norms and market conditions
 - Identify factor divergences, momentum signals, and value opportunities
 - Provide clear recommendations based on factor analysis
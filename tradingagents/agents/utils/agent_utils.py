@@ -5,7 +5,8 @@ from tradingagents.agents.utils.core_stock_tools import (
     get_stock_data
 )
 from tradingagents.agents.utils.technical_indicators_tools import (
-    get_indicators
+    get_indicators,
+    get_indicators_batch
 )
 from tradingagents.agents.utils.fundamental_data_tools import (
     get_fundamentals,
@@ -20,7 +21,8 @@ from tradingagents.agents.utils.news_data_tools import (
     get_global_news
 )
 from tradingagents.agents.utils.alpha_factors_tools import (
-    get_alpha_factors
+    get_alpha_factors,
+    screen_alpha_factors
 )
 
 def create_msg_delete():
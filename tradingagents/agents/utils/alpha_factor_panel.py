@@ -0,0 +1,614 @@
+"""
+Cross-sectional alpha factor engine over a whole ticker universe.
+
+Bars for N tickers are aligned into (dates x tickers) matrices, and every
+price/volume, microstructure and technical factor of get_alpha_factors is
+computed for all tickers at once with column-wise array operations. The
+result is one (tickers x factors) frame, which can be turned into
+cross-sectional ranks and z-scores for screening. get_alpha_factors builds
+its report from a one-ticker panel, so both paths share one set of formulas.
+
+Tickers do not trade on exactly the same days. Before computing, each
+ticker's priced rows are shifted to the bottom of its column, so a lookback
+such as "20 bars ago" means the ticker's own 20th-last bar, as it does for a
+single symbol.
+
+For backtests, compute_factor_history evaluates the same formulas on every
+trading date of one symbol in a single pass: each date becomes one column of
+a panel of trailing windows. get_factor_history keeps the result in the
+factor cache (data_cache_dir/factors) and extends it incrementally, so a
+(symbol, date) lookup during a backtest is an index read.
+
+Beta, benchmark correlation and idiosyncratic (residual) volatility come
+from regressing each ticker's returns on the shared benchmark series of
+dataflows.benchmark, over the same trailing window, for every column at
+once.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from tradingagents.dataflows.benchmark import get_benchmark_prices, get_benchmark_symbol
+from tradingagents.dataflows.factor_store import (
+    factor_lock,
+    get_factor_cache_config,
+    read_factors,
+    write_factors,
+)
+from tradingagents.dataflows.frames import get_stock_frame
+
+PRICE_VOLUME_FACTORS = [
+    'past_1m_return', 'past_1w_return', 'past_3m_return', 'past_6m_return',
+    'past_12m_return', 'momentum_12m_to_1m', 'high_to_current_ratio',
+    'avg_turnover_20d', 'price_volume_correlation', 'aroon_up', 'aroon_down',
+    'aroon_diff', 'volatility_20d', 'atr_20d', 'atr_normalized',
+    'deviation_from_ma20', 'deviation_from_ma50', 'deviation_from_ma200',
+    'ma_alignment_score', 'up_down_ratio', 'gains_losses_ratio',
+]
+MICROSTRUCTURE_FACTORS = [
+    'beta', 'benchmark_correlation', 'idiosyncratic_volatility', 'amihud_illiquidity', 'return_skewness',
+    'max_daily_return', 'stock_price', 'log_price', 'turnover_volatility',
+]
+TECHNICAL_FACTORS = ['rsi', 'bollinger_position', 'bollinger_bandwidth']
+PANEL_FACTORS = PRICE_VOLUME_FACTORS + MICROSTRUCTURE_FACTORS + TECHNICAL_FACTORS
+
+PANEL_FIELDS = ("Price", "High", "Low", "Volume")
+
+# Longest lookback used by any factor (12-month return / microstructure)
+_MAX_LOOKBACK = 252
+AROON_PERIOD = 20
+
+# Bump when a factor formula changes, so cached histories are rebuilt
+FACTOR_HISTORY_VERSION = 2
+# Minimum calendar days of bars loaded before a date (comfortably > _MAX_LOOKBACK + 1 trading days)
+_WARMUP_DAYS = 400
+# Dates evaluated per batch of trailing windows in compute_factor_history
+_HISTORY_CHUNK = 512
+# Relative price change on the anchor bar that means history was re-adjusted
+_ADJUSTMENT_TOLERANCE = 1e-6
+
+
+def panel_from_frames(frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """Align per-ticker price frames into one (dates x tickers) frame per field.
+
+    "Price" is Adj Close when a frame has it, otherwise Close, as in the
+    single-symbol factors.
+    """
+    fields = {field: {} for field in PANEL_FIELDS}
+    for ticker, frame in frames.items():
+        price_col = 'Adj Close' if 'Adj Close' in frame.columns else 'Close'
+        fields["Price"][ticker] = frame[price_col]
+        for field in ("High", "Low", "Volume"):
+            if field in frame.columns:
+                fields[field][ticker] = frame[field]
+
+    tickers = list(frames)
+    panel = {}
+    for field, columns in fields.items():
+        aligned = pd.DataFrame(columns, columns=tickers, dtype="float64")
+        panel[field] = aligned.sort_index()
+    dates = panel["Price"].index
+    for field in ("High", "Low", "Volume"):
+        panel[field] = panel[field].reindex(dates)
+    return panel
+
+
+def load_price_panel(
+    tickers: Annotated[Iterable[str], "ticker symbols"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+    max_workers: Annotated[int, "concurrent per-ticker loads"] = 8,
+) -> Tuple[Dict[str, pd.DataFrame], List[str]]:
+    """Load and align bars for many tickers. Returns (panel, tickers that failed to load)."""
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    frames, failed = {}, []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="factor-panel") as executor:
+        futures = {ticker: executor.submit(get_stock_frame, ticker, start_date, end_date) for ticker in tickers}
+    for ticker, future in futures.items():
+        if future.exception() is not None or future.result().empty:
+            failed.append(ticker)
+        else:
+            frames[ticker] = future.result()
+    return panel_from_frames(frames), failed
+
+
+def _align_trailing(panel: Dict[str, pd.DataFrame]) -> tuple:
+    """Move each column's priced rows to the bottom, keeping their order.
+
+    Returns (price, high, low, volume, day numbers, priced-bar counts) over
+    exactly the trailing _MAX_LOOKBACK + 1 bars, padded at the top with NaN
+    so every lookback slice exists. Older bars are dropped, so every factor
+    (the full-window regressions and skew included) sees the same window as
+    compute_factor_history does for that date.
+    """
+    price = panel["Price"].to_numpy(dtype="float64")
+    rows, columns = price.shape
+    days = panel["Price"].index.to_numpy(dtype="datetime64[D]").astype(np.int64).astype("float64")
+
+    priced = ~np.isnan(price)
+    # Stable sort on the mask puts unpriced rows first without reordering the rest
+    order = np.argsort(priced, axis=0, kind="stable")
+    priced = np.take_along_axis(priced, order, axis=0)
+
+    def arrange(values):
+        values = np.take_along_axis(values, order, axis=0)
+        values[~priced] = np.nan
+        return values
+
+    arrays = [arrange(price)]
+    for field in ("High", "Low", "Volume"):
+        arrays.append(arrange(panel[field].to_numpy(dtype="float64")))
+    arrays.append(arrange(np.broadcast_to(days[:, None], (rows, columns)).copy()))
+
+    width = _MAX_LOOKBACK + 1
+    pad = max(0, width - rows)
+    if pad:
+        arrays = [np.vstack([np.full((pad, columns), np.nan), values]) for values in arrays]
+    arrays = [values[-width:] for values in arrays]
+    return (*arrays, np.minimum(priced.sum(axis=0), width))
+
+
+def lookback_start(curr_date: str, look_back_days: int = _MAX_LOOKBACK) -> str:
+    """First calendar date to load so the bars up to curr_date cover every factor.
+
+    look_back_days counts trading days; at least _MAX_LOOKBACK + 1 bars are
+    always loaded, so the 12-month and microstructure factors have their
+    full window.
+    """
+    # About 252 trading days per 365 calendar days, plus room for holidays
+    days = max(_WARMUP_DAYS, int(np.ceil(look_back_days * 365 / 252)) + 30)
+    return (pd.Timestamp(curr_date) - pd.Timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def _returns(values: np.ndarray) -> np.ndarray:
+    return values[1:] / values[:-1] - 1
+
+
+def _nanmean(values: np.ndarray) -> np.ndarray:
+    """Column means skipping NaN; NaN (without a warning) for an all-NaN column."""
+    valid = ~np.isnan(values)
+    return np.where(valid, values, 0).sum(axis=0) / valid.sum(axis=0)
+
+
+def _benchmark_at(benchmark: Optional[pd.Series], days: np.ndarray) -> np.ndarray:
+    """Benchmark price on (or last before) each day number; NaN where unknown."""
+    if benchmark is None or benchmark.empty:
+        return np.full(days.shape, np.nan)
+    benchmark = benchmark.dropna().sort_index()
+    benchmark_days = benchmark.index.to_numpy(dtype="datetime64[D]").astype(np.int64)
+    position = np.searchsorted(benchmark_days, np.nan_to_num(days, nan=-1), side="right") - 1
+    prices = benchmark.to_numpy(dtype="float64")[np.clip(position, 0, None)]
+    return np.where((position >= 0) & ~np.isnan(days), prices, np.nan)
+
+
+def _benchmark_regression(returns: np.ndarray, market_returns: np.ndarray) -> tuple:
+    """Per-column OLS of returns on market returns over the rows where both exist.
+
+    Returns (beta, correlation, annualized residual volatility in %).
+    """
+    valid = ~np.isnan(returns) & ~np.isnan(market_returns)
+    n = valid.sum(axis=0)
+    y = np.where(valid, returns, 0)
+    x = np.where(valid, market_returns, 0)
+    dy = np.where(valid, y - y.sum(axis=0) / n, 0)
+    dx = np.where(valid, x - x.sum(axis=0) / n, 0)
+    sxx = (dx * dx).sum(axis=0)
+    syy = (dy * dy).sum(axis=0)
+    sxy = (dx * dy).sum(axis=0)
+    beta = sxy / sxx
+    correlation = sxy / np.sqrt(sxx * syy)
+    residual_variance = np.clip(syy - beta * sxy, 0, None) / (n - 2)
+    residual_volatility = np.sqrt(residual_variance * 252) * 100
+    enough = n > 2
+    return (
+        np.where(enough, beta, np.nan),
+        np.where(enough, correlation, np.nan),
+        np.where(enough, residual_volatility, np.nan),
+    )
+
+
+def _column_std(values: np.ndarray) -> np.ndarray:
+    """Sample standard deviation per column, skipping NaN (as Series.std does)."""
+    return pd.DataFrame(values).std().to_numpy()
+
+
+def compute_factor_panel(
+    panel: Dict[str, pd.DataFrame],
+    benchmark: Optional[pd.Series] = None,
+) -> pd.DataFrame:
+    """All price/volume, microstructure and technical factors on the latest bar of every ticker.
+
+    benchmark is the market's price series (see dataflows.benchmark); each
+    ticker is regressed on it over the ticker's own trading days. Without
+    it, beta and benchmark_correlation are NaN and idiosyncratic_volatility
+    falls back to total volatility.
+
+    Returns a (tickers x PANEL_FACTORS) frame; a factor is NaN where a
+    ticker has too few bars for it.
+    """
+    tickers = list(panel["Price"].columns)
+    if not tickers:
+        return pd.DataFrame(columns=PANEL_FACTORS, dtype="float64")
+
+    price, high, low, volume, days, count = _align_trailing(panel)
+    market = _benchmark_at(benchmark, days) if benchmark is not None else None
+    f = _factor_arrays(price, high, low, volume, days, count, market)
+    return pd.DataFrame({name: f[name] for name in PANEL_FACTORS}, index=pd.Index(tickers, name="Ticker"))
+
+
+def _factor_arrays(price, high, low, volume, days, count, market=None) -> Dict[str, np.ndarray]:
+    """Factors on the last row of every column of trailing-aligned arrays (see _align_trailing).
+
+    market, when given, holds the benchmark price on each cell's date.
+    """
+    columns = price.shape[1]
+    has_volume = (~np.isnan(volume)).any(axis=0)
+    has_range = (~np.isnan(high)).any(axis=0) & (~np.isnan(low)).any(axis=0)
+    current = price[-1]
+    f = {}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # ---- Price and volume ----
+        f['past_1m_return'] = (current / price[-20] - 1) * 100
+        f['past_1w_return'] = (current / price[-5] - 1) * 100
+        f['past_3m_return'] = np.where(count >= 60, (current / price[-60] - 1) * 100, np.nan)
+        f['past_6m_return'] = np.where(count >= 120, (current / price[-120] - 1) * 100, np.nan)
+        f['past_12m_return'] = np.where(count >= 252, (current / price[-252] - 1) * 100, np.nan)
+        f['momentum_12m_to_1m'] = np.where(count >= 252, (price[-20] / price[-252] - 1) * 100, np.nan)
+        f['high_to_current_ratio'] = price[-20:].max(axis=0) / current
+
+        recent_volume = volume[-20:]
+        full_volume = (~np.isnan(recent_volume)).sum(axis=0) == 20
+        f['avg_turnover_20d'] = np.where(full_volume, _nanmean(recent_volume) / 1000000, np.nan)
+
+        price_changes = pd.DataFrame(_returns(price[-20:]))
+        volume_changes = pd.DataFrame(_returns(recent_volume))
+        f['price_volume_correlation'] = np.where(
+            has_volume, price_changes.corrwith(volume_changes).to_numpy(), np.nan
+        )
+
+        # Aroon: calendar days since the high/low of the last period + 1 bars
+        window = price[-(AROON_PERIOD + 1):]
+        window_days = days[-(AROON_PERIOD + 1):]
+        column_index = np.arange(columns)
+        safe_window = np.where(np.isnan(window), -np.inf, window)
+        days_since_high = window_days[-1] - window_days[np.argmax(safe_window, axis=0), column_index]
+        safe_window = np.where(np.isnan(window), np.inf, window)
+        days_since_low = window_days[-1] - window_days[np.argmin(safe_window, axis=0), column_index]
+        enough_for_aroon = count > AROON_PERIOD
+        f['aroon_up'] = np.where(enough_for_aroon, (AROON_PERIOD - days_since_high) / AROON_PERIOD * 100, np.nan)
+        f['aroon_down'] = np.where(enough_for_aroon, (AROON_PERIOD - days_since_low) / AROON_PERIOD * 100, np.nan)
+        f['aroon_diff'] = f['aroon_up'] - f['aroon_down']
+
+        recent_returns = _returns(price[-20:])
+        f['volatility_20d'] = recent_returns.std(axis=0, ddof=1) * np.sqrt(252) * 100
+
+        recent_close = price[-20:]
+        prev_close = np.vstack([np.full((1, columns), np.nan), recent_close[:-1]])
+        true_range = np.fmax(
+            high[-20:] - low[-20:],
+            np.fmax(np.abs(high[-20:] - prev_close), np.abs(low[-20:] - prev_close)),
+        )
+        f['atr_20d'] = np.where(has_range, _nanmean(true_range), np.nan)
+        f['atr_normalized'] = np.where(current > 0, f['atr_20d'] / current * 100, np.nan)
+
+        moving_averages = {w: price[-w:].mean(axis=0) for w in (5, 20, 50, 200)}
+        for w in (20, 50, 200):
+            deviation = (current - moving_averages[w]) / moving_averages[w] * 100
+            f[f'deviation_from_ma{w}'] = np.where(count >= w, deviation, np.nan)
+        ma_5, ma_20, ma_50, ma_200 = (moving_averages[w] for w in (5, 20, 50, 200))
+        alignment = np.where(
+            (ma_5 > ma_20) & (ma_20 > ma_50) & (ma_50 > ma_200), 1.0,
+            np.where((ma_5 < ma_20) & (ma_20 < ma_50) & (ma_50 < ma_200), -1.0, 0.0),
+        )
+        f['ma_alignment_score'] = np.where(count >= 200, alignment, np.nan)
+
+        up_days = (recent_returns > 0).sum(axis=0)
+        down_days = (recent_returns < 0).sum(axis=0)
+        f['up_down_ratio'] = np.where(down_days > 0, up_days / down_days, up_days)
+        gains = np.where(recent_returns > 0, recent_returns, 0).sum(axis=0)
+        losses = np.abs(np.where(recent_returns < 0, recent_returns, 0).sum(axis=0))
+        f['gains_losses_ratio'] = np.where(losses > 0, gains / losses, gains)
+
+        for name in PRICE_VOLUME_FACTORS:
+            f[name] = np.where(count >= 20, f[name], np.nan)
+
+        # ---- Microstructure and risk (a full year of bars) ----
+        all_returns = _returns(price)
+        if market is None:
+            f['beta'] = np.full(columns, np.nan)
+            f['benchmark_correlation'] = np.full(columns, np.nan)
+            f['idiosyncratic_volatility'] = _column_std(all_returns) * np.sqrt(252) * 100
+        else:
+            # Market return between the same two bars as each stock return
+            market_returns = np.where(np.isnan(all_returns), np.nan, _returns(market))
+            f['beta'], f['benchmark_correlation'], f['idiosyncratic_volatility'] = _benchmark_regression(
+                all_returns, market_returns
+            )
+        dollar_volume = price[-19:] * volume[-19:]
+        amihud = _nanmean(np.abs(recent_returns) / dollar_volume) * 1e6
+        f['amihud_illiquidity'] = np.where(has_volume, amihud, np.nan)
+        f['return_skewness'] = pd.DataFrame(all_returns).skew().to_numpy()
+        f['max_daily_return'] = recent_returns.max(axis=0) * 100
+        f['stock_price'] = current
+        f['log_price'] = np.log(current)
+        f['turnover_volatility'] = np.where(has_volume, _column_std(_returns(recent_volume)) * 100, np.nan)
+        for name in MICROSTRUCTURE_FACTORS:
+            f[name] = np.where(count >= 252, f[name], np.nan)
+
+        # ---- Technical ----
+        # 14-period RSI from simple averages; a missing first change counts as 0
+        delta = np.nan_to_num(np.diff(price[-15:], axis=0), nan=0.0)
+        gain = np.clip(delta, 0, None).mean(axis=0)
+        loss = np.clip(-delta, 0, None).mean(axis=0)
+        f['rsi'] = 100 - (100 / (1 + gain / loss))
+        ma_20 = moving_averages[20]
+        std_20 = price[-20:].std(axis=0, ddof=1)
+        upper_band = ma_20 + 2 * std_20
+        lower_band = ma_20 - 2 * std_20
+        f['bollinger_position'] = np.where(
+            upper_band != lower_band, (current - lower_band) / (upper_band - lower_band), np.nan
+        )
+        f['bollinger_bandwidth'] = (upper_band - lower_band) / ma_20 * 100
+        f['rsi'] = np.where(count >= 14, f['rsi'], np.nan)
+        for name in ('bollinger_position', 'bollinger_bandwidth'):
+            f[name] = np.where(count >= 20, f[name], np.nan)
+    return f
+
+
+def cross_sectional_ranks(factors: pd.DataFrame) -> pd.DataFrame:
+    """Percentile rank (0-1] of every ticker within each factor; NaN stays NaN."""
+    return factors.rank(pct=True)
+
+
+def cross_sectional_zscores(factors: pd.DataFrame) -> pd.DataFrame:
+    """(value - cross-sectional mean) / cross-sectional std for each factor."""
+    std = factors.std(ddof=0).replace(0, np.nan)
+    return (factors - factors.mean()) / std
+
+
+def screen_universe(
+    tickers: Annotated[Iterable[str], "ticker symbols"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    look_back_days: Annotated[int, "trading days to look back for calculations"] = 252,
+    prefetch: Annotated[bool, "batch-download missing bars into the OHLCV store first"] = True,
+) -> dict:
+    """Factors, ranks and z-scores for a whole universe on curr_date.
+
+    Returns {"factors", "ranks", "zscores"} (tickers x factors frames) and
+    "failed" (tickers whose bars could not be loaded).
+    """
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    start_date = lookback_start(curr_date, look_back_days)
+
+    if prefetch:
+        from tradingagents.dataflows.interface import get_category_for_method, get_vendor
+        from tradingagents.dataflows.ohlcv_store import prefetch as prefetch_ohlcv
+
+        vendors = get_vendor(get_category_for_method("get_stock_frame"), "get_stock_frame")
+        if "yfinance" in [v.strip() for v in vendors.split(",")]:
+            # One batched download instead of one history request per ticker
+            prefetch_ohlcv(tickers, start_date, curr_date)
+
+    panel, failed = load_price_panel(tickers, start_date, curr_date)
+    factors = compute_factor_panel(panel, load_benchmark(start_date, curr_date))
+    return {
+        "factors": factors,
+        "ranks": cross_sectional_ranks(factors),
+        "zscores": cross_sectional_zscores(factors),
+        "failed": failed,
+    }
+
+
+def factor_row(df: pd.DataFrame, benchmark: Optional[pd.Series] = None) -> pd.Series:
+    """Panel factors for a single symbol's price frame."""
+    return compute_factor_panel(panel_from_frames({"_": df}), benchmark).iloc[0]
+
+
+def load_benchmark(start_date: str, end_date: str) -> Optional[pd.Series]:
+    """The shared benchmark series, or None when it cannot be loaded."""
+    try:
+        prices = get_benchmark_prices(start_date, end_date)
+    except Exception:
+        return None
+    return prices if not prices.empty else None
+
+
+def compute_factor_history(
+    df: Annotated[pd.DataFrame, "daily bars of one symbol, indexed by date"],
+    start_date: Annotated[Optional[str], "first date to evaluate, yyyy-mm-dd (default: all bars)"] = None,
+    benchmark: Annotated[Optional[pd.Series], "benchmark prices for beta / residual volatility"] = None,
+) -> pd.DataFrame:
+    """PANEL_FACTORS on every trading date of df, one row per date.
+
+    Each date sees the trailing _MAX_LOOKBACK + 1 bars up to and including
+    it, so a row equals factor_row on that window (with the same
+    benchmark), and beta / correlation / residual volatility form rolling
+    regressions. Bars before start_date only serve as warm-up.
+    """
+    price_col = 'Adj Close' if 'Adj Close' in df.columns else 'Close'
+    df = df[df[price_col].notna()]
+    first = 0 if start_date is None else int(df.index.searchsorted(pd.Timestamp(start_date)))
+    if first >= len(df):
+        return pd.DataFrame(columns=PANEL_FACTORS, index=pd.DatetimeIndex([], name="Date"), dtype="float64")
+
+    def field(column):
+        if column not in df.columns:
+            return np.full(len(df), np.nan)
+        return df[column].to_numpy(dtype="float64")
+
+    days = df.index.to_numpy(dtype="datetime64[D]").astype(np.int64).astype("float64")
+    width = _MAX_LOOKBACK + 1
+    # Row i of each view is the window ending on bar i, NaN-padded before the first bar
+    fields = [field(price_col), field("High"), field("Low"), field("Volume"), days]
+    if benchmark is not None:
+        fields.append(_benchmark_at(benchmark, days))
+    windows = [
+        sliding_window_view(np.concatenate([np.full(width - 1, np.nan), values]), width)
+        for values in fields
+    ]
+    count = np.minimum(np.arange(1, len(df) + 1), width)
+
+    chunks = []
+    for lo in range(first, len(df), _HISTORY_CHUNK):
+        hi = min(lo + _HISTORY_CHUNK, len(df))
+        price, high, low, volume, window_days, *market = (window[lo:hi].T for window in windows)
+        f = _factor_arrays(price, high, low, volume, window_days, count[lo:hi], *market)
+        chunks.append(pd.DataFrame({name: f[name] for name in PANEL_FACTORS}, index=df.index[lo:hi]))
+    history = pd.concat(chunks)
+    history.index.name = "Date"
+    return history
+
+
+def _warmup_start(date: str) -> str:
+    return lookback_start(date)
+
+
+def _anchor(df: pd.DataFrame, through: str) -> dict:
+    """Last bar on or before `through`, used to detect re-adjusted history later."""
+    price_col = 'Adj Close' if 'Adj Close' in df.columns else 'Close'
+    prices = df.loc[df.index <= pd.Timestamp(through), price_col].dropna()
+    if prices.empty:
+        return {}
+    return {"anchor_date": prices.index[-1].strftime("%Y-%m-%d"), "anchor_price": float(prices.iloc[-1])}
+
+
+def _history_adjusted(df: pd.DataFrame, meta: dict) -> bool:
+    if "anchor_date" not in meta:
+        return False
+    price_col = 'Adj Close' if 'Adj Close' in df.columns else 'Close'
+    anchor = pd.Timestamp(meta["anchor_date"])
+    if anchor not in df.index:
+        return True
+    price = df.at[anchor, price_col]
+    return bool(abs(price - meta["anchor_price"]) > _ADJUSTMENT_TOLERANCE * abs(meta["anchor_price"]))
+
+
+def _today() -> pd.Timestamp:
+    return pd.Timestamp.today().normalize()
+
+
+def _extend(cached: pd.DataFrame, meta: dict, bars: pd.DataFrame, benchmark: Optional[pd.Series]) -> pd.DataFrame:
+    """The cached rows through meta["through"] followed by the dates after it computed from bars."""
+    next_day = (pd.Timestamp(meta["through"]) + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    kept = cached[cached.index <= pd.Timestamp(meta["through"])]
+    fresh = compute_factor_history(bars, next_day, benchmark)
+    return pd.concat([kept, fresh]) if not fresh.empty else kept
+
+
+def _uncached_history(symbol: str, start_date: str, end_date: str, cached: pd.DataFrame, meta: dict) -> pd.DataFrame:
+    """start_date..end_date without a benchmark for the dates the cache lacks; nothing is written."""
+    if start_date >= meta["start"]:
+        bars = get_stock_frame(symbol, _warmup_start(meta["through"]), end_date)
+        if not _history_adjusted(bars, meta):
+            history = _extend(cached, meta, bars, None)
+            return history.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+    bars = get_stock_frame(symbol, _warmup_start(start_date), end_date)
+    return compute_factor_history(bars, start_date, None)
+
+
+def get_factor_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+) -> pd.DataFrame:
+    """Factor time series (trading dates x PANEL_FACTORS) for start_date..end_date.
+
+    Served from the factor cache when it covers the range, without loading
+    the benchmark. Otherwise only the missing dates are computed (with their
+    warm-up bars) and appended; the whole history is rebuilt when the range
+    starts before the cached one, the formulas changed
+    (FACTOR_HISTORY_VERSION), the bars were re-adjusted for a split or
+    dividend, or the benchmark in use differs from the one the cache was
+    built with. A rebuild never shrinks the cached range. When the benchmark
+    cannot be loaded, a cache built with it is kept as is and the missing
+    dates are computed for this call only.
+    """
+    symbol = symbol.upper()
+    if not get_factor_cache_config()["enabled"]:
+        bars = get_stock_frame(symbol, _warmup_start(start_date), end_date)
+        return compute_factor_history(bars, start_date, load_benchmark(_warmup_start(start_date), end_date))
+
+    # Dates up to yesterday are final; today's bar may still change, so a
+    # range reaching today is recomputed once per day ("checked_on")
+    today = _today()
+    yesterday = (today - pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    today = today.strftime("%Y-%m-%d")
+    live_end = min(end_date, today)
+    with factor_lock(symbol):
+        cached, meta = read_factors(symbol)
+        # A cache built without a benchmark (it could not be loaded) stays
+        # usable until the next recomputation picks the benchmark up
+        usable = (
+            cached is not None
+            and meta.get("version") == FACTOR_HISTORY_VERSION
+            and meta.get("benchmark") in (None, get_benchmark_symbol())
+        )
+        if usable and meta["start"] <= start_date and (
+            live_end <= meta["through"]
+            or (meta.get("checked_on") == today and live_end <= meta.get("checked_through", ""))
+        ):
+            return cached.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+
+        # Whatever was cached before is kept covered by any recomputation
+        history_start, history_end = start_date, end_date
+        if cached is not None and "start" in meta:
+            history_start = min(start_date, meta["start"])
+            history_end = max(end_date, meta["through"])
+
+        benchmark = load_benchmark(_warmup_start(history_start), history_end)
+        benchmark_key = get_benchmark_symbol() if benchmark is not None else None
+        if benchmark is None and usable and meta.get("benchmark") is not None:
+            # Transient benchmark failure: answer without overwriting a good cache
+            return _uncached_history(symbol, start_date, end_date, cached, meta)
+
+        current = usable and meta.get("benchmark") == benchmark_key
+        if not current or start_date < meta["start"] or end_date > meta["through"]:
+            bars = None
+            if current and start_date >= meta["start"]:
+                # Extend: only the dates after the cached range
+                bars = get_stock_frame(symbol, _warmup_start(meta["through"]), history_end)
+                if _history_adjusted(bars, meta):
+                    bars = None
+                else:
+                    cached = _extend(cached, meta, bars, benchmark)
+            if bars is None:
+                bars = get_stock_frame(symbol, _warmup_start(history_start), history_end)
+                cached = compute_factor_history(bars, history_start, benchmark)
+
+            through = min(history_end, yesterday)
+            if current:
+                through = max(through, meta["through"])
+            meta = {
+                "version": FACTOR_HISTORY_VERSION,
+                "start": history_start,
+                "through": through,
+                "benchmark": benchmark_key,
+                "checked_on": today,
+                "checked_through": min(history_end, today),
+                **_anchor(bars, through),
+            }
+            write_factors(symbol, cached, meta)
+
+    return cached.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+
+
+def get_factors_as_of(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+) -> pd.Series:
+    """Factors on the last trading date on or before curr_date (empty if none).
+
+    For a backtest, call get_factor_history once for the whole test period
+    first; every lookup after that is a read from the cached frame.
+    """
+    history = get_factor_history(
+        symbol, (pd.Timestamp(curr_date) - pd.Timedelta(days=10)).strftime("%Y-%m-%d"), curr_date
+    )
+    if history.empty:
+        return pd.Series(dtype="float64", name=pd.Timestamp(curr_date))
+    return history.iloc[-1]
@@ -14,15 +14,26 @@ from langchain_core.tools import tool
 from typing import Annotated
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.frames import get_stock_frame
+from tradingagents.agents.utils.alpha_factor_panel import (
+    MICROSTRUCTURE_FACTORS,
+    PRICE_VOLUME_FACTORS,
+    PANEL_FACTORS,
+    TECHNICAL_FACTORS,
+    factor_row,
+    load_benchmark,
+    lookback_start,
+    screen_universe,
+)
 
 
 @tool
 def get_alpha_factors(
     symbol: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
-    look_back_days: Annotated[int, "how many days to look back for calculations"] = 252,
+    look_back_days: Annotated[int, "how many trading days to look back for calculations"] = 252,
 ) -> str:
     """
     Calculate comprehensive alpha factors for a given stock.
@@ -30,7 +41,7 @@ def get_alpha_factors(
     Args:
         symbol: Ticker symbol of the company
         curr_date: Current trading date in YYYY-mm-dd format
-        look_back_days: Number of days to look back (default 252 for 1 year)
+        look_back_days: Number of trading days to look back (default 252 for 1 year)
     
     Returns:
         str: A comprehensive report of all calculated alpha factors organized by category
@@ -38,43 +49,14 @@ def get_alpha_factors(
     try:
         # Calculate end date and start date
         end_date = datetime.strptime(curr_date, "%Y-%m-%d")
-        start_date = end_date - timedelta(days=look_back_days + 60)  # Extra buffer for calculations
+        # At least a full year of bars, so the 12-month and risk factors have their window
+        start_date = lookback_start(curr_date, look_back_days)
         
-        # Get stock data
-        stock_data_str = route_to_vendor("get_stock_data", symbol, 
-                                        start_date.strftime("%Y-%m-%d"),
-                                        end_date.strftime("%Y-%m-%d"))
-        
-        # Parse stock data
-        lines = stock_data_str.split('\n')
-        data_lines = [l for l in lines if l and not l.startswith('#')]
-        if not data_lines:
+        # Get stock data as a typed frame (DatetimeIndex, float columns)
+        df = get_stock_frame(symbol, start_date, curr_date)
+        if df.empty:
             return f"Error: No stock data available for {symbol}"
         
-        # Parse CSV data
-        try:
-            df = pd.read_csv(pd.StringIO('\n'.join(data_lines)))
-            if 'Date' in df.columns:
-                df['Date'] = pd.to_datetime(df['Date'])
-                df = df.set_index('Date').sort_index()
-            elif df.index.name == 'Date' or isinstance(df.index, pd.DatetimeIndex):
-                # Already has Date index
-                if not isinstance(df.index, pd.DatetimeIndex):
-                    df.index = pd.to_datetime(df.index)
-                df = df.sort_index()
-            else:
-                # Try to use first column as date if it looks like dates
-                first_col = df.columns[0]
-                try:
-                    df[first_col] = pd.to_datetime(df[first_col])
-                    df = df.set_index(first_col).sort_index()
-                except:
-                    # If that fails, just use the index
-                    df.index = pd.to_datetime(df.index, errors='coerce')
-                    df = df.sort_index()
-        except Exception as e:
-            return f"Error parsing stock data for {symbol}: {str(e)}"
-        
         # Filter to current date
         df = df[df.index <= end_date]
         if len(df) < 20:
@@ -86,11 +68,18 @@ def get_alpha_factors(
         except:
             fundamentals_str = ""
         
+        # Price, volume, risk and technical factors all come from one panel row;
+        # the risk factors regress on the benchmark shared by every ticker
+        benchmark = None
+        if len(df) >= 252:
+            benchmark = load_benchmark(df.index[0].strftime("%Y-%m-%d"), df.index[-1].strftime("%Y-%m-%d"))
+        row = factor_row(df, benchmark)
+        
         # Calculate all alpha factors
         factors = {}
         
         # ========== I. PRICE AND VOLUME FACTORS ==========
-        factors.update(_calculate_price_volume_factors(df, curr_date))
+        factors.update(_calculate_price_volume_factors(row, curr_date))
         
         # ========== II. FUNDAMENTAL FACTORS ==========
         factors.update(_calculate_fundamental_factors(symbol, curr_date, fundamentals_str))
@@ -99,7 +88,7 @@ def get_alpha_factors(
         factors.update(_calculate_analyst_factors(symbol, curr_date))
         
         # ========== IV. MARKET MICROSTRUCTURE AND RISK FACTORS ==========
-        factors.update(_calculate_microstructure_factors(df, curr_date))
+        factors.update(_calculate_microstructure_factors(row, curr_date))
         
         # ========== V. CORPORATE ACTIONS AND FUND FLOW FACTORS ==========
         factors.update(_calculate_corporate_action_factors(symbol, curr_date))
@@ -108,7 +97,7 @@ def get_alpha_factors(
         factors.update(_calculate_industry_style_factors(symbol, df, curr_date))
         
         # ========== VII. TECHNICAL PATTERNS AND COMPLEX INDICATORS ==========
-        factors.update(_calculate_technical_patterns(df, curr_date))
+        factors.update(_calculate_technical_patterns(row, curr_date))
         
         # Format output report
         return _format_alpha_factors_report(factors, symbol, curr_date)
@@ -117,164 +106,68 @@ def get_alpha_factors(
         return f"Error calculating alpha factors for {symbol}: {str(e)}"
 
 
-def _calculate_price_volume_factors(df: pd.DataFrame, curr_date: str) -> dict:
-    """Calculate Price and Volume Factors"""
-    factors = {}
-    
-    if len(df) < 20:
-        return factors
-    
-    # Use Close price (or Adj Close if available)
-    price_col = 'Adj Close' if 'Adj Close' in df.columns else 'Close'
-    volume_col = 'Volume' if 'Volume' in df.columns else None
-    
-    prices = df[price_col].dropna()
-    if len(prices) < 20:
-        return factors
-    
-    current_price = prices.iloc[-1]
-    current_date = prices.index[-1]
-    
-    # 1. Past 1-Month Return
-    if len(prices) >= 20:
-        month_ago_price = prices.iloc[-20] if len(prices) >= 20 else prices.iloc[0]
-        factors['past_1m_return'] = (current_price / month_ago_price - 1) * 100
-    
-    # 2. Past 1-Week Return
-    if len(prices) >= 5:
-        week_ago_price = prices.iloc[-5]
-        factors['past_1w_return'] = (current_price / week_ago_price - 1) * 100
-    
-    # 3. Past 3-Month Return
-    if len(prices) >= 60:
-        quarter_ago_price = prices.iloc[-60]
-        factors['past_3m_return'] = (current_price / quarter_ago_price - 1) * 100
-    
-    # 4. Past 6-Month Return
-    if len(prices) >= 120:
-        half_year_price = prices.iloc[-120]
-        factors['past_6m_return'] = (current_price / half_year_price - 1) * 100
-    
-    # 5. Past 12-Month Return
-    if len(prices) >= 252:
-        year_ago_price = prices.iloc[-252]
-        factors['past_12m_return'] = (current_price / year_ago_price - 1) * 100
-    
-    # 6. Cumulative Return from Month -12 to Month -1 (excluding most recent month)
-    if len(prices) >= 252:
-        month_12_ago = prices.iloc[-252]
-        month_1_ago = prices.iloc[-20] if len(prices) >= 20 else prices.iloc[-1]
-        factors['momentum_12m_to_1m'] = (month_1_ago / month_12_ago - 1) * 100
-    
-    # 7. Past 1-Month High Price / Current Price
-    if len(prices) >= 20:
-        month_high = prices.iloc[-20:].max()
-        factors['high_to_current_ratio'] = month_high / current_price
-    
-    # 8. Average Turnover Rate over Past 20 Days
-    if volume_col and volume_col in df.columns:
-        volumes = df[volume_col].dropna()
-        if len(volumes) >= 20:
-            recent_volumes = volumes.iloc[-20:]
-            # Estimate shares outstanding (simplified - using average volume as proxy)
-            avg_volume = recent_volumes.mean()
-            # Turnover rate approximation
-            factors['avg_turnover_20d'] = avg_volume / 1000000  # Normalized
-    
-    # 9. Price-Volume Correlation
-    if volume_col and volume_col in df.columns:
-        if len(df) >= 20:
-            recent_df = df.iloc[-20:]
-            price_changes = recent_df[price_col].pct_change().dropna()
-            volume_changes = recent_df[volume_col].pct_change().dropna()
-            if len(price_changes) > 1 and len(volume_changes) > 1:
-                common_idx = price_changes.index.intersection(volume_changes.index)
-                if len(common_idx) > 1:
-                    factors['price_volume_correlation'] = price_changes.loc[common_idx].corr(
-                        volume_changes.loc[common_idx]
-                    )
-    
-    # 10. Aroon Up Indicator
-    if len(prices) >= 20:
-        period = 20
-        aroon_up = []
-        for i in range(period, len(prices)):
-            period_prices = prices.iloc[i-period:i+1]
-            highest_idx = period_prices.idxmax()
-            days_since_high = (prices.index[i] - highest_idx).days
-            aroon_value = ((period - days_since_high) / period) * 100
-            aroon_up.append(aroon_value)
-        if aroon_up:
-            factors['aroon_up'] = aroon_up[-1]
-    
-    # 11. Aroon Down Indicator
-    if len(prices) >= 20:
-        period = 20
-        aroon_down = []
-        for i in range(period, len(prices)):
-            period_prices = prices.iloc[i-period:i+1]
-            lowest_idx = period_prices.idxmin()
-            days_since_low = (prices.index[i] - lowest_idx).days
-            aroon_value = ((period - days_since_low) / period) * 100
-            aroon_down.append(aroon_value)
-        if aroon_down:
-            factors['aroon_down'] = aroon_down[-1]
-            factors['aroon_diff'] = factors.get('aroon_up', 0) - factors.get('aroon_down', 0)
-    
-    # 12. 20-Day Price Volatility
-    if len(prices) >= 20:
-        recent_returns = prices.iloc[-20:].pct_change().dropna()
-        factors['volatility_20d'] = recent_returns.std() * np.sqrt(252) * 100  # Annualized
-    
-    # 13. 20-Day Average True Range (ATR)
-    if 'High' in df.columns and 'Low' in df.columns:
-        if len(df) >= 20:
-            recent_df = df.iloc[-20:]
-            high_low = recent_df['High'] - recent_df['Low']
-            high_close = abs(recent_df['High'] - recent_df[price_col].shift(1))
-            low_close = abs(recent_df['Low'] - recent_df[price_col].shift(1))
-            true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            factors['atr_20d'] = true_range.mean()
-            if current_price > 0:
-                factors['atr_normalized'] = factors['atr_20d'] / current_price * 100
-    
-    # 14. Deviation from 20-Day Moving Average
-    if len(prices) >= 20:
-        ma_20 = prices.iloc[-20:].mean()
-        factors['deviation_from_ma20'] = ((current_price - ma_20) / ma_20) * 100
-    
-    # 15. Deviation from 50-Day Moving Average
-    if len(prices) >= 50:
-        ma_50 = prices.iloc[-50:].mean()
-        factors['deviation_from_ma50'] = ((current_price - ma_50) / ma_50) * 100
-    
-    # 16. Deviation from 200-Day Moving Average
-    if len(prices) >= 200:
-        ma_200 = prices.iloc[-200:].mean()
-        factors['deviation_from_ma200'] = ((current_price - ma_200) / ma_200) * 100
-    
-    # 17. Multi-MA Alignment
-    if len(prices) >= 200:
-        ma_5 = prices.iloc[-5:].mean() if len(prices) >= 5 else current_price
-        ma_20 = prices.iloc[-20:].mean() if len(prices) >= 20 else current_price
-        ma_50 = prices.iloc[-50:].mean() if len(prices) >= 50 else current_price
-        ma_200 = prices.iloc[-200:].mean()
-        factors['ma_alignment_score'] = 1 if (ma_5 > ma_20 > ma_50 > ma_200) else -1 if (ma_5 < ma_20 < ma_50 < ma_200) else 0
-    
-    # 18. Ratio of Up Days to Down Days
-    if len(prices) >= 20:
-        recent_returns = prices.iloc[-20:].pct_change().dropna()
-        up_days = (recent_returns > 0).sum()
-        down_days = (recent_returns < 0).sum()
-        factors['up_down_ratio'] = up_days / down_days if down_days > 0 else up_days
+@tool
+def screen_alpha_factors(
+    tickers: Annotated[str, "comma-separated ticker symbols to compare, e.g. the company and its peers"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    look_back_days: Annotated[int, "how many trading days to look back for calculations"] = 252,
+) -> str:
+    """
+    Compare the price/volume, risk and technical alpha factors of several stocks on one date.
     
-    # 19. Ratio of Cumulative Gains to Cumulative Losses
-    if len(prices) >= 20:
-        recent_returns = prices.iloc[-20:].pct_change().dropna()
-        gains = recent_returns[recent_returns > 0].sum()
-        losses = abs(recent_returns[recent_returns < 0].sum())
-        factors['gains_losses_ratio'] = gains / losses if losses > 0 else gains
+    Args:
+        tickers: Comma-separated ticker symbols (for example the company and its closest peers)
+        curr_date: Current trading date in YYYY-mm-dd format
+        look_back_days: Number of trading days to look back (default 252 for 1 year)
     
+    Returns:
+        str: A table per factor with each ticker's value and its percentile rank within the group
+    """
+    symbols = [ticker.strip().upper() for ticker in tickers.split(",") if ticker.strip()]
+    if len(symbols) < 2:
+        return "Error: Provide at least two ticker symbols to compare"
+    try:
+        screen = screen_universe(symbols, curr_date, look_back_days)
+    except Exception as e:
+        return f"Error screening alpha factors for {', '.join(symbols)}: {str(e)}"
+    return _format_screen_report(screen, curr_date)
+
+
+def _format_screen_report(screen: dict, curr_date: str) -> str:
+    """Markdown table of factors (rows) by tickers (columns): value and percentile rank."""
+    factors, ranks = screen["factors"], screen["ranks"]
+    report = [f"# Alpha factor screen on {curr_date}", ""]
+    if screen["failed"]:
+        report.append(f"No price data for: {', '.join(screen['failed'])}")
+        report.append("")
+    if factors.empty:
+        report.append("No tickers could be screened.")
+        return "\n".join(report)
+
+    tickers = list(factors.index)
+    report.append("Each cell is the factor value and, in parentheses, its percentile rank within this group.")
+    report.append("")
+    report.append("| Factor | " + " | ".join(tickers) + " |")
+    report.append("|--------|" + "|".join("-------" for _ in tickers) + "|")
+    for name in PANEL_FACTORS:
+        cells = []
+        for ticker in tickers:
+            value = factors.at[ticker, name]
+            cells.append("N/A" if pd.isna(value) else f"{value:.4g} ({ranks.at[ticker, name] * 100:.0f}%)")
+        report.append(f"| {name.replace('_', ' ').title()} | " + " | ".join(cells) + " |")
+    return "\n".join(report)
+
+
+def _panel_view(row: pd.Series, names: list) -> dict:
+    """The named factors of a factor_row, leaving out those the symbol lacks the history for."""
+    return {name: row[name] for name in names if not pd.isna(row[name])}
+
+
+def _calculate_price_volume_factors(row: pd.Series, curr_date: str) -> dict:
+    """Calculate Price and Volume Factors"""
+    factors = _panel_view(row, PRICE_VOLUME_FACTORS)
+    if 'ma_alignment_score' in factors:
+        factors['ma_alignment_score'] = int(factors['ma_alignment_score'])
     return factors
 
 
@@ -283,13 +176,9 @@ def _calculate_fundamental_factors(symbol: str, curr_date: str, fundamentals_str
     factors = {}
     
     try:
-        # Get balance sheet, income statement, and cashflow
-        balance_sheet_str = route_to_vendor("get_balance_sheet", symbol, "quarterly", curr_date)
-        income_str = route_to_vendor("get_income_statement", symbol, "quarterly", curr_date)
-        cashflow_str = route_to_vendor("get_cashflow", symbol, "quarterly", curr_date)
-        
-        # Parse fundamentals data (simplified parsing - would need more robust parsing in production)
-        # For now, we'll extract key metrics from the strings
+        # Statements are available as typed frames (get_statement_frame), but
+        # line item names differ per vendor, so they are not fetched until the
+        # factors below are mapped
         
         # Try to extract market cap and key financials
         # This is a simplified version - in production, you'd want proper parsing
@@ -343,65 +232,12 @@ def _calculate_analyst_factors(symbol: str, curr_date: str) -> dict:
     return factors
 
 
-def _calculate_microstructure_factors(df: pd.DataFrame, curr_date: str) -> dict:
+def _calculate_microstructure_factors(row: pd.Series, curr_date: str) -> dict:
     """Calculate Market Microstructure and Risk Factors"""
-    factors = {}
-    
-    if len(df) < 252:
-        return factors
-    
-    price_col = 'Adj Close' if 'Adj Close' in df.columns else 'Close'
-    volume_col = 'Volume' if 'Volume' in df.columns else None
-    
-    prices = df[price_col].dropna()
-    if len(prices) < 252:
-        return factors
-    
-    # 1. Beta (vs market - simplified, would need market index data)
-    if len(prices) >= 252:
-        returns = prices.pct_change().dropna()
-        # Simplified beta calculation (would need market returns)
-        factors['beta'] = None  # Would calculate with market returns
-    
-    # 2. Idiosyncratic Volatility
-    if len(prices) >= 252:
-        returns = prices.pct_change().dropna()
-        # Simplified - would need market returns for proper calculation
-        factors['idiosyncratic_volatility'] = returns.std() * np.sqrt(252) * 100
-    
-    # 3. Amihud Illiquidity Measure
-    if volume_col and volume_col in df.columns:
-        if len(df) >= 20:
-            recent_df = df.iloc[-20:]
-            returns_abs = abs(recent_df[price_col].pct_change().dropna())
-            volumes = recent_df[volume_col].dropna()
-            common_idx = returns_abs.index.intersection(volumes.index)
-            if len(common_idx) > 0:
-                dollar_volume = recent_df.loc[common_idx, price_col] * recent_df.loc[common_idx, volume_col]
-                amihud = (returns_abs.loc[common_idx] / dollar_volume.loc[common_idx]).mean()
-                factors['amihud_illiquidity'] = amihud * 1e6  # Scaled
-    
-    # 4. Skewness
-    if len(prices) >= 252:
-        returns = prices.pct_change().dropna()
-        factors['return_skewness'] = returns.skew()
-    
-    # 5. Maximum Daily Return
-    if len(prices) >= 20:
-        returns = prices.iloc[-20:].pct_change().dropna()
-        factors['max_daily_return'] = returns.max() * 100
-    
-    # 6. Stock Price
-    current_price = prices.iloc[-1]
-    factors['stock_price'] = current_price
-    factors['log_price'] = np.log(current_price)
-    
-    # 7. Turnover Volatility
-    if volume_col and volume_col in df.columns:
-        if len(df) >= 20:
-            volumes = df[volume_col].iloc[-20:]
-            factors['turnover_volatility'] = volumes.pct_change().std() * 100
-    
+    # Empty without a full year of bars
+    factors = _panel_view(row, MICROSTRUCTURE_FACTORS)
+    if factors and 'beta' not in factors:
+        factors = {'beta': None, **factors}
     return factors
 
 
@@ -458,40 +294,9 @@ def _calculate_industry_style_factors(symbol: str, df: pd.DataFrame, curr_date:
     return factors
 
 
-def _calculate_technical_patterns(df: pd.DataFrame, curr_date: str) -> dict:
+def _calculate_technical_patterns(row: pd.Series, curr_date: str) -> dict:
     """Calculate Technical Patterns and Complex Indicators"""
-    factors = {}
-    
-    if len(df) < 14:
-        return factors
-    
-    price_col = 'Adj Close' if 'Adj Close' in df.columns else 'Close'
-    prices = df[price_col].dropna()
-    
-    if len(prices) < 14:
-        return factors
-    
-    # 1. RSI (Relative Strength Index)
-    if len(prices) >= 14:
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        factors['rsi'] = rsi.iloc[-1] if not rsi.empty else None
-    
-    # 2. Bollinger Band Position
-    if len(prices) >= 20:
-        ma_20 = prices.iloc[-20:].mean()
-        std_20 = prices.iloc[-20:].std()
-        upper_band = ma_20 + (2 * std_20)
-        lower_band = ma_20 - (2 * std_20)
-        current_price = prices.iloc[-1]
-        if upper_band != lower_band:
-            factors['bollinger_position'] = (current_price - lower_band) / (upper_band - lower_band)
-        factors['bollinger_bandwidth'] = ((upper_band - lower_band) / ma_20) * 100
-    
-    return factors
+    return _panel_view(row, TECHNICAL_FACTORS)
 
 
 def _format_alpha_factors_report(factors: dict, symbol: str, curr_date: str) -> str:
@@ -528,7 +333,7 @@ def _format_alpha_factors_report(factors: dict, symbol: str, curr_date: str) ->
             'target_price_upside', 'forecast_dispersion', 'earnings_surprise_magnitude'
         ],
         "IV. MARKET MICROSTRUCTURE AND RISK FACTORS": [
-            'beta', 'idiosyncratic_volatility', 'amihud_illiquidity',
+            'beta', 'benchmark_correlation', 'idiosyncratic_volatility', 'amihud_illiquidity',
             'return_skewness', 'max_daily_return', 'stock_price', 'log_price',
             'turnover_volatility'
         ],
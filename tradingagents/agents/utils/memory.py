@@ -1,7 +1,7 @@
 import os
 import chromadb
 from chromadb.config import Settings
-from openai import OpenAI
+from tradingagents.dataflows.http_pool import get_openai_client
 from sentence_transformers import SentenceTransformer
 
 class FinancialSituationMemory:
@@ -11,7 +11,7 @@ class FinancialSituationMemory:
         else:
             self.embedding = "text-embedding-3-small"
         self.backend_url = config.get("backend_url", "https://api.openai.com/v1")
-        self.client = OpenAI(base_url=self.backend_url)
+        self.client = get_openai_client(self.backend_url)
         self.chroma_client = chromadb.Client(Settings(allow_reset=True))
         self.situation_collection = self.chroma_client.create_collection(name=name)
 
@@ -32,7 +32,7 @@ class FinancialSituationMemory:
             if openai_api_key:
                 try:
                     # Verify this is actually an OpenAI key by attempting the request
-                    client = OpenAI(api_key=openai_api_key)
+                    client = get_openai_client(api_key=openai_api_key)
                     response = client.embeddings.create(
                         model=self.embedding, input=text
                     )
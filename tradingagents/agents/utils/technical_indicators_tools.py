@@ -20,4 +20,25 @@ def get_indicators(
     Returns:
         str: A formatted dataframe containing the technical indicators for the specified ticker symbol and indicator.
     """
-    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
\ No newline at end of file
+    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+
+@tool
+def get_indicators_batch(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[str, "comma-separated technical indicators, e.g. 'close_50_sma,macd,rsi'"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    look_back_days: Annotated[int, "how many days to look back"] = 30,
+) -> str:
+    """
+    Retrieve several technical indicators for a given ticker symbol in one call.
+    Price data is loaded once and every requested indicator is returned in a single table.
+    Uses the configured technical_indicators vendor.
+    Args:
+        symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+        indicators (str): Comma-separated technical indicator names, e.g. "close_50_sma,macd,rsi"
+        curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+        look_back_days (int): How many days to look back, default is 30
+    Returns:
+        str: A table with one row per trading day and one column per requested indicator.
+    """
+    return route_to_vendor("get_indicators_batch", symbol, indicators, curr_date, look_back_days)
@@ -0,0 +1,193 @@
+"""
+Persistent response cache for Alpha Vantage requests.
+
+Responses are stored in a SQLite database under ``data_cache_dir`` keyed by
+the API function plus its query parameters (the API key is never part of the
+key). Each function family gets its own freshness policy: statements change
+quarterly, daily series change once per session, news changes by the minute.
+
+Modes (``config["alpha_vantage_cache"]["mode"]``):
+    read_write  serve fresh entries, fetch and store on miss (default)
+    cache_only  serve any stored entry regardless of age and never hit the
+                network; a miss raises AlphaVantageCacheMissError. Intended for
+                backtest reruns over historical dates.
+    off         bypass the cache entirely
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from zoneinfo import ZoneInfo
+
+from .config import get_config
+
+DEFAULT_ALPHA_VANTAGE_CACHE_CONFIG = {
+    "mode": "read_write",
+    "ttl_overrides": {},  # e.g. {"NEWS_SENTIMENT": 300} (seconds)
+}
+
+# Functions whose data only changes with a new filing
+FUNDAMENTAL_FUNCTIONS = {"OVERVIEW", "BALANCE_SHEET", "INCOME_STATEMENT", "CASH_FLOW", "EARNINGS"}
+FUNDAMENTAL_TTL_SECONDS = 7 * 24 * 3600
+
+# Functions whose daily output gains one row per session
+DAILY_SERIES_FUNCTIONS = {
+    "TIME_SERIES_DAILY", "TIME_SERIES_DAILY_ADJUSTED",
+    "SMA", "EMA", "MACD", "RSI", "BBANDS", "ATR",
+}
+
+NEWS_FUNCTIONS = {"NEWS_SENTIMENT"}
+NEWS_TTL_SECONDS = 15 * 60
+
+INSIDER_TTL_SECONDS = 24 * 3600
+DEFAULT_TTL_SECONDS = 3600
+
+_MARKET_TZ = ZoneInfo("America/New_York")
+# Alpha Vantage publishes the session's bar shortly after the 16:00 close
+_CLOSE_SETTLE_DELAY = timedelta(minutes=20)
+
+_EXCLUDED_KEY_PARAMS = {"apikey"}
+
+
+class AlphaVantageCacheMissError(Exception):
+    """Raised in cache_only mode when a request has no stored response."""
+    pass
+
+
+def get_alpha_vantage_cache_config() -> Dict:
+    settings = DEFAULT_ALPHA_VANTAGE_CACHE_CONFIG.copy()
+    settings.update(get_config().get("alpha_vantage_cache", {}))
+    return settings
+
+
+def _next_market_close(now: datetime) -> datetime:
+    """Next weekday 16:00 New York time (plus settle delay) strictly after ``now``."""
+    local_now = now.astimezone(_MARKET_TZ)
+    close = local_now.replace(hour=16, minute=0, second=0, microsecond=0) + _CLOSE_SETTLE_DELAY
+    if local_now >= close:
+        close += timedelta(days=1)
+    while close.weekday() >= 5:
+        close += timedelta(days=1)
+    return close
+
+
+def expires_at(function_name: str, params: dict, now: Optional[float] = None) -> float:
+    """Unix timestamp at which a response for this request stops being fresh."""
+    now = time.time() if now is None else now
+    overrides = get_alpha_vantage_cache_config()["ttl_overrides"]
+    if function_name in overrides:
+        return now + overrides[function_name]
+
+    if function_name in FUNDAMENTAL_FUNCTIONS:
+        return now + FUNDAMENTAL_TTL_SECONDS
+    if function_name in DAILY_SERIES_FUNCTIONS and params.get("interval", "daily") == "daily":
+        return _next_market_close(datetime.fromtimestamp(now, tz=_MARKET_TZ)).timestamp()
+    if function_name in NEWS_FUNCTIONS:
+        return now + NEWS_TTL_SECONDS
+    if function_name == "INSIDER_TRANSACTIONS":
+        return now + INSIDER_TTL_SECONDS
+    return now + DEFAULT_TTL_SECONDS
+
+
+def make_cache_key(function_name: str, params: dict) -> str:
+    key_params = {k: v for k, v in params.items() if k not in _EXCLUDED_KEY_PARAMS and k != "function"}
+    return function_name + "?" + json.dumps(key_params, sort_keys=True, default=str)
+
+
+class AlphaVantageResponseCache:
+    """SQLite-backed response store; one connection per thread."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " function TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " body TEXT NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[str]:
+        row = self._connection().execute(
+            "SELECT expires_at, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        expiry, body = row
+        if allow_stale or expiry > time.time():
+            return body
+        return None
+
+    def put(self, key: str, function_name: str, body: str, expiry: float) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, function, fetched_at, expires_at, body)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, function_name, time.time(), expiry, body),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired rows; returns how many were removed."""
+        with self._connection() as conn:
+            cursor = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            return cursor.rowcount
+
+
+_caches: Dict[str, AlphaVantageResponseCache] = {}
+_caches_guard = threading.Lock()
+
+
+def get_response_cache() -> AlphaVantageResponseCache:
+    """Return the response cache for the configured data_cache_dir."""
+    db_path = os.path.join(get_config()["data_cache_dir"], "alpha_vantage_cache.sqlite3")
+    with _caches_guard:
+        if db_path not in _caches:
+            _caches[db_path] = AlphaVantageResponseCache(db_path)
+        return _caches[db_path]
+
+
+def lookup(function_name: str, params: dict) -> Optional[str]:
+    """Return a cached response for the request, or None if it must be fetched.
+
+    Raises:
+        AlphaVantageCacheMissError: in cache_only mode when nothing is stored
+    """
+    mode = get_alpha_vantage_cache_config()["mode"]
+    if mode == "off":
+        return None
+
+    key = make_cache_key(function_name, params)
+    body = get_response_cache().get(key, allow_stale=(mode == "cache_only"))
+    if body is None and mode == "cache_only":
+        raise AlphaVantageCacheMissError(
+            f"No cached Alpha Vantage response for {key} (cache_only mode)"
+        )
+    return body
+
+
+def store(function_name: str, params: dict, body: str) -> None:
+    """Persist a successful response according to its function's TTL policy."""
+    if get_alpha_vantage_cache_config()["mode"] == "off":
+        return
+    get_response_cache().put(
+        make_cache_key(function_name, params),
+        function_name,
+        body,
+        expires_at(function_name, params),
+    )
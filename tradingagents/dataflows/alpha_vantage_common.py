@@ -1,9 +1,12 @@
 import os
-import requests
 import pandas as pd
 import json
 from datetime import datetime
 from io import StringIO
+from . import alpha_vantage_cache
+from .alpha_vantage_cache import AlphaVantageCacheMissError
+from .rate_limiter import get_rate_limiter, DailyQuotaExceededError
+from .http_pool import get_session
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
@@ -41,15 +44,18 @@ class AlphaVantageRateLimitError(Exception):
 
 def _make_api_request(function_name: str, params: dict) -> dict | str:
     """Helper function to make API requests and handle responses.
+
+    Successful responses are served from and written to the persistent
+    response cache (see alpha_vantage_cache).
     
     Raises:
         AlphaVantageRateLimitError: When API rate limit is exceeded
+        AlphaVantageCacheMissError: In cache_only mode when no response is stored
     """
     # Create a copy of params to avoid modifying the original
     api_params = params.copy()
     api_params.update({
         "function": function_name,
-        "apikey": get_api_key(),
         "source": "trading_agents",
     })
     
@@ -62,24 +68,44 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
     elif "entitlement" in api_params:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
+
+    cached_response = alpha_vantage_cache.lookup(function_name, api_params)
+    if cached_response is not None:
+        return cached_response
+
+    # The key is only needed on a cache miss, so cached backtests run without one
+    api_params["apikey"] = get_api_key()
+
+    # Wait for a slot in the shared quota instead of spending a request on a 429
+    try:
+        get_rate_limiter("alpha_vantage").acquire()
+    except DailyQuotaExceededError as e:
+        raise AlphaVantageRateLimitError(f"Alpha Vantage daily budget exhausted: {e}")
     
-    response = requests.get(API_BASE_URL, params=api_params)
+    response = get_session("alpha_vantage").get(API_BASE_URL, params=api_params)
     response.raise_for_status()
 
     response_text = response.text
     
     # Check if response is JSON (error responses are typically JSON)
+    is_error_response = False
     try:
         response_json = json.loads(response_text)
-        # Check for rate limit error
-        if "Information" in response_json:
-            info_message = response_json["Information"]
-            if "rate limit" in info_message.lower() or "api key" in info_message.lower():
-                raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
+        if isinstance(response_json, dict):
+            # Throttling arrives as "Information", or as "Note" on older endpoints
+            for key in ("Information", "Note"):
+                info_message = str(response_json.get(key, ""))
+                if any(hint in info_message.lower() for hint in ("rate limit", "api key", "call frequency")):
+                    raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
+            is_error_response = any(key in response_json for key in ("Error Message", "Information", "Note"))
     except json.JSONDecodeError:
         # Response is not JSON (likely CSV data), which is normal
         pass
 
+    # Only successful payloads are worth keeping
+    if not is_error_response:
+        alpha_vantage_cache.store(function_name, api_params, response_text)
+
     return response_text
 
 
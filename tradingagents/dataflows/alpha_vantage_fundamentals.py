@@ -1,4 +1,15 @@
+import json
+import pandas as pd
 from .alpha_vantage_common import _make_api_request
+from .vendor_health import DataNotFoundError
+from .frames import to_statement_frame
+
+# frame API statement name -> Alpha Vantage function
+_STATEMENT_FUNCTIONS = {
+    "balance_sheet": "BALANCE_SHEET",
+    "cashflow": "CASH_FLOW",
+    "income_statement": "INCOME_STATEMENT",
+}
 
 
 def get_fundamentals(ticker: str, curr_date: str = None) -> str:
@@ -75,3 +86,34 @@ def get_income_statement(ticker: str, freq: str = "quarterly", curr_date: str =
 
     return _make_api_request("INCOME_STATEMENT", params)
 
+
+
+def get_statement_frame(ticker: str, statement: str, freq: str = "quarterly", curr_date: str = None) -> pd.DataFrame:
+    """
+    Retrieve one financial statement as a typed (periods x line items) frame using Alpha Vantage.
+
+    Uses the same request as the matching string tool, so both are served by one cached response.
+
+    Args:
+        ticker (str): Ticker symbol of the company
+        statement (str): balance_sheet, cashflow or income_statement
+        freq (str): Reporting frequency: annual/quarterly (default quarterly)
+        curr_date (str): Only periods ending on or before this date, yyyy-mm-dd (optional)
+
+    Returns:
+        pd.DataFrame: One row per fiscal period end, one float column per reported field
+    """
+    response = _make_api_request(_STATEMENT_FUNCTIONS[statement], {"symbol": ticker})
+    payload = json.loads(response)
+    key = "quarterlyReports" if freq.lower() == "quarterly" else "annualReports"
+    if key not in payload:
+        if "Error Message" in payload or payload == {}:
+            # Alpha Vantage's answer for an unknown symbol
+            raise DataNotFoundError(f"No Alpha Vantage data for {ticker}: {response[:200]}")
+        raise ValueError(f"Unexpected Alpha Vantage response for {ticker}: {response[:200]}")
+
+    reports = pd.DataFrame(payload[key])
+    if reports.empty:
+        return to_statement_frame(reports)
+    frame = to_statement_frame(reports.set_index("fiscalDateEnding"), drop=("reportedCurrency",))
+    return frame.loc[:curr_date] if curr_date else frame
@@ -1,5 +1,21 @@
 from datetime import datetime
+from io import StringIO
+import pandas as pd
 from .alpha_vantage_common import _make_api_request, _filter_csv_by_date_range
+from .vendor_health import DataNotFoundError
+from .frames import to_price_frame
+
+# Alpha Vantage CSV columns -> price-frame columns
+_PRICE_COLUMNS = {
+    "timestamp": "Date",
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "adjusted_close": "Adj Close",
+    "volume": "Volume",
+}
+
 
 def get_stock(
     symbol: str,
@@ -18,6 +34,33 @@ def get_stock(
     Returns:
         CSV string containing the daily adjusted time series data filtered to the date range.
     """
+    response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", _daily_params(symbol, start_date))
+
+    return _filter_csv_by_date_range(response, start_date, end_date)
+
+
+def get_stock_frame(
+    symbol: str,
+    start_date: str,
+    end_date: str
+) -> pd.DataFrame:
+    """
+    Returns typed daily OHLCV bars (with Adj Close) for start_date <= Date <= end_date.
+
+    Uses the same request as get_stock, so both are served by one cached response.
+    """
+    response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", _daily_params(symbol, start_date))
+    data = pd.read_csv(StringIO(response))
+    if "timestamp" not in data.columns:
+        if "Error Message" in response:
+            # Alpha Vantage's answer for an unknown symbol
+            raise DataNotFoundError(f"No Alpha Vantage data for {symbol}: {response[:200]}")
+        raise ValueError(f"Unexpected Alpha Vantage response for {symbol}: {response[:200]}")
+    data = data.rename(columns=_PRICE_COLUMNS)
+    return to_price_frame(data).loc[start_date:end_date]
+
+
+def _daily_params(symbol: str, start_date: str) -> dict:
     # Parse dates to determine the range
     start_dt = datetime.strptime(start_date, "%Y-%m-%d")
     today = datetime.now()
@@ -27,12 +70,8 @@ def get_stock(
     days_from_today_to_start = (today - start_dt).days
     outputsize = "compact" if days_from_today_to_start < 100 else "full"
 
-    params = {
+    return {
         "symbol": symbol,
         "outputsize": outputsize,
         "datatype": "csv",
     }
-
-    response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", params)
-
-    return _filter_csv_by_date_range(response, start_date, end_date)
\ No newline at end of file
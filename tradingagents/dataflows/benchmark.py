@@ -0,0 +1,70 @@
+"""
+Shared benchmark (market index) price series.
+
+Beta, residual volatility and benchmark correlation need the market's
+returns next to every stock's. The benchmark symbol (config
+"benchmark_symbol", SPY by default) is loaded once per process through the
+core_stock_apis vendor and kept in memory; a request outside the loaded
+range reloads it once over the union of both ranges. Every ticker, panel
+and factor history then slices the same series instead of fetching the
+index again.
+"""
+
+import threading
+from typing import Annotated, Optional
+
+import pandas as pd
+
+from .config import get_config
+from .frames import get_stock_frame
+
+DEFAULT_BENCHMARK_SYMBOL = "SPY"
+
+_loaded = {}  # symbol -> (start, end, prices)
+_lock = threading.Lock()
+
+
+def get_benchmark_symbol() -> str:
+    return (get_config().get("benchmark_symbol") or DEFAULT_BENCHMARK_SYMBOL).upper()
+
+
+def get_benchmark_prices(
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+    symbol: Annotated[Optional[str], "benchmark symbol (default: config benchmark_symbol)"] = None,
+) -> pd.Series:
+    """Benchmark closing prices (Adj Close when the vendor has it), indexed by Date."""
+    symbol = symbol.upper() if symbol else get_benchmark_symbol()
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
+
+    with _lock:
+        entry = _loaded.get(symbol)
+        if entry is None or start < entry[0] or end > entry[1]:
+            if entry is not None:
+                start, end = min(start, entry[0]), max(end, entry[1])
+            bars = get_stock_frame(symbol, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+            price_col = "Adj Close" if "Adj Close" in bars.columns else "Close"
+            entry = (start, end, bars[price_col].dropna().rename(symbol))
+            _loaded[symbol] = entry
+
+    prices = entry[2]
+    return prices.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+
+
+def get_benchmark_returns(
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+    symbol: Annotated[Optional[str], "benchmark symbol (default: config benchmark_symbol)"] = None,
+) -> pd.Series:
+    """Daily simple returns of the benchmark for start_date..end_date."""
+    # A week of extra bars so the first day in range has a previous close
+    lead_start = (pd.Timestamp(start_date) - pd.Timedelta(days=7)).strftime("%Y-%m-%d")
+    returns = get_benchmark_prices(lead_start, end_date, symbol).pct_change()
+    return returns.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)].dropna()
+
+
+def clear_benchmark_cache() -> None:
+    """Forget loaded series (e.g. after changing benchmark_symbol's data source)."""
+    with _lock:
+        _loaded.clear()
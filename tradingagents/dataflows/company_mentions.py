@@ -0,0 +1,85 @@
+"""
+Precompiled company-mention matching.
+
+A mapping such as ``{"META": "Meta OR Facebook"}`` is compiled into two
+combined patterns: one case-insensitive alternation of all company names
+and one case-sensitive alternation of the ticker symbols and symbol-like
+names (optionally prefixed with ``$``). A single scan of a text returns
+every ticker it mentions, so one pass over a corpus can serve a whole
+universe of tickers.
+
+Terms must appear as whole words. Plain substring matching tagged nearly
+every post with one-letter tickers such as V or X.
+"""
+
+import json
+import re
+from typing import Dict, FrozenSet, Iterable, Optional
+
+# Names this short are treated like ticker symbols (case-sensitive)
+SYMBOL_MAX_LENGTH = 2
+
+
+def _terms(names: str) -> list:
+    return [term.strip() for term in names.split(" OR ") if term.strip()]
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    # Longest first, so "JPMorgan Chase" wins over a shorter overlapping name
+    return "|".join(re.escape(term) for term in sorted(set(terms), key=len, reverse=True))
+
+
+class CompanyMentionMatcher:
+    """Tags texts with every ticker whose symbol or company name they mention."""
+
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = dict(mapping)
+        self._name_to_tickers: Dict[str, set] = {}
+        self._symbol_to_tickers: Dict[str, set] = {ticker: {ticker} for ticker in self.mapping}
+        for ticker, names in self.mapping.items():
+            for term in _terms(names):
+                if term.upper() == ticker or len(term) <= SYMBOL_MAX_LENGTH:
+                    # Symbol-like names ("X", "AMD") are matched case-sensitively
+                    self._symbol_to_tickers.setdefault(term, set()).add(ticker)
+                else:
+                    self._name_to_tickers.setdefault(term.lower(), set()).add(ticker)
+        self.tickers: FrozenSet[str] = frozenset(self.mapping)
+
+        # A lookahead at each word start finds overlapping names too
+        self._name_pattern = None
+        if self._name_to_tickers:
+            self._name_pattern = re.compile(
+                r"(?<!\w)(?=(" + _alternation(self._name_to_tickers) + r")(?!\w))",
+                re.IGNORECASE,
+            )
+        self._ticker_pattern = None
+        if self._symbol_to_tickers:
+            self._ticker_pattern = re.compile(
+                r"(?<![\w$])\$?(" + _alternation(self._symbol_to_tickers) + r")(?!\w)"
+            )
+
+    def tickers_in(self, *texts: Optional[str]) -> FrozenSet[str]:
+        """All tickers mentioned in any of the texts."""
+        found = set()
+        for text in texts:
+            if not text:
+                continue
+            if self._name_pattern is not None:
+                for match in self._name_pattern.finditer(text):
+                    found.update(self._name_to_tickers[match.group(1).lower()])
+            if self._ticker_pattern is not None:
+                for match in self._ticker_pattern.finditer(text):
+                    found.update(self._symbol_to_tickers[match.group(1)])
+        return frozenset(found)
+
+    def mentions(self, ticker: str, *texts: Optional[str]) -> bool:
+        return ticker in self.tickers_in(*texts)
+
+
+def load_company_map(path: str) -> Dict[str, str]:
+    """Read a user mapping file: JSON object of {"TICKER": "Name OR Alias"}."""
+    with open(path, "r") as f:
+        mapping = json.load(f)
+    if not isinstance(mapping, dict):
+        raise ValueError(f"Company mapping file {path} must contain a JSON object")
+    return {str(ticker).upper(): str(names) for ticker, names in mapping.items()}
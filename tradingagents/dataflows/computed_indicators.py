@@ -0,0 +1,243 @@
+"""
+Alpha Vantage technical indicators computed locally from stored OHLCV bars.
+
+Serves the same ``SUPPORTED_INDICATORS`` as alpha_vantage_indicator, with
+the same output format, without spending API quota: bars come from the
+OHLCV store (see ohlcv_store / prefetch). The formulas follow the TA-Lib
+conventions Alpha Vantage uses, so values agree once the recursive averages
+have warmed up:
+
+- EMA and Wilder averages (RSI, ATR) are seeded with the simple average of
+  their first ``n`` inputs rather than with the first value.
+- The MACD fast EMA is seeded over the 12 bars ending where the slow EMA
+  starts, so both lines begin on the same bar.
+- Bollinger Bands use the population standard deviation.
+
+Alpha Vantage has no VWMA endpoint; it is computed as stockstats does (14
+bars, typical price), matching the yfinance vendor.
+
+``verify_computed_indicators.py`` at the repository root checks the
+results against Alpha Vantage reference fixtures in tests/fixtures.
+"""
+
+from datetime import datetime
+from typing import Annotated, Optional
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from .alpha_vantage_indicator import INDICATOR_DESCRIPTIONS, SUPPORTED_INDICATORS
+from .ohlcv_store import load_ohlcv
+from .utils import format_indicator_table, parse_indicator_list
+
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+BOLL_PERIOD, BOLL_STD_TIMES = 20, 2
+VWMA_PERIOD = 14
+
+
+def _recursive_average(values: np.ndarray, window: int, alpha: float, seed_end: Optional[int] = None) -> np.ndarray:
+    """x[t] = alpha * v[t] + (1 - alpha) * x[t-1], seeded with a simple average.
+
+    The seed is the mean of the ``window`` values ending at ``seed_end``
+    (default: the first ``window`` values after any leading NaNs).
+    """
+    result = np.full(len(values), np.nan)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) == 0:
+        return result
+    first = valid[0]
+    if seed_end is None:
+        seed_end = first + window - 1
+    if seed_end >= len(values) or seed_end - window + 1 < first:
+        return result
+
+    tail = values[seed_end:].copy()
+    tail[0] = values[seed_end - window + 1:seed_end + 1].mean()
+    result[seed_end:] = pd.Series(tail).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return result
+
+
+def _ema(values: np.ndarray, window: int, seed_end: Optional[int] = None) -> np.ndarray:
+    return _recursive_average(values, window, 2.0 / (window + 1), seed_end)
+
+
+def _wilder(values: np.ndarray, window: int) -> np.ndarray:
+    return _recursive_average(values, window, 1.0 / window)
+
+
+def resample_ohlcv(data: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """Daily bars to Alpha Vantage's weekly/monthly bars, labelled by their last trading day."""
+    if interval == "daily":
+        return data
+    if interval == "weekly":
+        periods = data.index.to_period("W-FRI")
+    elif interval == "monthly":
+        periods = data.index.to_period("M")
+    else:
+        raise ValueError(f"Unsupported interval {interval}. Choose from: daily, weekly, monthly")
+
+    grouped = data.assign(Date=data.index).groupby(periods)
+    bars = grouped.agg(
+        {"Date": "last", "Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+    )
+    return bars.set_index("Date")
+
+
+def compute_indicator_frame(
+    data: Annotated[pd.DataFrame, "OHLCV bars indexed by date, oldest first"],
+    indicators: Annotated[list, "indicator names from SUPPORTED_INDICATORS"],
+    time_period: Annotated[int, "period for RSI and ATR"] = 14,
+    series_type: Annotated[str, "price column for close-based indicators"] = "close",
+) -> pd.DataFrame:
+    """Compute the requested indicators for every bar. Returns one column per indicator."""
+    series = data[series_type.capitalize()].to_numpy(dtype="float64")
+    columns = {}
+
+    def sma(window):
+        return pd.Series(series).rolling(window).mean().to_numpy()
+
+    for indicator in indicators:
+        if indicator in columns:
+            continue
+        if indicator == "close_50_sma":
+            columns[indicator] = sma(50)
+        elif indicator == "close_200_sma":
+            columns[indicator] = sma(200)
+        elif indicator == "close_10_ema":
+            columns[indicator] = _ema(series, 10)
+        elif indicator in ("macd", "macds", "macdh"):
+            slow_start = MACD_SLOW - 1
+            macd = _ema(series, MACD_FAST, seed_end=slow_start) - _ema(series, MACD_SLOW)
+            signal = _ema(macd, MACD_SIGNAL)
+            columns.update({"macd": macd, "macds": signal, "macdh": macd - signal})
+        elif indicator == "rsi":
+            change = np.diff(series, prepend=np.nan)
+            gain = _wilder(np.where(np.isnan(change), np.nan, np.clip(change, 0, None)), time_period)
+            loss = _wilder(np.where(np.isnan(change), np.nan, np.clip(-change, 0, None)), time_period)
+            total = gain + loss
+            with np.errstate(invalid="ignore", divide="ignore"):
+                columns[indicator] = np.where(total > 0, 100 * gain / total, np.where(np.isnan(total), np.nan, 0.0))
+        elif indicator in ("boll", "boll_ub", "boll_lb"):
+            rolling = pd.Series(series).rolling(BOLL_PERIOD)
+            middle = rolling.mean().to_numpy()
+            width = BOLL_STD_TIMES * rolling.std(ddof=0).to_numpy()
+            columns.update({"boll": middle, "boll_ub": middle + width, "boll_lb": middle - width})
+        elif indicator == "atr":
+            high = data["High"].to_numpy(dtype="float64")
+            low = data["Low"].to_numpy(dtype="float64")
+            prev_close = np.concatenate(([np.nan], data["Close"].to_numpy(dtype="float64")[:-1]))
+            true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+            true_range[0] = np.nan  # TA-Lib starts the true range on the second bar
+            columns[indicator] = _wilder(true_range, time_period)
+        elif indicator == "vwma":
+            typical = (data["High"] + data["Low"] + data["Close"]) / 3
+            volume = data["Volume"].astype("float64")
+            weighted = (typical * volume).rolling(VWMA_PERIOD, min_periods=1).sum()
+            total_volume = volume.rolling(VWMA_PERIOD, min_periods=1).sum()
+            # No volume in the window: no weighted average (NaN, not 0)
+            columns[indicator] = (weighted / total_volume.where(total_volume != 0)).to_numpy()
+        else:
+            raise ValueError(
+                f"Indicator {indicator} is not supported. Please choose from: {list(SUPPORTED_INDICATORS.keys())}"
+            )
+
+    return pd.DataFrame({ind: columns[ind] for ind in indicators}, index=data.index)
+
+
+def _indicator_table(symbol, indicators, curr_date, look_back_days, interval, time_period, series_type):
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+
+    data = resample_ohlcv(load_ohlcv(symbol, end_date=curr_date), interval)
+    table = compute_indicator_frame(data, indicators, time_period, series_type)
+    return table.loc[before:curr_date_dt], before
+
+
+def get_indicator(
+    symbol: str,
+    indicator: str,
+    curr_date: str,
+    look_back_days: int,
+    interval: str = "daily",
+    time_period: int = 14,
+    series_type: str = "close"
+) -> str:
+    """
+    Returns locally computed Alpha Vantage technical indicator values over a time window.
+
+    Args:
+        symbol: ticker symbol of the company
+        indicator: technical indicator to get the analysis and report of
+        curr_date: The current trading date you are trading on, YYYY-mm-dd
+        look_back_days: how many days to look back
+        interval: Time interval (daily, weekly, monthly)
+        time_period: Number of data points for calculation
+        series_type: The desired price type (close, open, high, low)
+
+    Returns:
+        String containing indicator values and description
+    """
+    if indicator not in SUPPORTED_INDICATORS:
+        raise ValueError(
+            f"Indicator {indicator} is not supported. Please choose from: {list(SUPPORTED_INDICATORS.keys())}"
+        )
+
+    required_series_type = SUPPORTED_INDICATORS[indicator][1]
+    if required_series_type:
+        series_type = required_series_type
+
+    table, before = _indicator_table(
+        symbol, [indicator], curr_date, look_back_days, interval, time_period, series_type
+    )
+    values = table[indicator].dropna()
+
+    ind_string = "".join(
+        f"{date.strftime('%Y-%m-%d')}: {value:.4f}\n" for date, value in values.items()
+    )
+    if not ind_string:
+        ind_string = "No data available for the specified date range.\n"
+
+    return (
+        f"## {indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
+        + ind_string
+        + "\n\n"
+        + INDICATOR_DESCRIPTIONS.get(indicator, "No description available.")
+    )
+
+
+def get_indicators_batch(
+    symbol: str,
+    indicators,
+    curr_date: str,
+    look_back_days: int,
+    interval: str = "daily",
+    time_period: int = 14,
+) -> str:
+    """
+    Returns several locally computed Alpha Vantage indicators over a time window as one table.
+
+    Args:
+        symbol: ticker symbol of the company
+        indicators: list of indicator names, or a comma-separated string
+        curr_date: The current trading date you are trading on, YYYY-mm-dd
+        look_back_days: how many days to look back
+        interval: Time interval (daily, weekly, monthly)
+        time_period: Number of data points for calculation
+
+    Returns:
+        String containing one row per trading day and one column per indicator
+    """
+    indicators = parse_indicator_list(indicators)
+    unsupported = [ind for ind in indicators if ind not in SUPPORTED_INDICATORS]
+    if unsupported:
+        raise ValueError(
+            f"Indicators {unsupported} are not supported. Please choose from: {list(SUPPORTED_INDICATORS.keys())}"
+        )
+
+    table, before = _indicator_table(
+        symbol, indicators, curr_date, look_back_days, interval, time_period, "close"
+    )
+    return format_indicator_table(
+        symbol, table, before.strftime("%Y-%m-%d"), curr_date, INDICATOR_DESCRIPTIONS
+    )
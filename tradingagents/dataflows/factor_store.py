@@ -0,0 +1,102 @@
+"""
+Per-symbol factor cache under ``data_cache_dir/factors``.
+
+Holds one (dates x factors) frame per symbol, computed from its daily bars,
+in the same layout as the OHLCV store (Parquet when pyarrow is installed,
+CSV otherwise, with a JSON sidecar for metadata). Frames read from disk
+are also kept in memory for the rest of the process, so looking up a
+symbol's factors on a date during a backtest is an index lookup.
+"""
+
+import json
+import os
+import threading
+from typing import Annotated, Optional, Tuple
+
+import pandas as pd
+
+from .config import get_config
+from .ohlcv_store import STORE_FORMAT, _replace, _write_json
+
+DEFAULT_FACTOR_CACHE_CONFIG = {
+    "enabled": True,
+}
+
+_memory = {}
+_memory_lock = threading.Lock()
+_symbol_locks = {}
+_symbol_locks_guard = threading.Lock()
+
+
+def get_factor_cache_config():
+    settings = DEFAULT_FACTOR_CACHE_CONFIG.copy()
+    settings.update(get_config().get("factor_cache", {}))
+    return settings
+
+
+def factor_lock(symbol: str) -> threading.Lock:
+    """Per-symbol lock for a read-compute-write cycle on the cache."""
+    with _symbol_locks_guard:
+        if symbol not in _symbol_locks:
+            _symbol_locks[symbol] = threading.Lock()
+        return _symbol_locks[symbol]
+
+
+def get_factor_dir() -> str:
+    """Directory holding the per-symbol factor files."""
+    return os.path.join(get_config()["data_cache_dir"], "factors")
+
+
+def _store_path(symbol: str) -> str:
+    return os.path.join(get_factor_dir(), f"{symbol}.{STORE_FORMAT}")
+
+
+def _meta_path(symbol: str) -> str:
+    return os.path.join(get_factor_dir(), f"{symbol}.meta.json")
+
+
+def read_factors(symbol: Annotated[str, "ticker symbol"]) -> Tuple[Optional[pd.DataFrame], dict]:
+    """(factor frame, metadata) for a symbol, or (None, {}) if nothing is cached."""
+    symbol = symbol.upper()
+    with _memory_lock:
+        if symbol in _memory:
+            return _memory[symbol]
+
+    path = _store_path(symbol)
+    if not os.path.exists(path):
+        return None, {}
+    try:
+        with open(_meta_path(symbol), "r") as f:
+            meta = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None, {}
+    if STORE_FORMAT == "parquet":
+        factors = pd.read_parquet(path)
+    else:
+        factors = pd.read_csv(path, index_col="Date", parse_dates=["Date"])
+
+    with _memory_lock:
+        _memory[symbol] = (factors, meta)
+    return factors, meta
+
+
+def write_factors(
+    symbol: Annotated[str, "ticker symbol"],
+    factors: Annotated[pd.DataFrame, "full factor history, indexed by Date"],
+    meta: Annotated[dict, "metadata stored next to the frame"],
+) -> None:
+    """Persist a symbol's factor history (replacing what was stored) atomically."""
+    symbol = symbol.upper()
+    os.makedirs(get_factor_dir(), exist_ok=True)
+
+    _replace(_store_path(symbol), factors.to_parquet if STORE_FORMAT == "parquet" else factors.to_csv)
+    _replace(_meta_path(symbol), lambda tmp_path: _write_json(tmp_path, meta))
+
+    with _memory_lock:
+        _memory[symbol] = (factors, meta)
+
+
+def clear_memory() -> None:
+    """Drop the in-memory copies; the next read goes back to disk."""
+    with _memory_lock:
+        _memory.clear()
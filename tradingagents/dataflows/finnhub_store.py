@@ -0,0 +1,106 @@
+"""
+Date-indexed access to the locally saved Finnhub data.
+
+Each ``{ticker}_data_formatted.json`` file maps YYYY-MM-DD keys to lists of
+records. Instead of loading and scanning the whole file on every call, the
+file is parsed once per process into a sorted key array so a date range is
+two bisects and a slice. The parsed form is also written to a pickle under
+``data_cache_dir/finnhub`` (keyed on the source file's size and mtime), so
+later processes skip JSON parsing altogether.
+"""
+
+import json
+import os
+import pickle
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional
+
+from .config import get_config
+
+
+class FinnhubDateIndex:
+    """Non-empty date keys of one Finnhub file in sorted order, with their records."""
+
+    def __init__(self, data: Dict[str, list]):
+        items = sorted((key, value) for key, value in data.items() if len(value) > 0)
+        self.dates: List[str] = [key for key, _ in items]
+        self.values: List[list] = [value for _, value in items]
+
+    def range(self, start_date: str, end_date: str) -> Dict[str, list]:
+        """Records keyed by date for start_date <= date <= end_date (inclusive, string order)."""
+        lo = bisect_left(self.dates, start_date)
+        hi = bisect_right(self.dates, end_date)
+        return dict(zip(self.dates[lo:hi], self.values[lo:hi]))
+
+
+def finnhub_data_path(data_dir: str, ticker: str, data_type: str, period: Optional[str] = None) -> str:
+    if period:
+        file_name = f"{ticker}_{period}_data_formatted.json"
+    else:
+        file_name = f"{ticker}_data_formatted.json"
+    return os.path.join(data_dir, "finnhub_data", data_type, file_name)
+
+
+def _signature(path: str) -> tuple:
+    stat = os.stat(path)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _binary_path(data_path: str) -> str:
+    data_type = os.path.basename(os.path.dirname(data_path))
+    file_name = os.path.splitext(os.path.basename(data_path))[0] + ".pkl"
+    return os.path.join(get_config()["data_cache_dir"], "finnhub", data_type, file_name)
+
+
+def _load_index(data_path: str, signature: tuple) -> FinnhubDateIndex:
+    binary_path = _binary_path(data_path)
+    try:
+        with open(binary_path, "rb") as f:
+            stored_signature, index = pickle.load(f)
+        if stored_signature == signature:
+            return index
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError, ValueError, TypeError,
+            AttributeError, ImportError):
+        # Missing, truncated, or pickled by a version whose classes have since
+        # moved or changed (ImportError covers ModuleNotFoundError): rebuild
+        pass
+
+    with open(data_path, "r") as f:
+        index = FinnhubDateIndex(json.load(f))
+
+    os.makedirs(os.path.dirname(binary_path), exist_ok=True)
+    tmp_path = binary_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump((signature, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, binary_path)
+    return index
+
+
+_indexes: Dict[str, tuple] = {}
+_indexes_guard = threading.Lock()
+
+
+def get_date_index(data_path: str) -> FinnhubDateIndex:
+    """Process-wide index for a Finnhub file, reloaded when the file changes."""
+    signature = _signature(data_path)
+    with _indexes_guard:
+        cached = _indexes.get(data_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    index = _load_index(data_path, signature)
+    with _indexes_guard:
+        _indexes[data_path] = (signature, index)
+    return index
+
+
+def dedupe_entries(entries: Iterable[dict]) -> List[dict]:
+    """Drop repeated records, keeping first occurrences in order (hash-based)."""
+    seen = set()
+    unique = []
+    for entry in entries:
+        fingerprint = json.dumps(entry, sort_keys=True, default=str)
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            unique.append(entry)
+    return unique
@@ -0,0 +1,85 @@
+"""
+Typed DataFrame access to the routed data, for internal consumers.
+
+The LLM-facing tools return text. Code that computes on the data (the
+alpha-factor engine, for one) uses these functions instead. They go
+through the same vendor routing, caching, fallback and circuit breakers,
+but each vendor returns a parsed frame, so there is no CSV text to render
+and re-parse.
+
+All frames share one shape:
+
+- price frames are indexed by a tz-naive, normalized DatetimeIndex named
+  ``Date`` (oldest first), with float64 columns among ``PRICE_COLUMNS``;
+- statement frames have one row per reporting period, indexed by the
+  period end date (oldest first, named ``Date``), with one float64 column
+  per line item. Line items keep each vendor's own names.
+
+Returned frames are copies and safe to modify.
+"""
+
+from typing import Annotated, Optional
+
+import pandas as pd
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+STATEMENTS = ("balance_sheet", "cashflow", "income_statement")
+
+
+def _normalized_index(index) -> pd.DatetimeIndex:
+    index = pd.DatetimeIndex(pd.to_datetime(index))
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize().rename("Date")
+
+
+def to_price_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Coerce vendor bars to the price-frame layout (``Date`` may be a column or the index)."""
+    if data is None or data.empty:
+        columns = ["Open", "High", "Low", "Close", "Volume"]
+        return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name="Date"), dtype="float64")
+    if "Date" in data.columns:
+        data = data.set_index("Date")
+    columns = [col for col in PRICE_COLUMNS if col in data.columns]
+    frame = data[columns].apply(pd.to_numeric, errors="coerce").astype("float64")
+    frame.index = _normalized_index(frame.index)
+    return frame[~frame.index.duplicated(keep="last")].sort_index()
+
+
+def to_statement_frame(data: pd.DataFrame, drop: tuple = ()) -> pd.DataFrame:
+    """Coerce a (periods x line items) frame: sorted date index, numeric columns only."""
+    if data is None or data.empty:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="Date"), dtype="float64")
+    frame = data.drop(columns=[col for col in drop if col in data.columns])
+    frame = frame.apply(pd.to_numeric, errors="coerce").astype("float64")
+    # Text fields (currency, tickers) become all-NaN columns; they are not line items
+    frame = frame.dropna(axis=1, how="all")
+    frame.index = _normalized_index(frame.index)
+    return frame[~frame.index.duplicated(keep="last")].sort_index()
+
+
+def get_stock_frame(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+) -> pd.DataFrame:
+    """Daily bars for start_date <= Date <= end_date from the core_stock_apis vendor."""
+    # Imported here: the vendor modules import the helpers above
+    from .interface import route_to_vendor
+
+    return route_to_vendor("get_stock_frame", symbol, start_date, end_date).copy()
+
+
+def get_statement_frame(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    statement: Annotated[str, "balance_sheet, cashflow or income_statement"],
+    freq: Annotated[str, "annual / quarterly"] = "quarterly",
+    curr_date: Annotated[Optional[str], "only periods reported on or before this date, yyyy-mm-dd"] = None,
+) -> pd.DataFrame:
+    """One financial statement as a periods x line-items frame from the fundamental_data vendor."""
+    if statement not in STATEMENTS:
+        raise ValueError(f"Statement {statement} is not supported. Please choose from: {list(STATEMENTS)}")
+    from .interface import route_to_vendor
+
+    return route_to_vendor("get_statement_frame", ticker, statement, freq, curr_date).copy()
@@ -66,7 +66,8 @@ def get_global_news_google(
     # Search multiple queries and combine results
     for query in queries:
         try:
-            news_results = getNewsData(query, before, curr_date)
+            # Stop paginating once this query alone could fill the limit
+            news_results = getNewsData(query, before, curr_date, limit=limit)
             for news in news_results:
                 title = news.get('title', '')
                 if title and title not in seen_titles:
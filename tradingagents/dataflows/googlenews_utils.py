@@ -1,9 +1,12 @@
+import hashlib
 import json
-import requests
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from datetime import datetime
-import time
-import random
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -11,6 +14,25 @@ from tenacity import (
     retry_if_exception_type,
     retry_if_result,
 )
+from .config import get_config
+from .rate_limiter import get_rate_limiter
+from .http_pool import get_session
+
+DEFAULT_GOOGLE_NEWS_CONFIG = {
+    "cache_ttl_seconds": 6 * 3600,  # 0 disables the result cache
+    "page_concurrency": 3,          # pages requested per wave
+    "host_concurrency": 2,          # simultaneous connections per host, across all callers
+    "max_pages": None,              # None paginates until the results run out
+}
+
+_host_semaphores = {}
+_host_semaphores_guard = threading.Lock()
+
+
+def get_google_news_config():
+    settings = DEFAULT_GOOGLE_NEWS_CONFIG.copy()
+    settings.update(get_config().get("google_news", {}))
+    return settings
 
 
 def is_rate_limited(response):
@@ -25,18 +47,108 @@ def is_rate_limited(response):
 )
 def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    # Space requests according to the shared Google quota
+    get_rate_limiter("google").acquire()
+    response = get_session("google").get(url, headers=headers)
     return response
 
 
-def getNewsData(query, start_date, end_date):
+def _host_semaphore(host):
+    with _host_semaphores_guard:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = _host_semaphores[host] = threading.BoundedSemaphore(
+                get_google_news_config()["host_concurrency"]
+            )
+        return semaphore
+
+
+def _fetch_page(query, start_date, end_date, page, headers):
+    """Scrape one result page; returns (results, has_next_page)."""
+    offset = page * 10
+    url = (
+        f"https://www.google.com/search?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+
+    # Bound simultaneous connections per host on top of the request rate limit
+    with _host_semaphore(urlparse(url).netloc):
+        response = make_request(url, headers)
+    soup = BeautifulSoup(response.content, "html.parser")
+    results_on_page = soup.select("div.SoaBEf")
+
+    page_results = []
+    for el in results_on_page:
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            page_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    # Check for the "Next" link (pagination)
+    has_next = bool(results_on_page) and soup.find("a", id="pnnext") is not None
+    return page_results, has_next
+
+
+def _cache_path(query, start_date, end_date):
+    key = json.dumps([query, start_date, end_date])
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return os.path.join(get_config()["data_cache_dir"], "google_news", f"{digest}.json")
+
+
+def _read_cache(query, start_date, end_date, limit):
+    """Cached results if fresh and sufficient for ``limit``, else None."""
+    ttl = get_google_news_config()["cache_ttl_seconds"]
+    if not ttl:
+        return None
+    try:
+        with open(_cache_path(query, start_date, end_date), "r") as f:
+            entry = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if time.time() - entry["fetched_at"] > ttl:
+        return None
+    # A scrape that stopped early only serves callers needing no more results
+    if not entry["complete"] and (limit is None or len(entry["results"]) < limit):
+        return None
+    return entry["results"]
+
+
+def _write_cache(query, start_date, end_date, results, complete):
+    path = _cache_path(query, start_date, end_date)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "w") as f:
+        json.dump({"fetched_at": time.time(), "complete": complete, "results": results}, f)
+    os.replace(path + ".tmp", path)
+
+
+def getNewsData(query, start_date, end_date, limit=None):
     """
     Scrape Google News search results for a given query and date range.
     query: str - search query
     start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
     end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    limit: int - stop paginating once this many results are collected (None: all pages)
+
+    Results are cached on disk per (query, start_date, end_date) for
+    config["google_news"]["cache_ttl_seconds"]. Pages are fetched in waves of
+    ``page_concurrency`` concurrent requests, still spaced by the shared
+    Google rate limiter.
     """
     if "-" in start_date:
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
@@ -45,6 +157,10 @@ def getNewsData(query, start_date, end_date):
         end_date = datetime.strptime(end_date, "%Y-%m-%d")
         end_date = end_date.strftime("%m/%d/%Y")
 
+    cached = _read_cache(query, start_date, end_date, limit)
+    if cached is not None:
+        return cached if limit is None else cached[:limit]
+
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -53,56 +169,45 @@ def getNewsData(query, start_date, end_date):
         )
     }
 
+    settings = get_google_news_config()
+    wave_size = max(1, settings["page_concurrency"])
     news_results = []
+    complete = False
+    failed = False
     page = 0
-    while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
-
-        try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
 
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
+    with ThreadPoolExecutor(max_workers=wave_size, thread_name_prefix="google-news") as executor:
+        max_pages = settings["max_pages"]
+        while max_pages is None or page < max_pages:
+            wave_end = page + wave_size if max_pages is None else min(page + wave_size, max_pages)
+            wave = range(page, wave_end)
+            futures = [
+                executor.submit(_fetch_page, query, start_date, end_date, p, headers)
+                for p in wave
+            ]
+
+            # Consume pages in order; anything after the last page is discarded
+            stop = False
+            for future in futures:
+                if stop:
+                    future.cancel()
+                    continue
                 try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
+                    page_results, has_next = future.result()
                 except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
+                    print(f"Failed after multiple retries: {e}")
+                    failed = stop = True
                     continue
+                news_results.extend(page_results)
+                if not has_next:
+                    complete = stop = True
+                elif limit is not None and len(news_results) >= limit:
+                    stop = True
 
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+            if stop:
                 break
+            page += wave_size
 
-            page += 1
-
-        except Exception as e:
-            print(f"Failed after multiple retries: {e}")
-            break
-
-    return news_results
+    if not failed:
+        _write_cache(query, start_date, end_date, news_results, complete)
+    return news_results if limit is None else news_results[:limit]
@@ -0,0 +1,99 @@
+"""
+Process-wide pooled HTTP clients for the dataflow modules.
+
+Bare ``requests.get`` calls and per-call ``OpenAI(...)`` clients pay a fresh
+TCP + TLS handshake on every request. The registry below hands out one
+keep-alive session per vendor (and one OpenAI client per endpoint/key) with
+bounded per-host connection pools and default timeouts.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import get_config
+
+DEFAULT_HTTP_POOL_CONFIG = {
+    "pool_connections": 10,  # distinct hosts kept per session
+    "pool_maxsize": 10,      # concurrent connections per host
+    "connect_timeout": 10,
+    "read_timeout": 60,
+    # LLM completions can legitimately run for minutes; matches the OpenAI SDK default
+    "llm_read_timeout": 600,
+}
+
+
+def get_http_pool_config() -> Dict:
+    settings = DEFAULT_HTTP_POOL_CONFIG.copy()
+    settings.update(get_config().get("http_pool", {}))
+    return settings
+
+
+class PooledSession(requests.Session):
+    """requests.Session that applies a default (connect, read) timeout."""
+
+    def __init__(self, timeout: Tuple[float, float]):
+        super().__init__()
+        self.default_timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+_sessions: Dict[str, PooledSession] = {}
+_openai_clients: Dict[Tuple[Optional[str], Optional[str]], object] = {}
+_registry_guard = threading.Lock()
+
+
+def get_session(name: str = "default") -> PooledSession:
+    """Return the shared keep-alive session for a vendor (created on first use)."""
+    with _registry_guard:
+        session = _sessions.get(name)
+        if session is None:
+            settings = get_http_pool_config()
+            session = PooledSession((settings["connect_timeout"], settings["read_timeout"]))
+            adapter = HTTPAdapter(
+                pool_connections=settings["pool_connections"],
+                pool_maxsize=settings["pool_maxsize"],
+                pool_block=True,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[name] = session
+        return session
+
+
+def get_openai_client(base_url: Optional[str] = None, api_key: Optional[str] = None):
+    """Return a shared OpenAI client for an endpoint/key pair, backed by a pooled httpx client."""
+    import httpx
+    from openai import OpenAI
+
+    key = (base_url, api_key)
+    with _registry_guard:
+        client = _openai_clients.get(key)
+        if client is None:
+            settings = get_http_pool_config()
+            http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=settings["pool_maxsize"],
+                    max_keepalive_connections=settings["pool_maxsize"],
+                ),
+                timeout=httpx.Timeout(settings["llm_read_timeout"], connect=settings["connect_timeout"]),
+            )
+            client = OpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
+            _openai_clients[key] = client
+        return client
+
+
+def close_all() -> None:
+    """Close every pooled session and client (mainly for tests and benchmarks)."""
+    with _registry_guard:
+        for session in _sessions.values():
+            session.close()
+        for client in _openai_clients.values():
+            client.close()
+        _sessions.clear()
+        _openai_clients.clear()
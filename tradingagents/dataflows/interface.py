@@ -1,37 +1,66 @@
+import logging
+import re
+import time
+import pandas as pd
 from typing import Annotated
 
 # Import from vendor-specific modules
-from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
-from .y_finance import get_YFin_data_online, get_stock_stats_indicators_window, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions, get_yfinance_news, get_fundamentals as get_yfinance_fundamentals
+from .local import get_YFin_data, get_YFin_frame, get_simfin_statement_frame, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
+from .y_finance import get_YFin_data_online, get_YFin_frame_online, get_statement_frame as get_yfinance_statement_frame, get_stock_stats_indicators_window, get_stock_stats_indicators_batch, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions, get_yfinance_news, get_fundamentals as get_yfinance_fundamentals
 from .google import get_google_news, get_global_news_google
 from .openai import get_stock_news_openai, get_global_news_openai, get_fundamentals_openai
 from .alpha_vantage import (
     get_stock as get_alpha_vantage_stock,
+    get_stock_frame as get_alpha_vantage_stock_frame,
     get_indicator as get_alpha_vantage_indicator,
+    get_indicators_batch as get_alpha_vantage_indicators_batch,
     get_fundamentals as get_alpha_vantage_fundamentals,
     get_balance_sheet as get_alpha_vantage_balance_sheet,
     get_cashflow as get_alpha_vantage_cashflow,
     get_income_statement as get_alpha_vantage_income_statement,
+    get_statement_frame as get_alpha_vantage_statement_frame,
     get_insider_transactions as get_alpha_vantage_insider_transactions,
     get_news as get_alpha_vantage_news
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
+from .computed_indicators import (
+    get_indicator as get_computed_indicator,
+    get_indicators_batch as get_computed_indicators_batch,
+)
 
 # Configuration and routing logic
 from .config import get_config
+from .vendor_cache import get_vendor_cache, make_cache_key
+from .alpha_vantage_cache import AlphaVantageCacheMissError
+from .vendor_health import NEUTRAL_ERRORS, RESPONSE_ERRORS, get_vendor_health
+from .metrics import DEPTH_BUCKETS, PAYLOAD_BUCKETS, get_metrics, metrics_enabled
+from .vendor_executor import (
+    call_deadline,
+    get_latency_tracker,
+    get_vendor_hedging_config,
+    hedge_delay,
+    run_hedged,
+    run_vendor_calls,
+)
+
+# Silent unless the application configures logging
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
     "core_stock_apis": {
         "description": "OHLCV stock price data",
         "tools": [
-            "get_stock_data"
+            "get_stock_data",
+            "get_stock_frame"
         ]
     },
     "technical_indicators": {
         "description": "Technical analysis indicators",
         "tools": [
-            "get_indicators"
+            "get_indicators",
+            "get_indicators_batch"
         ]
     },
     "fundamental_data": {
@@ -40,7 +69,8 @@ TOOLS_CATEGORIES = {
             "get_fundamentals",
             "get_balance_sheet",
             "get_cashflow",
-            "get_income_statement"
+            "get_income_statement",
+            "get_statement_frame"
         ]
     },
     "news_data": {
@@ -69,12 +99,25 @@ VENDOR_METHODS = {
         "yfinance": get_YFin_data_online,
         "local": get_YFin_data,
     },
+    # Typed frames for internal consumers (see frames.py)
+    "get_stock_frame": {
+        "alpha_vantage": get_alpha_vantage_stock_frame,
+        "yfinance": get_YFin_frame_online,
+        "local": get_YFin_frame,
+    },
     # technical_indicators
     "get_indicators": {
         "alpha_vantage": get_alpha_vantage_indicator,
+        "computed": get_computed_indicator,
         "yfinance": get_stock_stats_indicators_window,
         "local": get_stock_stats_indicators_window
     },
+    "get_indicators_batch": {
+        "alpha_vantage": get_alpha_vantage_indicators_batch,
+        "computed": get_computed_indicators_batch,
+        "yfinance": get_stock_stats_indicators_batch,
+        "local": get_stock_stats_indicators_batch
+    },
     # fundamental_data
     "get_fundamentals": {
         "alpha_vantage": get_alpha_vantage_fundamentals,
@@ -96,6 +139,11 @@ VENDOR_METHODS = {
         "yfinance": get_yfinance_income_statement,
         "local": get_simfin_income_statements,
     },
+    "get_statement_frame": {
+        "alpha_vantage": get_alpha_vantage_statement_frame,
+        "yfinance": get_yfinance_statement_frame,
+        "local": get_simfin_statement_frame,
+    },
     # news_data
     "get_news": {
         "alpha_vantage": get_alpha_vantage_news,
@@ -141,6 +189,114 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
+def _collect_vendor_results(vendor: str, impls: list, outcomes: list) -> list:
+    """Log each implementation's outcome and return the successful results in order."""
+    vendor_results = []
+    for impl_func, (status, value) in zip(impls, outcomes):
+        if status == "ok":
+            vendor_results.append(value)
+            logger.debug("%s from vendor '%s' completed successfully", impl_func.__name__, vendor)
+        elif status == "timeout":
+            logger.warning("%s from vendor '%s' missed the call deadline, result dropped", impl_func.__name__, vendor)
+        elif isinstance(value, AlphaVantageRateLimitError):
+            logger.warning("Vendor '%s' rate limit exceeded, falling back to next available vendor: %s", vendor, value)
+        else:
+            # Log error but continue with other implementations
+            logger.warning("%s from vendor '%s' failed: %s", impl_func.__name__, vendor, value)
+    return vendor_results
+
+_NEUTRAL_ERRORS = NEUTRAL_ERRORS + (AlphaVantageCacheMissError,)
+_RESPONSE_ERRORS = RESPONSE_ERRORS + (pd.errors.ParserError,)
+
+
+def _is_neutral_error(error) -> bool:
+    return isinstance(error, _NEUTRAL_ERRORS) and not isinstance(error, _RESPONSE_ERRORS)
+
+
+def _record_vendor_health(method: str, vendor: str, outcomes: list) -> None:
+    """Feed a vendor attempt's outcome to its circuit breaker."""
+    health = get_vendor_health()
+    if any(status == "ok" for status, _ in outcomes):
+        health.record_success(vendor, method)
+        return
+    # Cache misses, "no data for this symbol" and bad arguments say nothing about the vendor
+    relevant = [(status, value) for status, value in outcomes
+                if not (status == "error" and _is_neutral_error(value))]
+    if outcomes and not relevant:
+        health.record_neutral(vendor, method)
+        return
+    outcomes = relevant
+    errors = [value for status, value in outcomes if status == "error"]
+    rate_limited = next((e for e in errors if isinstance(e, AlphaVantageRateLimitError)), None)
+    if rate_limited is not None:
+        # The quota is shared by every method of the vendor
+        methods = [name for name, vendors in VENDOR_METHODS.items() if vendor in vendors]
+        health.trip(vendor, methods, rate_limited)
+    elif errors:
+        health.record_failure(vendor, method, errors[-1])
+    elif outcomes:
+        # Missing our own deadline is a caller-side limit, not a vendor failure
+        health.record_neutral(vendor, method)
+
+# Text some vendor implementations return instead of raising: "Error ...",
+# "No <something> found ..." (yfinance, Google News) and "" (local / SimFin)
+_ERROR_RESULT = re.compile(r"\s*(?:Error\b|No\b[^\n]*?\bfound\b)")
+
+
+def _is_error_result(result) -> bool:
+    """True for failure text that should not be memoized as data."""
+    return isinstance(result, str) and (not result.strip() or _ERROR_RESULT.match(result) is not None)
+
+def _payload_size(result) -> int:
+    if isinstance(result, pd.DataFrame):
+        # Rendering a frame to text just to measure it would cost more than the call
+        return int(result.memory_usage(index=True).sum())
+    return len(result) if isinstance(result, (str, bytes)) else len(str(result))
+
+def _record_attempt(method: str, vendor: str, depth: int, outcomes: list, seconds: float, emit_metrics: bool) -> None:
+    """Emit the structured event and metrics for one vendor attempt."""
+    log_event = logger.isEnabledFor(logging.DEBUG)
+    if not (log_event or emit_metrics):
+        return
+    results = [value for status, value in outcomes if status == "ok"]
+    errors = [value for status, value in outcomes if status == "error"]
+    if results:
+        outcome = "ok"
+    elif any(isinstance(e, AlphaVantageRateLimitError) for e in errors):
+        outcome = "rate_limited"
+    elif errors:
+        outcome = "error"
+    else:
+        outcome = outcomes[0][0] if outcomes else "error"  # timeout / cancelled
+
+    payload = sum(_payload_size(r) for r in results)
+    if log_event:
+        event = {
+            "method": method,
+            "vendor": vendor,
+            "fallback_depth": depth,
+            "outcome": outcome,
+            "latency_seconds": round(seconds, 6),
+            "exception": type(errors[-1]).__name__ if errors else None,
+            "payload_chars": payload,
+        }
+        logger.debug("vendor attempt %s", event, extra={"vendor_event": event})
+
+    if not emit_metrics:
+        return
+    metrics = get_metrics()
+    labels = {"method": method, "vendor": vendor}
+    metrics.inc("vendor_attempts_total", {**labels, "outcome": outcome},
+                help="Vendor attempts by outcome")
+    metrics.observe("vendor_attempt_latency_seconds", seconds, labels,
+                    help="Wall time of a vendor attempt (all of its implementations)")
+    for error in errors:
+        metrics.inc("vendor_errors_total", {**labels, "exception": type(error).__name__},
+                    help="Exceptions raised by vendor implementations")
+    if results:
+        metrics.observe("vendor_payload_chars", payload, labels, buckets=PAYLOAD_BUCKETS,
+                        help="Size of successful vendor payloads in characters (bytes for frames)")
+
 def route_to_vendor(method: str, *args, **kwargs):
     """Route method calls to appropriate vendor implementation with fallback support."""
     category = get_category_for_method(method)
@@ -152,6 +308,21 @@ def route_to_vendor(method: str, *args, **kwargs):
     if method not in VENDOR_METHODS:
         raise ValueError(f"Method '{method}' not supported")
 
+    emit_metrics = metrics_enabled()
+    route_started = time.monotonic()
+
+    # Serve repeated identical requests from the memo cache
+    cache = get_vendor_cache()
+    cache_key = make_cache_key(method, vendor_config, args, kwargs) if cache else None
+    if cache_key is not None:
+        hit, cached_result = cache.get(cache_key)
+        if hit:
+            logger.debug("%s - served from vendor cache", method)
+            if emit_metrics:
+                get_metrics().inc("route_calls_total", {"method": method, "outcome": "cache_hit"},
+                                  help="Routed calls by outcome")
+            return cached_result
+
     # Get all available vendors for this method for fallback
     all_available_vendors = list(VENDOR_METHODS[method].keys())
     
@@ -161,87 +332,174 @@ def route_to_vendor(method: str, *args, **kwargs):
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
 
-    # Debug: Print fallback ordering
-    primary_str = " → ".join(primary_vendors)
-    fallback_str = " → ".join(fallback_vendors)
-    print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
+    logger.debug("%s - Primary: %s | Full fallback order: %s", method, primary_vendors, fallback_vendors)
 
     # Track results and execution state
     results = []
     vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
     successful_vendor = None
+    successful_depth = None
 
+    # Resolve the vendors to try, in fallback order, with their implementations
+    vendor_plan = []
+    health = get_vendor_health()
     for vendor in fallback_vendors:
         if vendor not in VENDOR_METHODS[method]:
             if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
+                logger.info("Vendor '%s' not supported for method '%s', falling back to next vendor", vendor, method)
+            continue
+        if not health.allow_request(vendor, method):
+            logger.info("Vendor '%s' circuit is open for %s, skipping", vendor, method)
+            if emit_metrics:
+                get_metrics().inc("vendor_skipped_total", {"method": method, "vendor": vendor},
+                                  help="Vendors skipped because their circuit breaker is open")
             continue
 
         vendor_impl = VENDOR_METHODS[method][vendor]
-        is_primary_vendor = vendor in primary_vendors
-        vendor_attempt_count += 1
-
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
-
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
-
         # Handle list of methods for a vendor
         if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
+            vendor_plan.append((vendor, list(vendor_impl)))
         else:
-            vendor_methods = [(vendor_impl, vendor)]
-
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
+            vendor_plan.append((vendor, [vendor_impl]))
+
+    # Multiple vendor configs (comma-separated) collect from every source, so
+    # all vendors are fanned out at once; single-vendor configs try one vendor
+    # at a time and stop at the first that succeeds
+    if len(primary_vendors) > 1:
+        batches = [vendor_plan]
+    else:
+        batches = [[entry] for entry in vendor_plan]
+
+    attempt_seconds = {}
+    attempted = set()
+
+    def announce(vendor, impls):
+        nonlocal vendor_attempt_count
+        vendor_attempt_count += 1
+        attempted.add(vendor)
+        if logger.isEnabledFor(logging.DEBUG):
+            vendor_type = "PRIMARY" if vendor in primary_vendors else "FALLBACK"
+            logger.debug("Attempting %s vendor '%s' for %s (attempt #%d, %d implementation(s))",
+                         vendor_type, vendor, method, vendor_attempt_count, len(impls))
+        return vendor_attempt_count - 1
+
+    def run_vendor(vendor, impls):
+        start_time = time.monotonic()
+        outcomes = run_vendor_calls(
+            [(impl, args, kwargs) for impl in impls], call_deadline(method, fan_out=len(impls) > 1)
+        )
+        attempt_seconds[vendor] = time.monotonic() - start_time
+        if any(status == "ok" for status, _ in outcomes):
+            get_latency_tracker().record(method, vendor, attempt_seconds[vendor])
+        return outcomes
+
+    # Hedging: start the next fallback vendor when the current one is slower than usual
+    if get_vendor_hedging_config()["enabled"] and len(batches) > 1 and len(primary_vendors) == 1:
+        logger.debug("Hedging %s across %s", method, fallback_vendors)
+        hedge_started = time.monotonic()
+        winner, attempt_outcomes = run_hedged(
+            [lambda vendor=vendor, impls=impls: run_vendor(vendor, impls) for vendor, impls in vendor_plan],
+            [hedge_delay(method, vendor) for vendor, _ in vendor_plan],
+            lambda outcomes: any(status == "ok" for status, _ in outcomes),
+            call_deadline(method),
+        )
+        for index, ((vendor, impls), (status, value)) in enumerate(zip(vendor_plan, attempt_outcomes)):
+            if status == "not_started":
                 continue
+            depth = announce(vendor, impls)
+            if status == "ok":
+                vendor_results = _collect_vendor_results(vendor, impls, value)
+                _record_vendor_health(method, vendor, value)
+                _record_attempt(method, vendor, depth, value, attempt_seconds.get(vendor, 0.0), emit_metrics)
+                if index == winner:
+                    results.extend(vendor_results)
+                    successful_vendor, successful_depth = vendor, depth
+                    logger.debug("Vendor '%s' answered first - Got %d result(s)", vendor, len(vendor_results))
+                else:
+                    logger.warning("Vendor '%s' produced no results", vendor)
+            else:
+                if status == "error":
+                    _record_vendor_health(method, vendor, [(status, value)])
+                    logger.warning("Vendor '%s' failed: %s", vendor, value)
+                else:
+                    logger.info("Vendor '%s' %s after another vendor answered, result dropped", vendor, status)
+                _record_attempt(method, vendor, depth, [(status, value)],
+                                time.monotonic() - hedge_started, emit_metrics)
+        batches = []
+
+    for batch in batches:
+        depths = [announce(vendor, impls) for vendor, impls in batch]
 
-        # Add this vendor's results
-        if vendor_results:
-            results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
-            
-            # Stopping logic: Stop after first successful vendor for single-vendor configs
-            # Multiple vendor configs (comma-separated) may want to collect from multiple sources
-            if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
-                break
+        # Run methods for these vendors (concurrently, bounded by the deadline)
+        if len(batch) == 1:
+            outcomes = iter(run_vendor(*batch[0]))
         else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
+            batch_started = time.monotonic()
+            calls = [(impl, args, kwargs) for _, impls in batch for impl in impls]
+            outcomes = iter(run_vendor_calls(calls, call_deadline(method)))
+            for vendor, _ in batch:
+                attempt_seconds[vendor] = time.monotonic() - batch_started
+
+        stop = False
+        for (vendor, impls), depth in zip(batch, depths):
+            vendor_outcomes = [next(outcomes) for _ in impls]
+            vendor_results = _collect_vendor_results(vendor, impls, vendor_outcomes)
+            _record_vendor_health(method, vendor, vendor_outcomes)
+            _record_attempt(method, vendor, depth, vendor_outcomes, attempt_seconds[vendor], emit_metrics)
+
+            # Add this vendor's results
+            if vendor_results:
+                results.extend(vendor_results)
+                if successful_vendor is None:
+                    successful_vendor, successful_depth = vendor, depth
+                logger.debug("Vendor '%s' succeeded - Got %d result(s)", vendor, len(vendor_results))
+
+                # Stopping logic: Stop after first successful vendor for single-vendor configs
+                if len(primary_vendors) == 1:
+                    stop = True
+            else:
+                logger.warning("Vendor '%s' produced no results", vendor)
+
+        if stop:
+            break
+
+    # Vendors admitted but never tried give back any half-open trial slot
+    for vendor, _ in vendor_plan:
+        if vendor not in attempted:
+            health.record_neutral(vendor, method)
+
+    if emit_metrics:
+        metrics = get_metrics()
+        metrics.inc("route_calls_total", {"method": method, "outcome": "ok" if results else "failed"},
+                    help="Routed calls by outcome")
+        metrics.observe("route_latency_seconds", time.monotonic() - route_started, {"method": method},
+                        help="Wall time of route_to_vendor calls that reached a vendor")
+        if successful_depth is not None:
+            metrics.observe("route_fallback_depth", successful_depth, {"method": method}, buckets=DEPTH_BUCKETS,
+                            help="Vendor attempts before the first one that answered")
 
     # Final result summary
     if not results:
-        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
+        logger.error("All %d vendor attempts failed for method '%s'", vendor_attempt_count, method)
         raise RuntimeError(f"All vendor implementations failed for method '{method}'")
     else:
-        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+        logger.debug("Method '%s' completed with %d result(s) from %d vendor attempt(s)",
+                     method, len(results), vendor_attempt_count)
 
     # Return single result if only one, otherwise concatenate as string
     if len(results) == 1:
-        return results[0]
+        final_result = results[0]
+    elif all(isinstance(result, pd.DataFrame) for result in results):
+        # Frames cannot be joined as text; the first vendor in fallback order wins
+        final_result = results[0]
     else:
         # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        final_result = '\n'.join(str(result) for result in results)
+
+    # Vendors that report failures as text ("Error retrieving ...", "No data
+    # found ...", "") must not have them memoized, or a transient failure
+    # sticks for the cache TTL
+    if cache_key is not None and not any(_is_error_result(result) for result in results):
+        cache.put(cache_key, final_result)
+
+    return final_result
@@ -2,12 +2,22 @@ from typing import Annotated
 import pandas as pd
 import os
 from .config import DATA_DIR
+from .simfin_store import get_statement_index, latest_statement, simfin_source_path
+from .finnhub_store import dedupe_entries, finnhub_data_path, get_date_index
+from .local_price_cache import get_local_prices
+from .frames import to_price_frame, to_statement_frame
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-import json
 from .reddit_utils import fetch_top_from_category
 from tqdm import tqdm
 
+def _price_data_path(symbol: str) -> str:
+    return os.path.join(
+        DATA_DIR,
+        f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
+    )
+
+
 def get_YFin_data_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -18,24 +28,11 @@ def get_YFin_data_window(
     before = date_obj - relativedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
+    # read in data (parsed once per process, then sliced by date)
+    prices = get_local_prices(_price_data_path(symbol))
 
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    filtered_data = prices.between(start_date, curr_date)
 
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
@@ -54,34 +51,33 @@ def get_YFin_data(
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
     # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
+    prices = get_local_prices(_price_data_path(symbol))
 
     if end_date > "2025-03-25":
         raise Exception(
             f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    filtered_data = prices.between(start_date, end_date)
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
 
     return filtered_data
 
+def get_YFin_frame(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+) -> pd.DataFrame:
+    """Typed daily bars from the local price files."""
+    prices = get_local_prices(_price_data_path(symbol))
+    data = prices.between(start_date, end_date)
+    # Row labels are positions in the file, so they index the parsed dates directly
+    data = data.drop(columns="Date").set_axis(prices.dates[data.index], axis=0)
+    return to_price_frame(data)
+
 def get_finnhub_news(
     query: Annotated[str, "Search query or ticker symbol"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -140,12 +136,9 @@ def get_finnhub_company_insider_sentiment(
         return ""
 
     result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    entries = (entry for senti_list in data.values() for entry in senti_list)
+    for entry in dedupe_entries(entries):
+        result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -178,12 +171,9 @@ def get_finnhub_company_insider_transactions(
 
     result_str = ""
 
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    entries = (entry for trans_list in data.values() for entry in trans_list)
+    for entry in dedupe_entries(entries):
+        result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
@@ -202,27 +192,10 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
     """
 
-    if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
-    else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
-        )
-
-    data = open(data_path, "r")
-    data = json.load(data)
+    data_path = finnhub_data_path(data_dir, ticker, data_type, period)
 
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    # filter keys (date, str in format YYYY-MM-DD) by the date range via the cached sorted index
+    return get_date_index(data_path).range(start_date, end_date)
 
 def get_simfin_balance_sheet(
     ticker: Annotated[str, "ticker symbol"],
@@ -232,35 +205,14 @@ def get_simfin_balance_sheet(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # Latest report published on or before the current date, from the indexed store
+    latest_balance_sheet = latest_statement(DATA_DIR, "balance_sheet", ticker, freq, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
@@ -279,35 +231,14 @@ def get_simfin_cashflow(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # Latest report published on or before the current date, from the indexed store
+    latest_cash_flow = latest_statement(DATA_DIR, "cash_flow", ticker, freq, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
@@ -326,35 +257,14 @@ def get_simfin_income_statements(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # Latest report published on or before the current date, from the indexed store
+    latest_income = latest_statement(DATA_DIR, "income_statements", ticker, freq, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_income = latest_income.drop("SimFinId")
 
@@ -365,6 +275,27 @@ def get_simfin_income_statements(
     )
 
 
+# statement name used by the frame API -> SimFin statement
+_SIMFIN_STATEMENT_NAMES = {
+    "balance_sheet": "balance_sheet",
+    "cashflow": "cash_flow",
+    "income_statement": "income_statements",
+}
+
+
+def get_simfin_statement_frame(
+    ticker: Annotated[str, "ticker symbol"],
+    statement: Annotated[str, "balance_sheet, cashflow or income_statement"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"] = "quarterly",
+    curr_date: Annotated[str, "only reports published on or before this date, yyyy-mm-dd"] = None,
+) -> pd.DataFrame:
+    """Typed SimFin statement history, indexed by report date."""
+    simfin_statement = _SIMFIN_STATEMENT_NAMES[statement]
+    index = get_statement_index(simfin_source_path(DATA_DIR, simfin_statement, freq), simfin_statement, freq)
+    rows = index.history(ticker, curr_date).set_index("Report Date")
+    return to_statement_frame(rows, drop=("SimFinId", "Fiscal Year", "Publish Date", "Restated Date"))
+
+
 def get_reddit_global_news(
     curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "Number of days to look back"] = 7,
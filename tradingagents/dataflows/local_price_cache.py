@@ -0,0 +1,128 @@
+"""
+Process-wide cache of the local vendor's per-symbol price CSVs.
+
+The local price files hold ten years of daily bars, and every
+get_YFin_data / get_YFin_data_window call used to parse the whole CSV again
+and filter it through a temporary string column. Each file is now parsed
+once into a frame plus a parsed DatetimeIndex of its trading days, and a
+date range is two ``searchsorted`` calls and a positional slice. Frames are
+kept in LRU order and evicted once their combined size exceeds
+config["local_price_cache"]["max_bytes"]; a file is re-read when its size
+or mtime changes.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+import pandas as pd
+
+from .config import get_config
+
+DEFAULT_LOCAL_PRICE_CACHE_CONFIG = {
+    "max_bytes": 256 * 1024 * 1024,  # combined in-memory size of cached frames
+}
+
+
+def get_local_price_cache_config():
+    settings = DEFAULT_LOCAL_PRICE_CACHE_CONFIG.copy()
+    settings.update(get_config().get("local_price_cache", {}))
+    return settings
+
+
+class LocalPriceFrame:
+    """One price CSV as read from disk, with its trading days as a DatetimeIndex."""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.dates = pd.DatetimeIndex(pd.to_datetime(frame["Date"].astype(str).str[:10]))
+        self.sorted = self.dates.is_monotonic_increasing
+        self.nbytes = int(frame.memory_usage(index=True, deep=True).sum()) + self.dates.nbytes
+
+    def between(self, start_date: str, end_date: str) -> pd.DataFrame:
+        """Rows with start_date <= day <= end_date (inclusive), original index kept."""
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+        if not self.sorted:
+            return self.frame[(self.dates >= start) & (self.dates <= end)]
+        lo = self.dates.searchsorted(start, side="left")
+        hi = self.dates.searchsorted(end, side="right")
+        return self.frame.iloc[lo:hi]
+
+
+def _signature(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+class LocalPriceFrameCache:
+    """Thread-safe LRU of LocalPriceFrame objects bounded by total bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[tuple, LocalPriceFrame]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path: str) -> LocalPriceFrame:
+        signature = _signature(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Parse outside the lock so other symbols are not held up
+        prices = LocalPriceFrame(pd.read_csv(path))
+
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self.total_bytes -= previous[1].nbytes
+            self._entries[path] = (signature, prices)
+            self.total_bytes += prices.nbytes
+            # Always keep the frame just loaded, even if it alone exceeds the cap
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted.nbytes
+                self.evictions += 1
+        return prices
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_cache = None
+_cache_guard = threading.Lock()
+
+
+def get_local_price_cache() -> LocalPriceFrameCache:
+    global _cache
+    with _cache_guard:
+        if _cache is None:
+            _cache = LocalPriceFrameCache(get_local_price_cache_config()["max_bytes"])
+        return _cache
+
+
+def get_local_prices(path: str) -> LocalPriceFrame:
+    """Cached, date-indexed contents of a local price CSV."""
+    return get_local_price_cache().get(path)
@@ -0,0 +1,173 @@
+"""
+In-process metrics for the vendor router.
+
+A small counter/histogram registry that route_to_vendor feeds with one
+sample per vendor attempt and per routed call. Nothing is exported on its
+own: callers read the registry with ``snapshot()`` or dump it as JSON or as
+Prometheus text exposition format. Recording is a dict update under a lock,
+and can be turned off entirely with ``config["router_metrics"]["enabled"]``.
+"""
+
+import bisect
+import json
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .config import get_config
+
+DEFAULT_ROUTER_METRICS_CONFIG = {
+    "enabled": True,
+}
+
+# Seconds; vendor calls range from cache-fast reads to multi-second scrapes
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# Characters of a string payload (in-memory bytes of a frame)
+PAYLOAD_BUCKETS = (100, 1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000)
+# Vendor attempts before the one that answered (0 = primary answered)
+DEPTH_BUCKETS = (0, 1, 2, 3, 4)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def get_router_metrics_config() -> Dict[str, Any]:
+    settings = DEFAULT_ROUTER_METRICS_CONFIG.copy()
+    settings.update(get_config().get("router_metrics", {}))
+    return settings
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        cumulative, running = {}, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            cumulative["+Inf" if bound == float("inf") else _format_number(bound)] = running
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def _labels(labels: Optional[Dict[str, Any]]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in (labels or {}).items()))
+
+
+class MetricsRegistry:
+    """Thread-safe counters and fixed-bucket histograms keyed by name and labels."""
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, labels: Optional[Dict[str, Any]] = None, value: float = 1, help: str = "") -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+            if help:
+                self._help.setdefault(name, help)
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[Dict[str, Any]] = None,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        help: str = "",
+    ) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(buckets)
+            histogram.observe(value)
+            if help:
+                self._help.setdefault(name, help)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict copy of every series: {"counters": {...}, "histograms": {...}}."""
+        with self._lock:
+            return {
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "histograms": {
+                    name: [{"labels": dict(key), **histogram.to_dict()} for key, histogram in series.items()]
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, series in snapshot["counters"].items():
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} counter")
+            for sample in series:
+                lines.append(f"{name}{_prometheus_labels(sample['labels'])} {_format_number(sample['value'])}")
+        for name, series in snapshot["histograms"].items():
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for sample in series:
+                for bound, count in sample["buckets"].items():
+                    labels = _prometheus_labels({**sample["labels"], "le": bound})
+                    lines.append(f"{name}_bucket{labels} {count}")
+                labels = _prometheus_labels(sample["labels"])
+                lines.append(f"{name}_sum{labels} {sample['sum']}")
+                lines.append(f"{name}_count{labels} {sample['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    return _registry
+
+
+def metrics_enabled() -> bool:
+    return get_router_metrics_config()["enabled"]
+
+
+def dump_metrics_json(indent: Optional[int] = 2) -> str:
+    return _registry.to_json(indent)
+
+
+def dump_metrics_prometheus() -> str:
+    return _registry.to_prometheus()
@@ -0,0 +1,384 @@
+"""
+Per-symbol OHLCV store under ``data_cache_dir``.
+
+Each symbol lives in a single columnar file (Parquet when pyarrow is
+installed, CSV otherwise) that is extended in place. Only the bars after the
+last stored date are downloaded, so a daily run fetches a few rows per
+ticker instead of re-downloading the full history. ``prefetch`` fills or
+tops up the store for a whole universe with batched multi-ticker downloads.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Annotated, Dict, Iterable, List, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .rate_limiter import get_rate_limiter
+
+try:
+    import pyarrow  # noqa: F401
+
+    STORE_FORMAT = "parquet"
+except ImportError:
+    STORE_FORMAT = "csv"
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+
+# How far back a symbol's history starts the first time it is fetched
+HISTORY_YEARS = 15
+
+# Symbols per multi-ticker request in prefetch
+PREFETCH_BATCH_SIZE = 50
+
+# Relative difference on the overlapping bar that means the provider has
+# re-adjusted history (split/dividend) and the stored series must be rebuilt
+_ADJUSTMENT_TOLERANCE = 1e-6
+
+_symbol_locks = {}
+_symbol_locks_guard = threading.Lock()
+
+
+def _symbol_lock(symbol: str) -> threading.Lock:
+    with _symbol_locks_guard:
+        if symbol not in _symbol_locks:
+            _symbol_locks[symbol] = threading.Lock()
+        return _symbol_locks[symbol]
+
+
+def get_store_dir() -> str:
+    """Directory holding the per-symbol OHLCV files."""
+    config = get_config()
+    return os.path.join(config["data_cache_dir"], "ohlcv")
+
+
+def _store_path(symbol: str) -> str:
+    return os.path.join(get_store_dir(), f"{symbol}.{STORE_FORMAT}")
+
+
+def _meta_path(symbol: str) -> str:
+    return os.path.join(get_store_dir(), f"{symbol}.meta.json")
+
+
+def _read_meta(symbol: str) -> dict:
+    try:
+        with open(_meta_path(symbol), "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _replace(path: str, write) -> None:
+    """Write through write(tmp_path) to a unique temp file, then swap it into place.
+
+    The temp name is unique per call, so processes sharing the cache never
+    write into each other's half-finished file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _write_json(path: str, data: dict) -> None:
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def _write_meta(symbol: str, meta: dict) -> None:
+    _replace(_meta_path(symbol), lambda tmp_path: _write_json(tmp_path, meta))
+
+
+def normalize_ohlcv(data: pd.DataFrame) -> pd.DataFrame:
+    """Coerce a provider frame to the store layout: tz-naive daily DatetimeIndex named Date."""
+    if data is None or data.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], name="Date"))
+
+    data = data.copy()
+    if "Date" in data.columns:
+        data = data.set_index("Date")
+    index = pd.to_datetime(data.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    data.index = index.normalize()
+    data.index.name = "Date"
+
+    columns = [col for col in OHLCV_COLUMNS if col in data.columns]
+    data = data[columns].astype("float64")
+    data = data[~data.index.duplicated(keep="last")].sort_index()
+    return data
+
+
+def read_stored_ohlcv(symbol: Annotated[str, "ticker symbol"]) -> Optional[pd.DataFrame]:
+    """Read the stored bars for a symbol, or None if nothing has been stored yet."""
+    path = _store_path(symbol.upper())
+    if not os.path.exists(path):
+        return None
+    if STORE_FORMAT == "parquet":
+        data = pd.read_parquet(path)
+    else:
+        data = pd.read_csv(path, index_col="Date", parse_dates=["Date"])
+    return data
+
+
+def write_ohlcv(
+    symbol: Annotated[str, "ticker symbol"],
+    data: Annotated[pd.DataFrame, "new bars to merge into the store"],
+    replace: Annotated[bool, "discard previously stored bars"] = False,
+) -> pd.DataFrame:
+    """Merge bars into a symbol's stored series and persist it atomically.
+
+    Newer rows win on overlapping dates, so re-fetching a partial session bar
+    overwrites it. Returns the full stored series after the merge.
+    """
+    symbol = symbol.upper()
+    os.makedirs(get_store_dir(), exist_ok=True)
+
+    data = normalize_ohlcv(data)
+    existing = None if replace else read_stored_ohlcv(symbol)
+    if existing is not None and not existing.empty:
+        data = pd.concat([existing, data])
+        data = data[~data.index.duplicated(keep="last")].sort_index()
+
+    _replace(_store_path(symbol), data.to_parquet if STORE_FORMAT == "parquet" else data.to_csv)
+    return data
+
+
+def _today() -> pd.Timestamp:
+    return pd.Timestamp.today().normalize()
+
+
+def _download_ohlcv(symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Download adjusted daily bars for [start, end) from Yahoo Finance."""
+    get_rate_limiter("yfinance").acquire()
+    data = yf.Ticker(symbol).history(
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        auto_adjust=True,
+    )
+    return normalize_ohlcv(data)
+
+
+def _history_adjusted(stored: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+    """Check whether the provider re-adjusted bars we already hold."""
+    overlap = stored.index.intersection(fresh.index)
+    if overlap.empty:
+        return False
+    old_close = stored.loc[overlap, "Close"]
+    new_close = fresh.loc[overlap, "Close"]
+    relative_diff = ((old_close - new_close).abs() / new_close.abs()).max()
+    return bool(relative_diff > _ADJUSTMENT_TOLERANCE)
+
+
+def load_ohlcv(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[Optional[str], "Start date in yyyy-mm-dd format"] = None,
+    end_date: Annotated[Optional[str], "End date in yyyy-mm-dd format (inclusive)"] = None,
+) -> pd.DataFrame:
+    """Return daily OHLCV bars for a symbol, topping up the local store as needed.
+
+    The first call downloads ``HISTORY_YEARS`` of history. Later calls only
+    download the bars after the last stored date, at most once per calendar
+    day, and skip the network entirely when ``end_date`` is already covered.
+
+    Returns:
+        DataFrame indexed by a tz-naive DatetimeIndex named ``Date``.
+    """
+    symbol = symbol.upper()
+    today = _today()
+    tomorrow = today + pd.Timedelta(days=1)
+    requested_start = pd.Timestamp(start_date) if start_date else None
+    requested_end = pd.Timestamp(end_date) if end_date else today
+
+    with _symbol_lock(symbol):
+        stored = read_stored_ohlcv(symbol)
+        meta = _read_meta(symbol)
+
+        if stored is None or stored.empty:
+            history_start = today - pd.DateOffset(years=HISTORY_YEARS)
+            if requested_start is not None:
+                history_start = min(history_start, requested_start)
+            stored = write_ohlcv(
+                symbol, _download_ohlcv(symbol, history_start, tomorrow), replace=True
+            )
+            meta = {
+                "history_start": history_start.strftime("%Y-%m-%d"),
+                "checked": today.strftime("%Y-%m-%d"),
+            }
+            _write_meta(symbol, meta)
+        else:
+            history_start = pd.Timestamp(meta.get("history_start", stored.index[0]))
+
+            # Head: the caller wants bars from before anything we asked for so far
+            if requested_start is not None and requested_start < history_start:
+                head = _download_ohlcv(symbol, requested_start, stored.index[0])
+                stored = write_ohlcv(symbol, head)
+                history_start = requested_start
+                meta["history_start"] = history_start.strftime("%Y-%m-%d")
+
+            # Tail: refresh at most once a day, and only if the caller needs it
+            last_bar = stored.index[-1]
+            needs_tail = requested_end > last_bar and meta.get("checked") != today.strftime("%Y-%m-%d")
+            if needs_tail:
+                # Re-fetch the last stored bar, which may have been a partial
+                # session, and overwrite it. Re-adjustments are detected on the
+                # bar before it, which was final when it was stored.
+                tail_start = stored.index[-2] if len(stored) > 1 else last_bar
+                tail = _download_ohlcv(symbol, tail_start, tomorrow)
+                if _history_adjusted(stored[stored.index < last_bar], tail):
+                    stored = write_ohlcv(
+                        symbol, _download_ohlcv(symbol, history_start, tomorrow), replace=True
+                    )
+                elif not tail.empty:
+                    stored = write_ohlcv(symbol, tail)
+                meta["checked"] = today.strftime("%Y-%m-%d")
+
+            meta.setdefault("history_start", history_start.strftime("%Y-%m-%d"))
+            _write_meta(symbol, meta)
+
+    if requested_start is not None:
+        stored = stored[stored.index >= requested_start]
+    return stored[stored.index <= requested_end]
+
+
+def _download_ohlcv_batch(
+    symbols: List[str], start: pd.Timestamp, end: pd.Timestamp
+) -> Dict[str, pd.DataFrame]:
+    """Download adjusted daily bars for [start, end) for several symbols in one request."""
+    get_rate_limiter("yfinance").acquire()
+    data = yf.download(
+        symbols,
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        auto_adjust=True,
+        actions=True,
+        group_by="ticker",
+        progress=False,
+        threads=True,
+    )
+    frames = {}
+    if data is None or data.empty:
+        return frames
+    if not isinstance(data.columns, pd.MultiIndex):
+        # Older yfinance releases return flat columns for a single symbol
+        frames[symbols[0]] = normalize_ohlcv(data)
+        return frames
+    available = set(data.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol in available:
+            # Symbols the provider knows nothing about come back as all-NaN rows
+            frames[symbol] = normalize_ohlcv(data[symbol].dropna(how="all"))
+    return frames
+
+
+def _prefetch_plan(symbol: str, requested_start, requested_end, today) -> Optional[tuple]:
+    """(download start, replace) for a symbol, or None when the store already covers it."""
+    stored = read_stored_ohlcv(symbol)
+    meta = _read_meta(symbol)
+    if stored is None or stored.empty:
+        history_start = today - pd.DateOffset(years=HISTORY_YEARS)
+        if requested_start is not None:
+            history_start = min(history_start, requested_start)
+        return history_start, True
+
+    history_start = pd.Timestamp(meta.get("history_start", stored.index[0]))
+    if requested_start is not None and requested_start < history_start:
+        # Rebuilding from the earlier start is one request instead of head + tail
+        return requested_start, True
+    last_bar = stored.index[-1]
+    if requested_end > last_bar and meta.get("checked") != today.strftime("%Y-%m-%d"):
+        # From the bar before the last one, as in load_ohlcv
+        return (stored.index[-2] if len(stored) > 1 else last_bar), False
+    return None
+
+
+def prefetch(
+    symbols: Annotated[Iterable[str], "ticker symbols to fetch"],
+    start_date: Annotated[Optional[str], "Start date in yyyy-mm-dd format"] = None,
+    end_date: Annotated[Optional[str], "End date in yyyy-mm-dd format (inclusive)"] = None,
+    batch_size: Annotated[int, "symbols per multi-ticker request"] = PREFETCH_BATCH_SIZE,
+) -> Dict[str, List[str]]:
+    """Fill or top up the store for many symbols using batched multi-ticker downloads.
+
+    Each symbol is planned exactly as ``load_ohlcv`` would (full history on
+    first use, otherwise only the bars after the last stored one). Symbols
+    needing the same download window are requested together, ``batch_size``
+    at a time. Afterwards ``load_ohlcv`` calls for these symbols and dates
+    are served from disk.
+
+    Returns:
+        {"fetched": [...], "skipped": [...], "failed": [...]} of symbols.
+    """
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    today = _today()
+    tomorrow = today + pd.Timedelta(days=1)
+    requested_start = pd.Timestamp(start_date) if start_date else None
+    requested_end = pd.Timestamp(end_date) if end_date else today
+    batch_size = max(1, batch_size)
+    summary = {"fetched": [], "skipped": [], "failed": []}
+
+    # Group symbols by download window so one request serves a whole batch
+    groups: Dict[tuple, List[str]] = {}
+    for symbol in symbols:
+        plan = _prefetch_plan(symbol, requested_start, requested_end, today)
+        if plan is None:
+            summary["skipped"].append(symbol)
+        else:
+            groups.setdefault(plan, []).append(symbol)
+
+    rebuild = []
+    while groups:
+        (start, replace), group = groups.popitem()
+        for offset in range(0, len(group), batch_size):
+            batch = group[offset:offset + batch_size]
+            try:
+                frames = _download_ohlcv_batch(batch, start, tomorrow)
+            except Exception:
+                summary["failed"].extend(batch)
+                continue
+
+            for symbol in batch:
+                fresh = frames.get(symbol)
+                if fresh is None or (replace and fresh.empty):
+                    summary["failed"].append(symbol)
+                    continue
+                with _symbol_lock(symbol):
+                    meta = {} if replace else _read_meta(symbol)
+                    if replace:
+                        write_ohlcv(symbol, fresh, replace=True)
+                        meta["history_start"] = start.strftime("%Y-%m-%d")
+                    else:
+                        stored = read_stored_ohlcv(symbol)
+                        # The last stored bar may have been partial; only earlier bars are final
+                        if _history_adjusted(stored[stored.index < stored.index[-1]], fresh):
+                            # Re-adjusted history: rebuild in a later full-history batch
+                            rebuild.append(symbol)
+                            continue
+                        if not fresh.empty:
+                            write_ohlcv(symbol, fresh)
+                        meta.setdefault("history_start", stored.index[0].strftime("%Y-%m-%d"))
+                    meta["checked"] = today.strftime("%Y-%m-%d")
+                    _write_meta(symbol, meta)
+                summary["fetched"].append(symbol)
+
+        if not groups and rebuild:
+            for symbol in rebuild:
+                meta = _read_meta(symbol)
+                history_start = meta.get("history_start")
+                history_start = (
+                    pd.Timestamp(history_start) if history_start
+                    else today - pd.DateOffset(years=HISTORY_YEARS)
+                )
+                groups.setdefault((history_start, True), []).append(symbol)
+            rebuild = []
+
+    return summary
@@ -1,11 +1,13 @@
-from openai import OpenAI
 from .config import get_config
+from .rate_limiter import get_rate_limiter
+from .http_pool import get_openai_client
 
 
 def get_stock_news_openai(query, start_date, end_date):
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    client = get_openai_client(config["backend_url"])
 
+    get_rate_limiter("openai").acquire()
     response = client.responses.create(
         model=config["quick_think_llm"],
         input=[
@@ -39,8 +41,9 @@ def get_stock_news_openai(query, start_date, end_date):
 
 def get_global_news_openai(curr_date, look_back_days=7, limit=5):
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    client = get_openai_client(config["backend_url"])
 
+    get_rate_limiter("openai").acquire()
     response = client.responses.create(
         model=config["quick_think_llm"],
         input=[
@@ -74,8 +77,9 @@ def get_global_news_openai(curr_date, look_back_days=7, limit=5):
 
 def get_fundamentals_openai(ticker, curr_date):
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    client = get_openai_client(config["backend_url"])
 
+    get_rate_limiter("openai").acquire()
     response = client.responses.create(
         model=config["quick_think_llm"],
         input=[
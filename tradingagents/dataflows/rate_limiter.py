@@ -0,0 +1,128 @@
+"""
+Proactive, per-vendor request rate limiting.
+
+Every vendor call acquires a token from its vendor's bucket before the
+request is sent, so quotas are respected up front instead of being
+discovered through rate-limit errors. Buckets are process-wide and shared
+across threads and asyncio tasks: a caller reserves its slot under a short
+lock and then sleeps outside of it (time.sleep or asyncio.sleep), so
+concurrent propagations queue behind one another and the aggregate rate
+sits at the configured quota.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from .config import get_config
+
+DEFAULT_RATE_LIMITS = {
+    # Alpha Vantage free tier: 5 requests/minute and 25/day. Raise both in
+    # config["rate_limits"]["alpha_vantage"] for a premium key.
+    "alpha_vantage": {"requests_per_minute": 5, "requests_per_day": 25, "burst": 1},
+    # Google News scraping; spacing replaces the former random 2-6 s sleep
+    "google": {"requests_per_minute": 15, "requests_per_day": None, "burst": 1},
+    "yfinance": {"requests_per_minute": 120, "requests_per_day": None, "burst": 10},
+    "openai": {"requests_per_minute": 60, "requests_per_day": None, "burst": 10},
+}
+
+
+class DailyQuotaExceededError(Exception):
+    """Raised when a vendor's daily request budget is spent."""
+    pass
+
+
+class RateLimiter:
+    """Token bucket (requests_per_minute refill, ``burst`` capacity) with an optional daily cap.
+
+    Tokens may go negative: each caller takes its token immediately and is
+    told how long to wait for it, which keeps callers in FIFO order without
+    holding the lock while sleeping.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        requests_per_day: Optional[int] = None,
+        burst: int = 1,
+    ):
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.requests_per_day = requests_per_day
+        self.burst = max(1, burst)
+        self._rate = requests_per_minute / 60.0 if requests_per_minute else None
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._day = None
+        self._day_count = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait for it."""
+        with self._lock:
+            if self.requests_per_day is not None:
+                today = datetime.now(timezone.utc).date()
+                if today != self._day:
+                    self._day = today
+                    self._day_count = 0
+                if self._day_count >= self.requests_per_day:
+                    raise DailyQuotaExceededError(
+                        f"Daily request budget of {self.requests_per_day} for '{self.name}' is spent"
+                    )
+                self._day_count += 1
+
+            if self._rate is None:
+                return 0.0
+
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> float:
+        """Block the calling thread until a request may be sent; returns the time waited."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Asyncio variant of acquire that yields to the event loop while waiting."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_guard = threading.Lock()
+
+
+def get_rate_limit_config(vendor: str) -> Dict:
+    """Rate-limit settings for a vendor: defaults overlaid with config["rate_limits"]."""
+    settings = {"requests_per_minute": None, "requests_per_day": None, "burst": 1}
+    settings.update(DEFAULT_RATE_LIMITS.get(vendor, {}))
+    settings.update(get_config().get("rate_limits", {}).get(vendor, {}))
+    return settings
+
+
+def get_rate_limiter(vendor: str) -> RateLimiter:
+    """Return the shared limiter for a vendor, rebuilding it if its settings changed."""
+    settings = get_rate_limit_config(vendor)
+    with _limiters_guard:
+        limiter = _limiters.get(vendor)
+        if (
+            limiter is None
+            or limiter.requests_per_minute != settings["requests_per_minute"]
+            or limiter.requests_per_day != settings["requests_per_day"]
+            or limiter.burst != max(1, settings["burst"])
+        ):
+            limiter = RateLimiter(vendor, **settings)
+            _limiters[vendor] = limiter
+        return limiter
@@ -3,9 +3,14 @@ import time
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from typing import Annotated, Optional
 import os
 import re
+import hashlib
+import pickle
+import threading
+
+from .company_mentions import CompanyMentionMatcher, load_company_map
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,6 +54,154 @@ ticker_to_company = {
 }
 
 
+_matcher_cache = {}  # (company_mentions_file, mtime_ns) -> matcher
+_symbol_matchers = {}  # ticker missing from the mapping -> matcher on the bare symbol
+_matcher_lock = threading.Lock()
+
+
+def get_company_matcher() -> CompanyMentionMatcher:
+    """Matcher over ticker_to_company, extended by config["company_mentions_file"] if set."""
+    from .config import get_config
+
+    extra_path = get_config().get("company_mentions_file")
+    signature = (extra_path, os.stat(extra_path).st_mtime_ns) if extra_path else None
+
+    with _matcher_lock:
+        matcher = _matcher_cache.get(signature)
+        if matcher is None:
+            # Only read the extra file when it is new or has changed
+            mapping = dict(ticker_to_company)
+            if extra_path:
+                for ticker, names in load_company_map(extra_path).items():
+                    mapping[ticker] = f"{mapping[ticker]} OR {names}" if ticker in mapping else names
+            matcher = _matcher_cache[signature] = CompanyMentionMatcher(mapping)
+        return matcher
+
+
+def post_mentions(query: str, title: str, selftext: str) -> bool:
+    """Check that the title or the content has the company's name (query) mentioned."""
+    matcher = get_company_matcher()
+    if query not in matcher.tickers:
+        # Unknown ticker: match on the symbol itself
+        with _matcher_lock:
+            matcher = _symbol_matchers.get(query)
+            if matcher is None:
+                matcher = _symbol_matchers[query] = CompanyMentionMatcher({query: query})
+    return matcher.mentions(query, title, selftext)
+
+
+# Bump when the indexed fields or the mention rules change
+REDDIT_INDEX_VERSION = 2
+
+
+def _index_path(base_path: str, category: str) -> str:
+    from .config import get_config
+
+    digest = hashlib.sha1(os.path.abspath(base_path).encode()).hexdigest()[:12]
+    return os.path.join(get_config()["data_cache_dir"], "reddit_index", f"{category}-{digest}.pkl")
+
+
+def _file_signature(path: str) -> tuple:
+    stat = os.stat(path)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _index_file(path: str, matcher: Optional[CompanyMentionMatcher]) -> dict:
+    """Partition one subreddit file by post date.
+
+    Returns {date: [(ups, offset, length, mentioned_tickers), ...]} with each
+    day's posts in descending upvote order (stable, so ties keep file order).
+    """
+    by_date = {}
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            length = len(line)
+            if line.strip():
+                parsed_line = json.loads(line)
+                post_date = datetime.utcfromtimestamp(
+                    parsed_line["created_utc"]
+                ).strftime("%Y-%m-%d")
+                mentions = frozenset()
+                if matcher is not None:
+                    mentions = matcher.tickers_in(parsed_line["title"], parsed_line["selftext"])
+                by_date.setdefault(post_date, []).append(
+                    (parsed_line["ups"], offset, length, mentions)
+                )
+            offset += length
+
+    for records in by_date.values():
+        records.sort(key=lambda record: record[0], reverse=True)
+    return by_date
+
+
+_category_indexes = {}
+_category_indexes_guard = threading.Lock()
+
+
+def get_category_index(base_path: str, category: str) -> dict:
+    """{file name: {date: records}} for a category, built once and refreshed per changed file.
+
+    The index is persisted under data_cache_dir/reddit_index so it survives
+    restarts; only files whose size or mtime changed are re-read.
+    """
+    category_dir = os.path.join(base_path, category)
+    signatures = {
+        data_file: _file_signature(os.path.join(category_dir, data_file))
+        for data_file in os.listdir(category_dir)
+        if data_file.endswith(".jsonl")
+    }
+    key = (os.path.abspath(base_path), category)
+    matcher = get_company_matcher() if "company" in category else None
+    mapping = matcher.mapping if matcher is not None else None
+
+    with _category_indexes_guard:
+        cached = _category_indexes.get(key)
+        if cached is not None and cached["mapping"] != mapping:
+            # Mentions were tagged with a different company table: rebuild
+            cached = {"signatures": {}, "files": {}, "mapping": mapping}
+        if cached is not None and cached["signatures"] == signatures:
+            return cached["files"]
+
+        index_path = _index_path(base_path, category)
+        if cached is None:
+            try:
+                with open(index_path, "rb") as f:
+                    cached = pickle.load(f)
+                if cached.get("version") != REDDIT_INDEX_VERSION or cached.get("mapping") != mapping:
+                    cached = None
+            except (FileNotFoundError, EOFError, pickle.UnpicklingError, ValueError, TypeError,
+                    AttributeError, ImportError):
+                # Missing, truncated, or pickled by a version whose classes have
+                # since moved or changed (ImportError covers ModuleNotFoundError)
+                cached = None
+        if cached is not None and cached["signatures"] == signatures:
+            _category_indexes[key] = cached
+            return cached["files"]
+
+        old_files = cached["files"] if cached else {}
+        old_signatures = cached["signatures"] if cached else {}
+        files = {}
+        for data_file, signature in signatures.items():
+            if old_signatures.get(data_file) == signature:
+                files[data_file] = old_files[data_file]
+            else:
+                files[data_file] = _index_file(os.path.join(category_dir, data_file), matcher)
+
+        cached = {
+            "version": REDDIT_INDEX_VERSION,
+            "signatures": signatures,
+            "files": files,
+            "mapping": mapping,
+        }
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(index_path + ".tmp", "wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(index_path + ".tmp", index_path)
+        _category_indexes[key] = cached
+        return files
+
+
 def fetch_top_from_category(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
@@ -65,71 +218,51 @@ def fetch_top_from_category(
 
     all_content = []
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+    category_files = os.listdir(os.path.join(base_path, category))
+    if max_limit < len(category_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit // len(category_files)
+
+    # Per-day partitions with upvote ordering and ticker mentions precomputed
+    category_index = get_category_index(base_path, category)
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
+    for data_file in category_files:
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
-
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
+        records = category_index.get(data_file, {}).get(date, [])
 
-                parsed_line = json.loads(line)
+        # if is company_news, check that the title or the content has the company's name (query) mentioned
+        check_query = "company" in category and query
+        if check_query and query in get_company_matcher().tickers:
+            records = [record for record in records if query in record[3]]
+            check_query = False
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
+        all_content_curr_subreddit = []
+        with open(os.path.join(base_path, category, data_file), "rb") as f:
+            for ups, offset, length, _ in records:
+                if len(all_content_curr_subreddit) >= limit_per_subreddit:
+                    break
+                f.seek(offset)
+                parsed_line = json.loads(f.read(length))
+                if check_query and not post_mentions(query, parsed_line["title"], parsed_line["selftext"]):
                     continue
 
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
                 post = {
                     "title": parsed_line["title"],
                     "content": parsed_line["selftext"],
                     "url": parsed_line["url"],
                     "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
+                    "posted_date": date,
                 }
 
                 all_content_curr_subreddit.append(post)
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
-
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+        # records are already in descending upvote order
+        all_content.extend(all_content_curr_subreddit)
 
     return all_content
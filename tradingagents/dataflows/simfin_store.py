@@ -0,0 +1,212 @@
+"""
+Indexed, load-once store for the SimFin bulk statement files.
+
+The SimFin CSVs cover the whole US universe, so reading one to answer a
+single ticker means parsing every row and both date columns. Each file is
+ingested once into a typed columnar copy under ``data_cache_dir/simfin``,
+sorted by ticker and publish date, with the row range of every ticker kept
+in a manifest. A process-level index then answers "latest statement
+published on or before D" with a slice and a binary search.
+
+The copy is rebuilt automatically when the source CSV changes (size/mtime).
+"""
+
+import json
+import os
+import threading
+from typing import Annotated, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+try:
+    import pyarrow  # noqa: F401
+
+    STORE_FORMAT = "parquet"
+except ImportError:
+    STORE_FORMAT = "csv"
+
+# statement -> (directory under simfin_data_all, file name prefix)
+SIMFIN_STATEMENTS = {
+    "balance_sheet": ("balance_sheet", "us-balance"),
+    "cash_flow": ("cash_flow", "us-cashflow"),
+    "income_statements": ("income_statements", "us-income"),
+}
+
+DATE_COLUMNS = ["Report Date", "Publish Date"]
+
+
+def get_simfin_store_dir() -> str:
+    return os.path.join(get_config()["data_cache_dir"], "simfin")
+
+
+def simfin_source_path(data_dir: str, statement: str, freq: str) -> str:
+    """Location of the raw SimFin CSV for a statement and frequency."""
+    directory, prefix = SIMFIN_STATEMENTS[statement]
+    return os.path.join(
+        data_dir,
+        "fundamental_data",
+        "simfin_data_all",
+        directory,
+        "companies",
+        "us",
+        f"{prefix}-{freq}.csv",
+    )
+
+
+def _store_paths(statement: str, freq: str):
+    base = os.path.join(get_simfin_store_dir(), f"{statement}-{freq}")
+    return f"{base}.{STORE_FORMAT}", f"{base}.manifest.json"
+
+
+def _source_signature(source_path: str) -> Dict[str, float]:
+    stat = os.stat(source_path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def ingest_simfin(
+    source_path: Annotated[str, "raw SimFin CSV (semicolon separated)"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "annual / quarterly"],
+) -> dict:
+    """Convert a SimFin CSV into the typed, ticker-sorted store and return its manifest."""
+    df = pd.read_csv(source_path, sep=";")
+    for column in DATE_COLUMNS:
+        df[column] = pd.to_datetime(df[column], utc=True).dt.normalize()
+
+    # Stable sort keeps the file order among equal publish dates, so ties
+    # resolve the same way idxmax did on the raw file
+    df = df.sort_values(["Ticker", "Publish Date"], kind="mergesort")
+
+    tickers = df["Ticker"].to_numpy()
+    boundaries = np.flatnonzero(tickers[1:] != tickers[:-1]) + 1
+    starts = np.concatenate(([0], boundaries)) if len(df) else np.array([], dtype=int)
+    stops = np.concatenate((boundaries, [len(df)])) if len(df) else np.array([], dtype=int)
+    ranges = {str(tickers[start]): [int(start), int(stop)] for start, stop in zip(starts, stops)}
+
+    store_path, manifest_path = _store_paths(statement, freq)
+    os.makedirs(os.path.dirname(store_path), exist_ok=True)
+    tmp_path = store_path + ".tmp"
+    if STORE_FORMAT == "parquet":
+        df.to_parquet(tmp_path)
+    else:
+        df.to_csv(tmp_path)
+    os.replace(tmp_path, store_path)
+
+    manifest = {
+        "source": _source_signature(source_path),
+        "format": STORE_FORMAT,
+        "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items() if col not in DATE_COLUMNS},
+        "tickers": ranges,
+    }
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return manifest
+
+
+class SimFinStatementIndex:
+    """One ingested statement file held in memory with per-ticker row ranges."""
+
+    def __init__(self, frame: pd.DataFrame, ranges: Dict[str, list]):
+        self.frame = frame
+        self.ranges = ranges
+        # int64 nanoseconds; sorted within each ticker's range
+        self.publish_ns = frame["Publish Date"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+    def latest(self, ticker: str, curr_date: str) -> Optional[pd.Series]:
+        """Latest row for ``ticker`` published on or before ``curr_date``, or None."""
+        bounds = self.ranges.get(ticker)
+        if bounds is None:
+            return None
+        start, stop = bounds
+        cutoff = pd.Timestamp(curr_date, tz="UTC").normalize().value
+        dates = self.publish_ns[start:stop]
+        position = np.searchsorted(dates, cutoff, side="right") - 1
+        if position < 0:
+            return None
+        # First row of a run of equal publish dates, matching idxmax
+        position = np.searchsorted(dates, dates[position], side="left")
+        return self.frame.iloc[start + position]
+
+    def history(self, ticker: str, curr_date: Optional[str] = None) -> pd.DataFrame:
+        """All rows for ``ticker`` published on or before ``curr_date`` (all rows if None)."""
+        bounds = self.ranges.get(ticker)
+        if bounds is None:
+            return self.frame.iloc[0:0]
+        start, stop = bounds
+        if curr_date is not None:
+            cutoff = pd.Timestamp(curr_date, tz="UTC").normalize().value
+            stop = start + int(np.searchsorted(self.publish_ns[start:stop], cutoff, side="right"))
+        return self.frame.iloc[start:stop]
+
+
+def _load_index(source_path: str, statement: str, freq: str) -> SimFinStatementIndex:
+    store_path, manifest_path = _store_paths(statement, freq)
+    manifest = None
+    if os.path.exists(store_path) and os.path.exists(manifest_path):
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("source") != _source_signature(source_path) or manifest.get("format") != STORE_FORMAT:
+            manifest = None
+    if manifest is None:
+        manifest = ingest_simfin(source_path, statement, freq)
+
+    if STORE_FORMAT == "parquet":
+        frame = pd.read_parquet(store_path)
+    else:
+        frame = pd.read_csv(store_path, index_col=0, dtype=manifest["dtypes"])
+        for column in DATE_COLUMNS:
+            frame[column] = pd.to_datetime(frame[column], utc=True)
+    return SimFinStatementIndex(frame, manifest["tickers"])
+
+
+_indexes: Dict[tuple, tuple] = {}  # (source, statement, freq) -> (source signature, index)
+_indexes_guard = threading.Lock()
+_key_locks: Dict[tuple, threading.Lock] = {}
+
+
+def _key_lock(key: tuple) -> threading.Lock:
+    with _indexes_guard:
+        if key not in _key_locks:
+            _key_locks[key] = threading.Lock()
+        return _key_locks[key]
+
+
+def get_statement_index(source_path: str, statement: str, freq: str) -> SimFinStatementIndex:
+    """Process-wide index for a statement file, (re)ingested when the source CSV changes.
+
+    Ingestion holds only that file's lock, so lookups on other statements
+    and frequencies are not blocked by it.
+    """
+    key = (source_path, statement, freq)
+    signature = _source_signature(source_path)
+    with _indexes_guard:
+        cached = _indexes.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _key_lock(key):
+        # Another thread may have loaded it while this one waited
+        with _indexes_guard:
+            cached = _indexes.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        index = _load_index(source_path, statement, freq)
+        with _indexes_guard:
+            _indexes[key] = (signature, index)
+        return index
+
+
+def latest_statement(
+    data_dir: Annotated[str, "root of the local data directory"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[str, "annual / quarterly"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+) -> Optional[pd.Series]:
+    """Point-in-time lookup: the latest statement published on or before curr_date."""
+    source_path = simfin_source_path(data_dir, statement, freq)
+    return get_statement_index(source_path, statement, freq).latest(ticker, curr_date)
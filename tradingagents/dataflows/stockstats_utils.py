@@ -1,9 +1,10 @@
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
 import os
 from .config import get_config, DATA_DIR
+from .ohlcv_store import load_ohlcv
+from .local_price_cache import get_local_prices
 
 
 class StockstatsUtils:
@@ -26,47 +27,22 @@ class StockstatsUtils:
 
         if not online:
             try:
-                data = pd.read_csv(
+                # wrap() adds indicator columns in place, so work on a copy
+                data = get_local_prices(
                     os.path.join(
                         DATA_DIR,
                         f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
                     )
-                )
+                ).frame.copy()
                 df = wrap(data)
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
             curr_date = pd.to_datetime(curr_date)
 
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
+            # Bars come from the incrementally-updated OHLCV store
+            data = load_ohlcv(symbol, end_date=curr_date.strftime("%Y-%m-%d"))
+            data = data.reset_index()
 
             df = wrap(data)
             df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
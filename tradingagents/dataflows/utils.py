@@ -37,3 +37,47 @@ def get_next_weekday(date):
         return next_weekday
     else:
         return date
+
+
+def parse_indicator_list(indicators) -> list:
+    """Accept a list of indicator names or a comma-separated string; drop blanks and duplicates."""
+    if isinstance(indicators, str):
+        indicators = indicators.split(",")
+    parsed = []
+    for indicator in indicators:
+        indicator = indicator.strip()
+        if indicator and indicator not in parsed:
+            parsed.append(indicator)
+    if not parsed:
+        raise ValueError("At least one indicator must be requested")
+    return parsed
+
+
+def format_indicator_table(
+    symbol: str,
+    table: pd.DataFrame,
+    start_date: str,
+    end_date: str,
+    descriptions: dict,
+) -> str:
+    """Render a (trading dates x indicators) frame as one compact CSV block, newest first."""
+    table = table.sort_index(ascending=False).round(4)
+    table.index = table.index.strftime("%Y-%m-%d")
+    table.index.name = "Date"
+
+    if table.empty:
+        body = "No data available for the specified date range.\n"
+    else:
+        body = table.to_csv(na_rep="N/A")
+
+    notes = "\n".join(
+        f"- {ind}: {descriptions.get(ind, 'No description available.')}"
+        for ind in table.columns
+    )
+
+    return (
+        f"## Indicators for {symbol.upper()} from {start_date} to {end_date} (trading days only):\n\n"
+        + body
+        + "\n\n"
+        + notes
+    )
@@ -0,0 +1,145 @@
+"""
+Memoization layer for route_to_vendor.
+
+Identical data requests made during a run (for example get_alpha_factors
+re-fetching the stock data and fundamentals the analysts already pulled) are
+answered from an in-process cache instead of going back to the vendor.
+Entries expire after a TTL and the cache is bounded with LRU eviction.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .config import get_config
+
+DEFAULT_VENDOR_CACHE_CONFIG = {
+    "enabled": True,
+    "ttl_seconds": 3600,
+    "max_entries": 1024,
+    "scope": "run",  # "run": cleared at the start of each propagate; "process": kept until exit
+}
+
+
+class VendorCallCache:
+    """Thread-safe LRU cache with per-entry expiry and hit/miss counters."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Return (hit, value). Expired entries count as misses and are dropped."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_cache: Optional[VendorCallCache] = None
+_cache_guard = threading.Lock()
+
+
+def get_vendor_cache_config() -> Dict[str, Any]:
+    """Vendor cache settings from the active config, filled with defaults."""
+    settings = DEFAULT_VENDOR_CACHE_CONFIG.copy()
+    settings.update(get_config().get("vendor_cache", {}))
+    return settings
+
+
+def get_vendor_cache() -> Optional[VendorCallCache]:
+    """Return the process-wide cache, or None when caching is disabled."""
+    global _cache
+    settings = get_vendor_cache_config()
+    if not settings["enabled"]:
+        return None
+
+    with _cache_guard:
+        if (
+            _cache is None
+            or _cache.ttl_seconds != settings["ttl_seconds"]
+            or _cache.max_entries != settings["max_entries"]
+        ):
+            _cache = VendorCallCache(settings["ttl_seconds"], settings["max_entries"])
+        return _cache
+
+
+def reset_vendor_cache() -> None:
+    """Clear cached results and counters (called at the start of a run when scope is 'run')."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def vendor_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the vendor cache."""
+    if _cache is None:
+        return {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "hit_rate": 0.0}
+    return _cache.stats()
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize(item)) for key, item in value.items()))
+    return value
+
+
+def make_cache_key(method: str, vendor: str, args: tuple, kwargs: dict) -> Optional[Tuple]:
+    """Build a hashable key from the method, resolved vendor config and normalized arguments.
+
+    Returns None when an argument is not hashable, in which case the call is not cached.
+    """
+    key = (
+        method,
+        _normalize(vendor),
+        _normalize(args),
+        _normalize(kwargs),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
@@ -0,0 +1,313 @@
+"""
+Concurrent execution of vendor implementations for route_to_vendor.
+
+When a method resolves to several implementations (comma-separated vendor
+configs, or a vendor mapped to a list such as the ``local`` news sources),
+they are submitted to a shared thread pool and gathered in their original
+order. A per-call deadline bounds the wait: implementations that have not
+finished by then are reported as timed out and their results are dropped,
+so one slow scraper cannot hold up the whole tool. A lone implementation
+(one vendor, one function) is not bounded by default, since slow methods
+such as LLM web searches or a first full-history download have nothing to
+be raced against; ``method_deadline_seconds`` bounds chosen methods anyway.
+
+Threads cannot be interrupted, so a timed-out implementation keeps its
+worker until it returns. Such workers are tracked, and once they would
+leave too few free workers for a new fan-out, the pool is retired (its hung
+threads finish in the background) and a fresh one takes over. Hung
+scrapers therefore cannot starve later calls.
+
+Optionally (``config["vendor_hedging"]``), single-vendor configs hedge: if
+the primary has not answered within a percentile of its recent latency, the
+next vendor in the fallback order is started too and the first successful
+answer wins.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .config import get_config
+
+DEFAULT_VENDOR_ROUTING_CONFIG = {
+    "concurrent": True,
+    "max_workers": 8,
+    "deadline_seconds": 120,  # per fan-out of implementations; None waits indefinitely
+    # method -> seconds (or None), overriding deadline_seconds and also
+    # applying to single-implementation calls of that method
+    "method_deadline_seconds": {},
+}
+
+# Outcome of one implementation: ("ok", result) | ("error", exception) | ("timeout", None)
+CallOutcome = Tuple[str, Any]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_workers = 0
+_executor_guard = threading.Lock()
+# Timed-out futures whose worker is still running, in the current pool
+_abandoned: set = set()
+_worker_state = threading.local()
+
+
+def get_vendor_routing_config() -> Dict[str, Any]:
+    settings = DEFAULT_VENDOR_ROUTING_CONFIG.copy()
+    settings.update(get_config().get("vendor_routing", {}))
+    return settings
+
+
+def _submit(calls: List[Tuple[Callable, tuple, dict]], max_workers: int) -> list:
+    """Submit calls to the shared pool, replacing it when hung workers leave too few free."""
+    global _executor, _executor_workers, _abandoned
+    with _executor_guard:
+        _abandoned = {future for future in _abandoned if not future.done()}
+        free_workers = max_workers - len(_abandoned)
+        if _executor is None or _executor_workers != max_workers or free_workers < len(calls):
+            if _executor is not None:
+                # Queued calls still run; hung workers finish in the background
+                _executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="vendor"
+            )
+            _executor_workers = max_workers
+            _abandoned = set()
+        return [_executor.submit(_call, func, args, kwargs) for func, args, kwargs in calls]
+
+
+def _abandon(future) -> None:
+    if not future.cancel():
+        with _executor_guard:
+            _abandoned.add(future)
+
+
+def _call(func: Callable, args: tuple, kwargs: dict) -> Any:
+    _worker_state.active = True
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _worker_state.active = False
+
+
+def _run_inline(calls: List[Tuple[Callable, tuple, dict]]) -> List[CallOutcome]:
+    outcomes = []
+    for func, args, kwargs in calls:
+        try:
+            outcomes.append(("ok", func(*args, **kwargs)))
+        except Exception as e:
+            outcomes.append(("error", e))
+    return outcomes
+
+
+def run_vendor_calls(
+    calls: List[Tuple[Callable, tuple, dict]],
+    deadline: Optional[float] = None,
+) -> List[CallOutcome]:
+    """Run vendor implementations, concurrently when enabled, and return their outcomes in order.
+
+    Args:
+        calls: (function, args, kwargs) triples
+        deadline: absolute time.monotonic() value after which unfinished
+            calls are abandoned and reported as ("timeout", None)
+
+    Calls run inline (without a deadline) when concurrency is disabled, and
+    when already inside a pool worker: a nested route_to_vendor must not
+    wait on the pool it is occupying, and the enclosing fan-out's deadline
+    already bounds it. A single call without a deadline also runs inline.
+    """
+    settings = get_vendor_routing_config()
+    if (
+        not settings["concurrent"]
+        or getattr(_worker_state, "active", False)
+        or (len(calls) <= 1 and deadline is None)
+    ):
+        return _run_inline(calls)
+
+    futures = _submit(calls, settings["max_workers"])
+    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+    wait(futures, timeout=timeout)
+
+    outcomes = []
+    for future in futures:
+        if not future.done():
+            # The worker keeps running in the background; its result is discarded
+            _abandon(future)
+            outcomes.append(("timeout", None))
+        elif future.exception() is not None:
+            outcomes.append(("error", future.exception()))
+        else:
+            outcomes.append(("ok", future.result()))
+    return outcomes
+
+
+def call_deadline(method: Optional[str] = None, fan_out: bool = True) -> Optional[float]:
+    """Absolute deadline for calls starting now, or None if unbounded.
+
+    ``fan_out`` is False for a single implementation, which only gets a
+    deadline when its method has one in ``method_deadline_seconds``.
+    """
+    settings = get_vendor_routing_config()
+    method_deadlines = settings["method_deadline_seconds"] or {}
+    if method in method_deadlines:
+        deadline_seconds = method_deadlines[method]
+    elif fan_out:
+        deadline_seconds = settings["deadline_seconds"]
+    else:
+        deadline_seconds = None
+    if deadline_seconds is None:
+        return None
+    return time.monotonic() + deadline_seconds
+
+
+# ---------------------------------------------------------------------------
+# Hedged fallback
+# ---------------------------------------------------------------------------
+
+DEFAULT_VENDOR_HEDGING_CONFIG = {
+    "enabled": False,
+    "percentile": 95,             # hedge once the primary is slower than this percentile
+    "min_samples": 20,            # latency samples needed before the percentile is trusted
+    "default_delay_seconds": 5.0, # hedge delay until enough samples exist
+    "min_delay_seconds": 0.5,
+    "max_delay_seconds": 30.0,
+    "max_workers": 4,
+}
+
+
+def get_vendor_hedging_config() -> Dict[str, Any]:
+    settings = DEFAULT_VENDOR_HEDGING_CONFIG.copy()
+    settings.update(get_config().get("vendor_hedging", {}))
+    return settings
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies per (method, vendor)."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[Tuple[str, str], deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, vendor: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get((method, vendor))
+            if samples is None:
+                samples = self._samples[(method, vendor)] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, method: str, vendor: str, pct: float, min_samples: int = 1) -> Optional[float]:
+        """Latency percentile in seconds, or None with fewer than ``min_samples`` samples."""
+        with self._lock:
+            samples = sorted(self._samples.get((method, vendor), ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        rank = min(len(samples) - 1, max(0, int(round(pct / 100.0 * len(samples))) - 1))
+        return samples[rank]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+_latency_tracker = LatencyTracker()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_workers = 0
+
+
+def get_latency_tracker() -> LatencyTracker:
+    return _latency_tracker
+
+
+def hedge_delay(method: str, vendor: str) -> float:
+    """Seconds to wait on a vendor before hedging with the next one."""
+    settings = get_vendor_hedging_config()
+    delay = _latency_tracker.percentile(
+        method, vendor, settings["percentile"], settings["min_samples"]
+    )
+    if delay is None:
+        delay = settings["default_delay_seconds"]
+    return min(settings["max_delay_seconds"], max(settings["min_delay_seconds"], delay))
+
+
+def _get_hedge_executor(max_workers: int) -> ThreadPoolExecutor:
+    # Separate from the fan-out pool: a hedged attempt fans out its own
+    # implementations and must not wait on the pool it runs in
+    global _hedge_executor, _hedge_executor_workers
+    with _executor_guard:
+        if _hedge_executor is None or _hedge_executor_workers != max_workers:
+            if _hedge_executor is not None:
+                _hedge_executor.shutdown(wait=False)
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="vendor-hedge"
+            )
+            _hedge_executor_workers = max_workers
+        return _hedge_executor
+
+
+def run_hedged(
+    attempts: List[Callable[[], Any]],
+    delays: List[float],
+    succeeded: Callable[[Any], bool],
+    deadline: Optional[float] = None,
+) -> Tuple[Optional[int], List[CallOutcome]]:
+    """Run attempts in fallback order, starting the next one early when the current one is slow.
+
+    Attempt ``i + 1`` starts as soon as attempt ``i`` fails, or once
+    ``delays[i]`` seconds pass without an answer. The first attempt whose
+    result satisfies ``succeeded`` wins; attempts that have not started are
+    cancelled, and ones already running are abandoned (threads cannot be
+    interrupted, so they finish in the background and their results are
+    discarded).
+
+    Returns:
+        (index of the winning attempt or None, per-attempt outcomes). Outcomes
+        are ("ok", value), ("error", exception), ("cancelled", None),
+        ("timeout", None) or ("not_started", None).
+    """
+    executor = _get_hedge_executor(get_vendor_hedging_config()["max_workers"])
+    outcomes: List[CallOutcome] = [("not_started", None)] * len(attempts)
+    in_flight = {}
+    next_index = 0
+    hedge_at = float("inf")
+
+    def launch():
+        nonlocal next_index, hedge_at
+        in_flight[executor.submit(attempts[next_index])] = next_index
+        hedge_at = time.monotonic() + delays[next_index]
+        next_index += 1
+
+    def abandon(status):
+        for future, index in in_flight.items():
+            future.cancel()
+            outcomes[index] = (status, None)
+        in_flight.clear()
+
+    launch()
+    while in_flight:
+        now = time.monotonic()
+        wake_at = hedge_at if next_index < len(attempts) else float("inf")
+        if deadline is not None:
+            wake_at = min(wake_at, deadline)
+        timeout = None if wake_at == float("inf") else max(0.0, wake_at - now)
+
+        done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+        any_failed = False
+        for future in done:
+            index = in_flight.pop(future)
+            if future.exception() is not None:
+                outcomes[index] = ("error", future.exception())
+                any_failed = True
+                continue
+            outcomes[index] = ("ok", future.result())
+            if succeeded(future.result()):
+                abandon("cancelled")
+                return index, outcomes
+            any_failed = True
+
+        if deadline is not None and time.monotonic() >= deadline:
+            abandon("timeout")
+            break
+        if next_index < len(attempts) and (any_failed or time.monotonic() >= hedge_at):
+            launch()
+
+    return None, outcomes
@@ -0,0 +1,244 @@
+"""
+Circuit breakers for vendor implementations.
+
+Each (vendor, method) pair has a breaker fed with the outcome of every
+route_to_vendor attempt:
+
+    closed     calls go through; the breaker opens when the failure rate over
+               the last ``window_size`` attempts reaches the threshold (after
+               ``min_calls`` attempts), or after ``consecutive_failures``
+               failures in a row
+    open       the vendor is skipped in the fallback order until the cooldown
+               elapses; the cooldown doubles on each re-open, up to a maximum
+    half_open  the cooldown has elapsed and a single trial call is admitted;
+               its success closes the breaker, its failure re-opens it (a
+               trial whose outcome never arrives expires after a cooldown)
+
+Rate-limit and quota errors open the breaker immediately, for every method
+of that vendor, since the quota is shared.
+
+Errors that say nothing about the vendor's health (``NEUTRAL_ERRORS``: no
+data for this symbol, a missing local file, a cache-only miss, invalid
+arguments) are recorded as neutral: they neither count as failures nor
+close a breaker. A response that cannot be decoded (``RESPONSE_ERRORS``)
+still counts.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config import get_config
+
+DEFAULT_VENDOR_HEALTH_CONFIG = {
+    "enabled": True,
+    "window_size": 20,
+    "min_calls": 5,
+    "failure_rate_threshold": 0.5,
+    "consecutive_failures": 3,
+    "cooldown_seconds": 60,
+    "max_cooldown_seconds": 900,
+}
+
+class DataNotFoundError(LookupError):
+    """The vendor answered, but has no data for this request (e.g. an unknown symbol)."""
+    pass
+
+
+# Request-specific errors; AlphaVantageCacheMissError is added by the interface.
+# ValueError / TypeError come from the caller's arguments (an unsupported
+# indicator, a malformed date), so bad tool calls cannot take a vendor offline.
+NEUTRAL_ERRORS = (DataNotFoundError, FileNotFoundError, ValueError, TypeError)
+
+# ValueError subclasses raised on a garbled response body; these do count
+RESPONSE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def get_vendor_health_config() -> Dict[str, Any]:
+    settings = DEFAULT_VENDOR_HEALTH_CONFIG.copy()
+    settings.update(get_config().get("vendor_health", {}))
+    return settings
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker for one (vendor, method) pair."""
+
+    def __init__(self, vendor: str, method: str):
+        self.vendor = vendor
+        self.method = method
+        self._outcomes: deque = deque()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._cooldown = 0.0
+        self._trips = 0
+        self._last_error: Optional[str] = None
+        self._probe_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now >= self._opened_at + self._cooldown:
+            self._state = HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """False while the breaker is open, and while half open once the trial call is out."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._current_state(now)
+            if state == OPEN:
+                return False
+            if state == HALF_OPEN:
+                if self._probe_at is not None and now < self._probe_at + self._cooldown:
+                    return False
+                self._probe_at = now
+            return True
+
+    def record_neutral(self) -> None:
+        """An attempt that says nothing about the vendor; frees the half-open trial slot."""
+        with self._lock:
+            self._probe_at = None
+
+    def _open(self, settings: Dict[str, Any], now: float) -> None:
+        if self._state == CLOSED:
+            self._cooldown = settings["cooldown_seconds"]
+        else:
+            self._cooldown = min(settings["max_cooldown_seconds"], self._cooldown * 2 or settings["cooldown_seconds"])
+        self._state = OPEN
+        self._opened_at = now
+        self._probe_at = None
+        self._trips += 1
+
+    def record_success(self) -> None:
+        settings = get_vendor_health_config()
+        with self._lock:
+            self._append(True, settings["window_size"])
+            self._consecutive_failures = 0
+            if self._current_state(time.monotonic()) == HALF_OPEN:
+                self._state = CLOSED
+                self._outcomes.clear()
+                self._probe_at = None
+
+    def record_failure(self, error: Optional[BaseException] = None, trip: bool = False) -> None:
+        """Record a failed attempt; ``trip`` opens the breaker regardless of the window."""
+        settings = get_vendor_health_config()
+        now = time.monotonic()
+        with self._lock:
+            self._append(False, settings["window_size"])
+            self._consecutive_failures += 1
+            if error is not None:
+                self._last_error = f"{type(error).__name__}: {error}"
+
+            state = self._current_state(now)
+            if state == OPEN:
+                return
+            failures = self._outcomes.count(False)
+            if (
+                trip
+                or state == HALF_OPEN
+                or self._consecutive_failures >= settings["consecutive_failures"]
+                or (
+                    len(self._outcomes) >= settings["min_calls"]
+                    and failures / len(self._outcomes) >= settings["failure_rate_threshold"]
+                )
+            ):
+                self._open(settings, now)
+
+    def _append(self, ok: bool, window_size: int) -> None:
+        self._outcomes.append(ok)
+        while len(self._outcomes) > window_size:
+            self._outcomes.popleft()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._outcomes.clear()
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._probe_at = None
+            self._cooldown = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            state = self._current_state(now)
+            calls = len(self._outcomes)
+            failures = self._outcomes.count(False)
+            retry_in = None
+            if state == OPEN:
+                retry_in = round(self._opened_at + self._cooldown - now, 3)
+            return {
+                "vendor": self.vendor,
+                "method": self.method,
+                "state": state,
+                "calls_in_window": calls,
+                "failure_rate": failures / calls if calls else 0.0,
+                "consecutive_failures": self._consecutive_failures,
+                "trips": self._trips,
+                "cooldown_seconds": self._cooldown,
+                "retry_in_seconds": retry_in,
+                "last_error": self._last_error,
+            }
+
+
+class VendorHealthRegistry:
+    """Process-wide map of (vendor, method) -> CircuitBreaker."""
+
+    def __init__(self):
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, vendor: str, method: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get((vendor, method))
+            if breaker is None:
+                breaker = self._breakers[(vendor, method)] = CircuitBreaker(vendor, method)
+            return breaker
+
+    def allow_request(self, vendor: str, method: str) -> bool:
+        if not get_vendor_health_config()["enabled"]:
+            return True
+        return self.breaker(vendor, method).allow_request()
+
+    def record_success(self, vendor: str, method: str) -> None:
+        self.breaker(vendor, method).record_success()
+
+    def record_failure(self, vendor: str, method: str, error: Optional[BaseException] = None) -> None:
+        self.breaker(vendor, method).record_failure(error)
+
+    def record_neutral(self, vendor: str, method: str) -> None:
+        self.breaker(vendor, method).record_neutral()
+
+    def trip(self, vendor: str, methods: Iterable[str], error: Optional[BaseException] = None) -> None:
+        """Open the breakers of a vendor for all given methods (shared quota exhausted)."""
+        for method in methods:
+            self.breaker(vendor, method).record_failure(error, trip=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [breaker.snapshot() for breaker in breakers]
+
+
+_registry = VendorHealthRegistry()
+
+
+def get_vendor_health() -> VendorHealthRegistry:
+    return _registry
+
+
+def vendor_health_snapshot() -> List[Dict[str, Any]]:
+    """Breaker state of every (vendor, method) seen so far, for monitoring."""
+    return _registry.snapshot()
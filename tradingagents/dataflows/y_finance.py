@@ -2,8 +2,18 @@ from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import yfinance as yf
+import pandas as pd
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .config import get_config
 from .stockstats_utils import StockstatsUtils
+from .ohlcv_store import load_ohlcv
+from .local_price_cache import get_local_prices
+from .frames import to_price_frame, to_statement_frame
+from .rate_limiter import get_rate_limiter
+from .utils import parse_indicator_list, format_indicator_table
+from .vendor_cache import VendorCallCache
 
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -14,11 +24,10 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    # Read from the local OHLCV store, which only downloads missing bars.
+    # The end date is exclusive, matching yfinance's history() semantics.
+    data = load_ohlcv(symbol, start_date, end_date)
+    data = data[data.index < end_date]
 
     # Check if data is empty
     if data.empty:
@@ -26,10 +35,6 @@ def get_YFin_data_online(
             f"No data found for symbol '{symbol}' between {start_date} and {end_date}"
         )
 
-    # Remove timezone info from index for cleaner output
-    if data.index.tz is not None:
-        data.index = data.index.tz_localize(None)
-
     # Round numerical values to 2 decimal places for cleaner display
     numeric_columns = ["Open", "High", "Low", "Close", "Adj Close"]
     for col in numeric_columns:
@@ -46,6 +51,90 @@ def get_YFin_data_online(
 
     return header + csv_string
 
+
+def get_YFin_frame_online(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+) -> pd.DataFrame:
+    """Typed daily bars from the OHLCV store."""
+    return to_price_frame(load_ohlcv(symbol, start_date, end_date))
+
+
+BEST_IND_PARAMS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -55,113 +144,20 @@ def get_stock_stats_indicators_window(
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in BEST_IND_PARAMS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
         )
 
     end_date = curr_date
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
-    # Optimized: Get stock data once and calculate indicators for all dates
+    # Optimized: Get stock data once, then only format the look-back window
     try:
         indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
-        
-        # Generate the date range we need
-        current_dt = curr_date_dt
-        date_values = []
-        
-        while current_dt >= before:
-            date_str = current_dt.strftime('%Y-%m-%d')
-            
-            # Look up the indicator value for this date
-            if date_str in indicator_data:
-                indicator_value = indicator_data[date_str]
-            else:
-                indicator_value = "N/A: Not a trading day (weekend or holiday)"
-            
-            date_values.append((date_str, indicator_value))
-            current_dt = current_dt - relativedelta(days=1)
-        
-        # Build the result string
-        ind_string = ""
-        for date_str, value in date_values:
-            ind_string += f"{date_str}: {value}\n"
-        
+        ind_string = _format_indicator_window(indicator_data, before, curr_date_dt)
+
     except Exception as e:
         print(f"Error getting bulk stockstats data: {e}")
         # Fallback to original implementation if bulk method fails
@@ -178,93 +174,120 @@ def get_stock_stats_indicators_window(
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
         + ind_string
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + BEST_IND_PARAMS.get(indicator, "No description available.")
     )
 
     return result_str
 
 
-def _get_stock_stats_bulk(
+def _load_stockstats_frame(
     symbol: Annotated[str, "ticker symbol of the company"],
-    indicator: Annotated[str, "technical indicator to calculate"],
     curr_date: Annotated[str, "current date for reference"]
-) -> dict:
+):
     """
-    Optimized bulk calculation of stock stats indicators.
-    Fetches data once and calculates indicator for all available dates.
-    Returns dict mapping date strings to indicator values.
+    Load the OHLCV history once and wrap it with stockstats.
+    Indicator columns are computed lazily on first access and then kept on
+    the frame, so several indicators can be read from one load.
+    Returns the wrapped frame and its DatetimeIndex of trading dates.
     """
     from .config import get_config
-    import pandas as pd
     from stockstats import wrap
-    import os
-    
+
     config = get_config()
     online = config["data_vendors"]["technical_indicators"] != "local"
-    
+
     if not online:
         # Local data path
         try:
-            data = pd.read_csv(
+            # wrap() adds indicator columns in place, so work on a copy
+            data = get_local_prices(
                 os.path.join(
                     config.get("data_cache_dir", "data"),
                     f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
                 )
-            )
-            df = wrap(data)
+            ).frame.copy()
         except FileNotFoundError:
             raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
     else:
-        # Online data fetching with caching
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-        
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-        
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-        
-        data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
-        )
-        
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
-        else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
-            )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
-        
-        df = wrap(data)
-        df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-    
+        # Online data comes from the incrementally-updated OHLCV store;
+        # indicators are causal, so bars after curr_date are not needed
+        data = load_ohlcv(symbol, end_date=curr_date).reset_index()
+
+    df = wrap(data)
+    dates = pd.DatetimeIndex(pd.to_datetime(df["Date"].astype(str).str[:10]))
+    return df, dates
+
+
+def _get_stock_stats_bulk(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "technical indicator to calculate"],
+    curr_date: Annotated[str, "current date for reference"]
+) -> pd.Series:
+    """
+    Optimized bulk calculation of stock stats indicators.
+    Fetches data once and calculates indicator for all available dates
+    (stockstats needs the full history for warm-up).
+    Returns a float Series indexed by a sorted DatetimeIndex of trading dates.
+    """
+    df, dates = _load_stockstats_frame(symbol, curr_date)
+
     # Calculate the indicator for all rows at once
-    df[indicator]  # This triggers stockstats to calculate the indicator
-    
-    # Create a dictionary mapping date strings to indicator values
-    result_dict = {}
-    for _, row in df.iterrows():
-        date_str = row["Date"]
-        indicator_value = row[indicator]
-        
-        # Handle NaN/None values
-        if pd.isna(indicator_value):
-            result_dict[date_str] = "N/A"
-        else:
-            result_dict[date_str] = str(indicator_value)
-    
-    return result_dict
+    values = df[indicator].to_numpy(dtype="float64")
+
+    return pd.Series(values, index=dates).sort_index()
+
+
+def get_stock_stats_indicators_batch(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[list, "technical indicators to compute (list or comma-separated string)"],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    """
+    Compute several stockstats indicators from a single load of the price
+    history and return them as one table (one row per trading day).
+    """
+    indicators = parse_indicator_list(indicators)
+    unsupported = [ind for ind in indicators if ind not in BEST_IND_PARAMS]
+    if unsupported:
+        raise ValueError(
+            f"Indicators {unsupported} are not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
+        )
+
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+
+    df, dates = _load_stockstats_frame(symbol, curr_date)
+    table = pd.DataFrame(
+        {ind: df[ind].to_numpy(dtype="float64") for ind in indicators},
+        index=dates,
+    ).sort_index()
+    table = table.loc[before:curr_date_dt]
+
+    return format_indicator_table(
+        symbol, table, before.strftime("%Y-%m-%d"), curr_date, BEST_IND_PARAMS
+    )
+
+
+def _format_indicator_window(
+    indicator_data: Annotated[pd.Series, "indicator values indexed by trading date"],
+    before: Annotated[datetime, "first calendar day of the window"],
+    curr_date_dt: Annotated[datetime, "last calendar day of the window"],
+) -> str:
+    """Render one line per calendar day, newest first, for the look-back window only."""
+    window = indicator_data.loc[before:curr_date_dt]
+    window = window[~window.index.duplicated(keep="last")]
+
+    formatted = window.astype(str).where(window.notna(), "N/A")
+    calendar = pd.date_range(before, curr_date_dt, freq="D")[::-1]
+    formatted = formatted.reindex(
+        calendar, fill_value="N/A: Not a trading day (weekend or holiday)"
+    )
+
+    lines = calendar.strftime("%Y-%m-%d") + ": " + formatted.to_numpy() + "\n"
+    return "".join(lines)
 
 
 def get_stockstats_indicator(
@@ -293,34 +316,127 @@ def get_stockstats_indicator(
     return str(indicator_value)
 
 
+# statement -> (quarterly attribute, annual attribute, title, description)
+_STATEMENTS = {
+    "balance_sheet": ("quarterly_balance_sheet", "balance_sheet", "Balance Sheet", "balance sheet"),
+    "cashflow": ("quarterly_cashflow", "cashflow", "Cash Flow", "cash flow"),
+    "income_statement": ("quarterly_income_stmt", "income_stmt", "Income Statement", "income statement"),
+}
+
+DEFAULT_STATEMENT_CACHE_CONFIG = {
+    "ttl_seconds": 6 * 3600,  # statements change with filings, not intraday
+    "max_entries": 512,
+}
+
+_statement_cache = None
+_statement_cache_guard = threading.Lock()
+
+
+def _get_statement_cache() -> VendorCallCache:
+    global _statement_cache
+    settings = DEFAULT_STATEMENT_CACHE_CONFIG.copy()
+    settings.update(get_config().get("yfinance_statements", {}))
+    with _statement_cache_guard:
+        if (
+            _statement_cache is None
+            or _statement_cache.ttl_seconds != settings["ttl_seconds"]
+            or _statement_cache.max_entries != settings["max_entries"]
+        ):
+            _statement_cache = VendorCallCache(settings["ttl_seconds"], settings["max_entries"])
+        return _statement_cache
+
+
+def _fetch_statement(ticker_obj, statement: str, freq: str) -> pd.DataFrame:
+    quarterly_attr, annual_attr, _, _ = _STATEMENTS[statement]
+    get_rate_limiter("yfinance").acquire()
+    return getattr(ticker_obj, quarterly_attr if freq.lower() == "quarterly" else annual_attr)
+
+
+def get_statement_bundle(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
+    statements: Annotated[tuple, "statements to include"] = tuple(_STATEMENTS),
+) -> dict:
+    """Balance sheet, cash flow and income statement frames for one ticker.
+
+    Statements already in the TTL cache are reused; the rest are fetched
+    concurrently through a single yf.Ticker. A statement that fails to load
+    maps to its exception instead of a frame and is not cached.
+    """
+    symbol = ticker.upper()
+    cache = _get_statement_cache()
+    bundle = {}
+    missing = []
+    for statement in statements:
+        hit, data = cache.get((symbol, freq.lower(), statement))
+        if hit:
+            bundle[statement] = data
+        else:
+            missing.append(statement)
+
+    if missing:
+        ticker_obj = yf.Ticker(symbol)
+        with ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix="yf-statements") as executor:
+            futures = {
+                statement: executor.submit(_fetch_statement, ticker_obj, statement, freq)
+                for statement in missing
+            }
+        for statement, future in futures.items():
+            if future.exception() is not None:
+                bundle[statement] = future.exception()
+                continue
+            bundle[statement] = future.result()
+            cache.put((symbol, freq.lower(), statement), bundle[statement])
+
+    return {statement: bundle[statement] for statement in statements}
+
+
+def _format_statement(ticker: str, freq: str, statement: str, data) -> str:
+    _, _, title, description = _STATEMENTS[statement]
+    if isinstance(data, Exception):
+        return f"Error retrieving {description} for {ticker}: {str(data)}"
+    if data.empty:
+        return f"No {description} data found for symbol '{ticker}'"
+
+    # Convert to CSV string for consistency with other functions
+    csv_string = data.to_csv()
+
+    # Add header information
+    header = f"# {title} data for {ticker.upper()} ({freq})\n"
+    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+
+    return header + csv_string
+
+
+def _get_single_statement(ticker: str, freq: str, statement: str) -> str:
+    try:
+        data = get_statement_bundle(ticker, freq, statements=(statement,))[statement]
+    except Exception as e:
+        data = e
+    return _format_statement(ticker, freq, statement, data)
+
+
+def get_statement_frame(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    statement: Annotated[str, "balance_sheet, cashflow or income_statement"],
+    freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
+    curr_date: Annotated[str, "only periods ending on or before this date, yyyy-mm-dd"] = None,
+) -> pd.DataFrame:
+    """Typed statement (periods x line items) from the shared statement cache."""
+    data = get_statement_bundle(ticker, freq, statements=(statement,))[statement]
+    if isinstance(data, Exception):
+        raise data
+    frame = to_statement_frame(data.T)
+    return frame.loc[:curr_date] if curr_date else frame
+
+
 def get_balance_sheet(
     ticker: Annotated[str, "ticker symbol of the company"],
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None
 ):
-    """Get balance sheet data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_balance_sheet
-        else:
-            data = ticker_obj.balance_sheet
-            
-        if data.empty:
-            return f"No balance sheet data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Balance Sheet data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        return header + csv_string
-        
-    except Exception as e:
-        return f"Error retrieving balance sheet for {ticker}: {str(e)}"
+    """Get balance sheet data from yfinance (served from the statement cache when available)."""
+    return _get_single_statement(ticker, freq, "balance_sheet")
 
 
 def get_cashflow(
@@ -328,29 +444,8 @@ def get_cashflow(
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None
 ):
-    """Get cash flow data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_cashflow
-        else:
-            data = ticker_obj.cashflow
-            
-        if data.empty:
-            return f"No cash flow data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Cash Flow data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        return header + csv_string
-        
-    except Exception as e:
-        return f"Error retrieving cash flow for {ticker}: {str(e)}"
+    """Get cash flow data from yfinance (served from the statement cache when available)."""
+    return _get_single_statement(ticker, freq, "cashflow")
 
 
 def get_income_statement(
@@ -358,29 +453,8 @@ def get_income_statement(
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None
 ):
-    """Get income statement data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_income_stmt
-        else:
-            data = ticker_obj.income_stmt
-            
-        if data.empty:
-            return f"No income statement data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Income Statement data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        return header + csv_string
-        
-    except Exception as e:
-        return f"Error retrieving income statement for {ticker}: {str(e)}"
+    """Get income statement data from yfinance (served from the statement cache when available)."""
+    return _get_single_statement(ticker, freq, "income_statement")
 
 
 def get_fundamentals(
@@ -389,10 +463,11 @@ def get_fundamentals(
 ):
     """Get comprehensive fundamental data from yfinance by aggregating balance sheet, cash flow, and income statement."""
     try:
-        # Aggregate balance sheet, cash flow, and income statement
-        balance_sheet = get_balance_sheet(ticker, freq="quarterly", curr_date=curr_date)
-        cashflow = get_cashflow(ticker, freq="quarterly", curr_date=curr_date)
-        income_stmt = get_income_statement(ticker, freq="quarterly", curr_date=curr_date)
+        # One Ticker, three statements fetched concurrently; later single-statement calls hit the cache
+        bundle = get_statement_bundle(ticker, freq="quarterly")
+        balance_sheet = _format_statement(ticker, "quarterly", "balance_sheet", bundle["balance_sheet"])
+        cashflow = _format_statement(ticker, "quarterly", "cashflow", bundle["cashflow"])
+        income_stmt = _format_statement(ticker, "quarterly", "income_statement", bundle["income_statement"])
         
         # Combine all fundamental data
         result = f"# Comprehensive Fundamental Data for {ticker.upper()}\n"
@@ -415,6 +490,7 @@ def get_insider_transactions(
 ):
     """Get insider transactions data from yfinance."""
     try:
+        get_rate_limiter("yfinance").acquire()
         ticker_obj = yf.Ticker(ticker.upper())
         data = ticker_obj.insider_transactions
         
@@ -458,6 +534,7 @@ def get_yfinance_news(
         end_dt = end_dt.replace(hour=23, minute=59, second=59)
         
         # Create ticker object
+        get_rate_limiter("yfinance").acquire()
         ticker_obj = yf.Ticker(ticker.upper())
         
         # Get news from Yahoo Finance
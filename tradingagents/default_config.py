@@ -21,7 +21,7 @@ DEFAULT_CONFIG = {
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
         "core_stock_apis": "yfinance",       # Options: yfinance, alpha_vantage, local
-        "technical_indicators": "yfinance",  # Options: yfinance, alpha_vantage, local
+        "technical_indicators": "yfinance",  # Options: yfinance, alpha_vantage, computed (Alpha Vantage formulas, no API calls), local
         "fundamental_data": "alpha_vantage", # Options: openai, alpha_vantage, local
         "news_data": "alpha_vantage",        # Options: yfinance, alpha_vantage, openai, google, local
     },
@@ -32,4 +32,84 @@ DEFAULT_CONFIG = {
         # Use Google News for global news when using yfinance for company news
         "get_global_news": "google",  # Use Google News for global/macro news
     },
+    # Memoization of identical route_to_vendor calls
+    "vendor_cache": {
+        "enabled": True,
+        "ttl_seconds": 3600,
+        "max_entries": 1024,
+        "scope": "run",  # Options: run (cleared at each propagate), process
+    },
+    # Persistent Alpha Vantage response cache (SQLite under data_cache_dir)
+    "alpha_vantage_cache": {
+        "mode": "read_write",  # Options: read_write, cache_only (backtests, no API calls), off
+        "ttl_overrides": {},   # Per-function TTL in seconds, e.g. {"NEWS_SENTIMENT": 300}
+    },
+    # In-process cache of yfinance statement frames shared by get_fundamentals and the statement tools
+    "yfinance_statements": {
+        "ttl_seconds": 6 * 3600,
+        "max_entries": 512,
+    },
+    # Proactive per-vendor request budgets (see dataflows/rate_limiter.py). Every
+    # vendor call takes a token first: requests_per_minute refills the bucket,
+    # burst is its size, and requests_per_day (None: no cap) makes further calls
+    # fail over to the next vendor once spent. Alpha Vantage defaults to the free
+    # tier (5/min, 25/day); raise both for a premium key. Vendors not listed
+    # here are not limited.
+    "rate_limits": {
+        "alpha_vantage": {"requests_per_minute": 5, "requests_per_day": 25, "burst": 1},
+        "google": {"requests_per_minute": 15, "requests_per_day": None, "burst": 1},
+        "yfinance": {"requests_per_minute": 120, "requests_per_day": None, "burst": 10},
+        "openai": {"requests_per_minute": 60, "requests_per_day": None, "burst": 10},
+    },
+    # Google News scraping: on-disk result cache and page concurrency
+    "google_news": {
+        "cache_ttl_seconds": 6 * 3600,  # 0 disables the cache
+        "page_concurrency": 3,          # Pages requested per wave (still spaced by rate_limits["google"])
+        "host_concurrency": 2,          # Simultaneous connections to google.com across all callers
+        "max_pages": None,              # None paginates until the results run out
+    },
+    # Local vendor price CSVs parsed once per process (LRU, bounded by total frame size)
+    "local_price_cache": {
+        "max_bytes": 256 * 1024 * 1024,
+    },
+    # Market index regressed against for beta, benchmark correlation and residual volatility
+    "benchmark_symbol": "SPY",
+    # Per-symbol alpha factor time series (Parquet/CSV under data_cache_dir/factors) for backtests
+    "factor_cache": {
+        "enabled": True,
+    },
+    # Optional JSON file {"TICKER": "Name OR Alias"} extending the Reddit company-mention table
+    "company_mentions_file": None,
+    # Concurrent fan-out when a method resolves to several vendor implementations
+    "vendor_routing": {
+        "concurrent": True,
+        "max_workers": 8,
+        "deadline_seconds": 120,  # Slower implementations are dropped from the result
+        # Per-method deadlines (seconds or None); unlike deadline_seconds these
+        # also bound a method served by a single implementation
+        "method_deadline_seconds": {},
+    },
+    # Hedged fallback: start the next vendor when the primary is slower than usual
+    "vendor_hedging": {
+        "enabled": False,
+        "percentile": 95,             # Hedge delay = this latency percentile of the vendor
+        "min_samples": 20,
+        "default_delay_seconds": 5.0, # Used until min_samples latencies are recorded
+        "min_delay_seconds": 0.5,
+        "max_delay_seconds": 30.0,
+    },
+    # Per (vendor, method) circuit breakers; open vendors are skipped in the fallback order
+    "vendor_health": {
+        "enabled": True,
+        "window_size": 20,
+        "min_calls": 5,
+        "failure_rate_threshold": 0.5,
+        "consecutive_failures": 3,
+        "cooldown_seconds": 60,       # Doubles on each re-open, up to max_cooldown_seconds
+        "max_cooldown_seconds": 900,
+    },
+    # In-process router counters/histograms (see dataflows/metrics.py for JSON/Prometheus dumps)
+    "router_metrics": {
+        "enabled": True,
+    },
 }
@@ -31,11 +31,18 @@ from tradingagents.agents.utils.agent_states import (
     RiskDebateState,
 )
 from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.vendor_cache import (
+    get_vendor_cache_config,
+    reset_vendor_cache,
+    vendor_cache_stats,
+)
+from tradingagents.dataflows.vendor_health import vendor_health_snapshot
 
 # Import the new abstract tool methods from agent_utils
 from tradingagents.agents.utils.agent_utils import (
     get_stock_data,
     get_indicators,
+    get_indicators_batch,
     get_fundamentals,
     get_balance_sheet,
     get_cashflow,
@@ -44,7 +51,8 @@ from tradingagents.agents.utils.agent_utils import (
     get_insider_sentiment,
     get_insider_transactions,
     get_global_news,
-    get_alpha_factors
+    get_alpha_factors,
+    screen_alpha_factors
 )
 
 from .conditional_logic import ConditionalLogic
@@ -147,6 +155,8 @@ class TradingAgentsGraph:
         self.curr_state = None
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
+        self.vendor_cache_stats = {}  # hit/miss counters of the last run
+        self.vendor_health = []  # circuit-breaker state per (vendor, method) after the last run
 
         # Set up the graph
         self.graph = self.graph_setup.setup_graph(selected_analysts)
@@ -160,6 +170,7 @@ class TradingAgentsGraph:
                     get_stock_data,
                     # Technical indicators
                     get_indicators,
+                    get_indicators_batch,
                 ]
             ),
             "social": ToolNode(
@@ -188,8 +199,9 @@ class TradingAgentsGraph:
             ),
             "alpha_factors": ToolNode(
                 [
-                    # Alpha factors calculation tool
+                    # Alpha factors calculation tools
                     get_alpha_factors,
+                    screen_alpha_factors,
                 ]
             ),
         }
@@ -199,6 +211,10 @@ class TradingAgentsGraph:
 
         self.ticker = company_name
 
+        # Start each run with an empty vendor cache unless it is process-scoped
+        if get_vendor_cache_config()["scope"] == "run":
+            reset_vendor_cache()
+
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
@@ -222,6 +238,8 @@ class TradingAgentsGraph:
 
         # Store current state for reflection
         self.curr_state = final_state
+        self.vendor_cache_stats = vendor_cache_stats()
+        self.vendor_health = vendor_health_snapshot()
 
         # Log state
         self._log_state(trade_date, final_state)
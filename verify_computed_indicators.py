@@ -0,0 +1,155 @@
+"""
+Check the "computed" indicator vendor against Alpha Vantage.
+
+For each symbol, the Alpha Vantage daily series and one response per
+indicator endpoint are saved as reference fixtures (CSV, one directory per
+symbol, under tests/fixtures/alpha_vantage by default). The local formulas
+are then run on that same daily series, so any difference comes from the
+formulas and not from the price source. Values are compared after a
+warm-up period, because the recursive averages (EMA, MACD, RSI, ATR)
+depend on where the history starts.
+
+The bars come from the free TIME_SERIES_DAILY endpoint. A saved
+TIME_SERIES_DAILY_ADJUSTED.csv (premium) is used instead when present.
+
+Missing fixtures are fetched with ALPHA_VANTAGE_API_KEY through the usual
+request path (rate limiter and response cache); with offline=True a missing
+fixture is an error instead. tests/test_computed_indicators.py runs the
+offline check for every committed symbol. The committed SYNTH directory is
+not a vendor capture: its values come from the independent loop
+implementations in tests/fixtures/alpha_vantage/generate_synthetic.py, so it
+checks computed_indicators against a second implementation of the same
+definitions. Vendor parity needs captured responses for real symbols:
+
+    python verify_computed_indicators.py SYNTH
+    python verify_computed_indicators.py AAPL MSFT --refresh
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.alpha_vantage_common import _make_api_request
+from tradingagents.dataflows.alpha_vantage_indicator import (
+    INDICATOR_COLUMNS,
+    SUPPORTED_INDICATORS,
+    _indicator_request,
+)
+from tradingagents.dataflows.computed_indicators import compute_indicator_frame
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "fixtures", "alpha_vantage")
+
+# VWMA has no Alpha Vantage endpoint
+INDICATORS = [ind for ind in SUPPORTED_INDICATORS if ind in INDICATOR_COLUMNS]
+TIME_PERIOD = 14
+WARMUP_BARS = 250
+# Alpha Vantage rounds to 4 decimals
+ABS_TOLERANCE = 1e-3
+REL_TOLERANCE = 1e-4
+
+
+def fixture_name(function_name, params):
+    period = params.get("time_period")
+    return f"{function_name}_{period}.csv" if period else f"{function_name}.csv"
+
+
+def load_or_fetch(path, function_name, params, refresh, offline=False):
+    if offline and not os.path.exists(path):
+        raise FileNotFoundError(f"missing reference fixture {path}")
+    if refresh or not os.path.exists(path):
+        data = _make_api_request(function_name, params)
+        if not isinstance(data, str) or not data.lstrip().startswith(("time", "timestamp")):
+            raise RuntimeError(f"{function_name}: unexpected response {str(data)[:200]!r}")
+        with open(path, "w") as f:
+            f.write(data)
+    return pd.read_csv(path)
+
+
+def load_bars(symbol, directory, refresh, offline=False):
+    """Alpha Vantage daily bars (split/dividend-adjusted when the adjusted series was saved)."""
+    adjusted_path = os.path.join(directory, "TIME_SERIES_DAILY_ADJUSTED.csv")
+    if os.path.exists(adjusted_path) and not refresh:
+        raw = pd.read_csv(adjusted_path)
+    else:
+        raw = load_or_fetch(
+            os.path.join(directory, "TIME_SERIES_DAILY.csv"),
+            "TIME_SERIES_DAILY",
+            {"symbol": symbol, "outputsize": "full", "datatype": "csv"},
+            refresh,
+            offline,
+        )
+    raw = raw.set_index(pd.to_datetime(raw["timestamp"])).sort_index()
+    close = raw["adjusted_close"] if "adjusted_close" in raw.columns else raw["close"]
+    factor = close / raw["close"]
+    return pd.DataFrame(
+        {
+            "Open": raw["open"] * factor,
+            "High": raw["high"] * factor,
+            "Low": raw["low"] * factor,
+            "Close": close,
+            "Volume": raw["volume"].astype(float),
+        }
+    )
+
+
+def verify_symbol(symbol, fixtures_dir=DEFAULT_FIXTURES, refresh=False, offline=False):
+    """Compare every indicator with the reference; returns the number that are out of tolerance.
+
+    offline=True only reads saved fixtures and raises FileNotFoundError for a missing one.
+    """
+    directory = os.path.join(fixtures_dir, symbol)
+    if not offline:
+        os.makedirs(directory, exist_ok=True)
+
+    bars = load_bars(symbol, directory, refresh and not offline, offline)
+    computed = compute_indicator_frame(bars, INDICATORS, TIME_PERIOD)
+    compare_from = bars.index[min(WARMUP_BARS, len(bars) - 1)]
+
+    failures = 0
+    for indicator in INDICATORS:
+        function_name, params = _indicator_request(indicator, "daily", TIME_PERIOD, "close")
+        params = {"symbol": symbol, **params}
+        reference = load_or_fetch(
+            os.path.join(directory, fixture_name(function_name, params)),
+            function_name,
+            params,
+            refresh and not offline,
+            offline,
+        )
+        reference = reference.set_index(pd.to_datetime(reference["time"])).sort_index()
+        expected = pd.to_numeric(reference[INDICATOR_COLUMNS[indicator]], errors="coerce")
+
+        joined = pd.concat([expected.rename("av"), computed[indicator].rename("local")], axis=1, join="inner")
+        joined = joined.loc[compare_from:].dropna()
+        if joined.empty:
+            print(f"{symbol:<6} {indicator:<14} no overlapping values")
+            failures += 1
+            continue
+
+        abs_error = (joined["av"] - joined["local"]).abs()
+        allowed = np.maximum(ABS_TOLERANCE, REL_TOLERANCE * joined["av"].abs())
+        bad = int((abs_error > allowed).sum())
+        failures += bad > 0
+        print(
+            f"{symbol:<6} {indicator:<14} rows={len(joined):>5} "
+            f"max_abs={abs_error.max():.6f} mismatches={bad} {'FAIL' if bad else 'ok'}"
+        )
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("symbols", nargs="+")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="directory of reference responses")
+    parser.add_argument("--refresh", action="store_true", help="re-download the reference responses")
+    args = parser.parse_args()
+
+    failures = sum(verify_symbol(symbol.upper(), args.fixtures, args.refresh) for symbol in args.symbols)
+    print("all indicators match" if not failures else f"{failures} indicator(s) out of tolerance")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()